@@ -1,132 +1,349 @@
 import os
 import json
+import asyncio
+import inspect
 import threading
 from typing import List, Dict, Any, Callable, Optional
 from queue import Queue
-import openai
 from dotenv import load_dotenv
 from agentic_framework import (
     web_search, calculator, summarize, get_time, get_date, extract_entities, translate,
-    wikipedia_search, code_executor, sentiment_analysis, url_reader, function_schemas, tool_funcs
+    wikipedia_search, code_executor, sentiment_analysis, url_reader, function_schemas, tool_funcs,
+    tool_definitions, assistant_tool_message, achat_completion, aprefetch_tool, commit_tool_result, arun_tool_calls,
+    token_emitter, make_context_manager, semantic_memory, memory_notes, remember_answer, GOAL_DEADLINE, OUT_OF_TIME
 )
+from agentic_core.deadline import DeadlineExceeded, current_deadline, deadline_scope
+from agentic_core.tracing import traced, current_span, PIPELINE, AGENT
+from agentic_core.events import emit, iter_events, FINAL, HANDOFF
+from agentic_core.dag import arun_dag, descendants, sinks, BackEdge
+from agentic_core.routing import linear_dag
+from agentic_core.messaging import MessageBus
+from agentic_core.workspace import ShardedWorkspace
+from agentic_core.speculation import Speculator, joining_prefetches
+from agentic_core.tool import ToolRegistry
+from agentic_core.runtime import run_sync
 
 load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+
+# Opt-in: warm up and prefetch for the next agent while the current one runs
+SPECULATION = os.getenv("AGENTIC_SPECULATION", "off").lower() in ("1", "on", "true", "yes")
 
 # --- Shared Memory/Workspace ---
-class Workspace:
-    def __init__(self):
-        self.memory: Dict[str, Any] = {}
-        self.lock = threading.Lock()
-    def get(self, key, default=None):
-        with self.lock:
-            return self.memory.get(key, default)
-    def set(self, key, value):
-        with self.lock:
-            self.memory[key] = value
-    def append(self, key, value):
-        with self.lock:
-            self.memory.setdefault(key, []).append(value)
-    def all(self):
-        with self.lock:
-            return dict(self.memory)
+Workspace = ShardedWorkspace
 
 # --- Agent Definition ---
 class Agent:
-    def __init__(self, name: str, system_prompt: str, toolset: Optional[List[str]] = None, model: str = "gpt-3.5-turbo-1106"):
+    def __init__(self, name: str, system_prompt: str, toolset: Optional[List[str]] = None, model: str = "gpt-3.5-turbo-1106",
+                 max_context_tokens: Optional[int] = None, memory=None):
         self.name = name
         self.system_prompt = system_prompt
         self.toolset = toolset or list(tool_funcs.keys())
         self.model = model
-        self.memory: List[Dict[str, Any]] = []
+        self.context = make_context_manager(max_context_tokens)
+        # Long-term SemanticMemory; relevant items are added to the system prompt
+        self.memory = semantic_memory if memory is None else memory
         self.workspace: Optional[Workspace] = None
+        self.bus: Optional[MessageBus] = None
         self.next_agent: Optional[str] = None  # For dynamic routing
     def available_functions(self):
-        return [f for f in function_schemas if f["name"] in self.toolset]
+        return tool_definitions(self.toolset)
     def set_workspace(self, ws: Workspace):
         self.workspace = ws
-    def send_message(self, to_agent: str, content: str):
-        if self.workspace:
-            self.workspace.append(f"msg_{to_agent}", {"from": self.name, "content": content})
+    def set_bus(self, bus: MessageBus):
+        self.bus = bus
+    def send_message(self, to_agent: str, content: str, timeout: Optional[float] = None) -> bool:
+        # Blocks while the recipient's mailbox is full; False if it stays full past `timeout`
+        if self.bus:
+            return self.bus.send(to_agent, {"from": self.name, "content": content}, timeout)
+        return False
+    async def asend_message(self, to_agent: str, content: str, timeout: Optional[float] = None) -> bool:
+        # send_message() for code on the event loop: waits for room without blocking the loop
+        if self.bus:
+            return await self.bus.asend(to_agent, {"from": self.name, "content": content}, timeout)
+        return False
     def receive_messages(self) -> List[Dict[str, Any]]:
-        if self.workspace:
-            msgs = self.workspace.get(f"msg_{self.name}", [])
-            self.workspace.memory[f"msg_{self.name}"] = []  # Clear after reading
-            return msgs
+        if self.bus:
+            return self.bus.drain(self.name)
         return []
-    def act(self, input_msg: str, max_iters: int = 5, verbose: bool = True) -> (str, List[str]):
-        messages = [{"role": "system", "content": self.system_prompt}, {"role": "user", "content": input_msg}]
+    @traced(AGENT, lambda self, *args, **kwargs: f"agent {self.name}")
+    async def aact(self, input_msg: str, max_iters: int = 5, verbose: bool = True, on_event=None,
+                   on_token=None) -> (str, List[str]):
+        # on_token additionally receives the streamed text (e.g. a Speculator's feed)
+        stream = _tee(token_emitter(on_event, self.name), on_token)
+        messages = [{"role": "system", "content": memory_notes(self.memory, self.system_prompt, input_msg)},
+                    {"role": "user", "content": input_msg}]
         reasoning_steps = []
         for i in range(max_iters):
-            # Add received messages to context
+            # Add messages delivered since the last round to context (non-blocking; free when none arrived)
             for msg in self.receive_messages():
                 messages.append({"role": "user", "content": f"[Message from {msg['from']}]: {msg['content']}"})
-            response = openai.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                functions=self.available_functions(),
-                function_call="auto"
-            )
+            messages = self.context.compact(messages)
+            try:
+                response = await achat_completion(
+                    model=self.model,
+                    messages=messages,
+                    tools=self.available_functions(),
+                    tool_choice="auto",
+                    on_token=stream
+                )
+            except DeadlineExceeded:
+                return OUT_OF_TIME, reasoning_steps
             msg = response.choices[0].message
             step_info = f"**{self.name} Step {i+1}:**\n"
-            if msg.function_call:
-                fn_name = msg.function_call.name
-                fn_args = json.loads(msg.function_call.arguments)
-                step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
-                result = tool_funcs[fn_name](**fn_args)
-                step_info += f"Tool output: {result}\n"
-                messages.append({"role": "function", "name": fn_name, "content": str(result)})
+            if msg.tool_calls:
+                messages.append(assistant_tool_message(msg))
+                results = await arun_tool_calls(msg.tool_calls, on_event=on_event, agent=self.name)
+                for call, (fn_name, fn_args, result) in zip(msg.tool_calls, results):
+                    step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
+                    step_info += f"Tool output: {result}\n"
+                    messages.append({"role": "tool", "tool_call_id": call.id, "content": str(result)})
                 # Optionally, store result in workspace
                 if self.workspace:
                     self.workspace.set(f"{self.name}_last_tool_result", result)
             else:
                 step_info += f"Agent produced final answer."
                 reasoning_steps.append(step_info)
+                emit(on_event, FINAL, agent=self.name, content=msg.content)
                 return msg.content, reasoning_steps
             reasoning_steps.append(step_info)
         return "[Agent did not complete the goal in time.]", reasoning_steps
+    def act(self, input_msg: str, max_iters: int = 5, verbose: bool = True, on_event=None,
+            on_token=None) -> (str, List[str]):
+        # Blocking wrapper for callers that are not running an event loop
+        return run_sync(self.aact(input_msg, max_iters=max_iters, verbose=verbose, on_event=on_event,
+                                     on_token=on_token))
+
+class AsyncAgent(Agent):
+    """Agent whose act() and send_message() are coroutines, so many can share one event loop."""
+    async def send_message(self, to_agent: str, content: str, timeout: Optional[float] = None) -> bool:
+        return await self.asend_message(to_agent, content, timeout)
+    async def act(self, input_msg: str, max_iters: int = 5, verbose: bool = True, on_event=None,
+                  on_token=None) -> (str, List[str]):
+        return await self.aact(input_msg, max_iters=max_iters, verbose=verbose, on_event=on_event,
+                               on_token=on_token)
+
+def _tee(*callbacks):
+    callbacks = [c for c in callbacks if c is not None]
+    if len(callbacks) <= 1:
+        return callbacks[0] if callbacks else None
+    def call_all(text):
+        for callback in callbacks:
+            callback(text)
+    return call_all
+
+async def _maybe_await(value):
+    return await value if inspect.isawaitable(value) else value
+
+def _out_of_time() -> bool:
+    deadline = current_deadline()
+    return deadline is not None and deadline.expired
 
 # --- Dynamic Routing & Critic Loops ---
-def advanced_pipeline(goal: str, agent_configs: List[Dict[str, Any]],
-                     routing_fn: Optional[Callable[[str, str, Workspace], str]] = None,
-                     max_iters: int = 5, verbose: bool = True, parallel: bool = False,
-                     human_callback: Optional[Callable[[str, str], bool]] = None):
-    workspace = Workspace()
-    agents = {cfg["name"]: Agent(**cfg) for cfg in agent_configs}
+@traced(PIPELINE, "advanced_pipeline")
+async def async_advanced_pipeline(goal: str, agent_configs: List[Dict[str, Any]],
+                                  routing_fn: Optional[Callable[[str, str, Workspace], str]] = None,
+                                  max_iters: int = 5, verbose: bool = True, parallel: bool = False,
+                                  human_callback: Optional[Callable[[str, str], bool]] = None,
+                                  on_event=None, workspace: Optional[Workspace] = None,
+                                  deadline: Optional[float] = None, speculative: Optional[bool] = None):
+    """Run the routed pipeline on the current event loop.
+
+    routing_fn and human_callback may be plain functions or coroutines;
+    on_event receives streaming events (see agentic_core.events). Pass a
+    persistent `workspace` (agentic_core.workspace.persistent_workspace) to
+    keep the shared state on disk. `deadline` is seconds for the whole goal
+    (AGENTIC_GOAL_DEADLINE by default); every agent, tool and LLM call runs
+    within what is left of it.
+
+    With `speculative` (AGENTIC_SPECULATION by default) the agent after the
+    current one in `agent_configs` is warmed up while the current one runs,
+    and lookups of entities in its streaming answer are prefetched (see
+    agentic_core.speculation); the lookups are only cached once routing
+    confirms the prediction, and are cancelled and discarded otherwise.
+    Hits and misses are counted on the pipeline's trace span.
+    """
+    current_span().set(goal=goal[:200])
+    with deadline_scope(GOAL_DEADLINE if deadline is None else deadline):
+        return await _routed_pipeline(goal, agent_configs, routing_fn, max_iters, verbose, human_callback,
+                                      on_event, workspace, SPECULATION if speculative is None else speculative)
+
+def _successor(agent_configs, name: str) -> Optional[str]:
+    names = [cfg["name"] for cfg in agent_configs]
+    idx = names.index(name)
+    return names[idx + 1] if idx + 1 < len(names) else None
+
+def _warm_toolset(toolset):
+    # Build the schema payload and import lazily loaded tools before the agent's first call
+    tool_definitions(toolset)
+    for name in toolset:
+        ToolRegistry.get(name).func
+
+def _speculate(agents, agent_configs, current_agent: str) -> Optional[Speculator]:
+    predicted = _successor(agent_configs, current_agent)
+    if predicted is None:
+        return None
+    toolset = agents[predicted].toolset
+    return Speculator(predicted, toolset, aprefetch_tool, warm=lambda: _warm_toolset(toolset),
+                      commit=commit_tool_result)
+
+async def _routed_pipeline(goal, agent_configs, routing_fn, max_iters, verbose, human_callback, on_event, workspace,
+                           speculative=False):
+    workspace = workspace if workspace is not None else Workspace()
+    bus = MessageBus()
+    agents = {cfg["name"]: AsyncAgent(**cfg) for cfg in agent_configs}
     for agent in agents.values():
         agent.set_workspace(workspace)
+        agent.set_bus(bus)
     steps = []
     current_agent = agent_configs[0]["name"]
     input_msg = goal
-    while True:
-        agent = agents[current_agent]
-        answer, agent_steps = agent.act(input_msg, max_iters=max_iters, verbose=verbose)
-        steps.extend(agent_steps)
-        # Human-in-the-loop: user can approve/modify/stop
-        if human_callback and not human_callback(current_agent, answer):
-            steps.append(f"**{current_agent}:** Human stopped or modified output.")
-            break
-        # Critic/review loop: if agent is a reviewer, can send back for revision
-        if "review" in agent.name.lower() and "needs revision" in answer.lower():
-            steps.append(f"**{current_agent}:** Sent back for revision.")
-            current_agent = agent_configs[1]["name"]  # Send back to writer, for example
-            input_msg = workspace.get(f"{current_agent}_last_tool_result", answer)
-            continue
-        # Dynamic routing: routing_fn decides next agent
-        if routing_fn:
-            next_agent = routing_fn(current_agent, answer, workspace)
-            if next_agent is None:
+    pipeline_span = current_span()
+    speculator, speculators = None, []
+    try:
+        while True:
+            agent = agents[current_agent]
+            confirmed = None
+            if speculator is not None:
+                confirmed = speculator if speculator.resolve(current_agent) else None
+                pipeline_span.incr("speculation_hits" if confirmed else "speculation_misses")
+            speculator = _speculate(agents, agent_configs, current_agent) if speculative else None
+            if speculator is not None:
+                speculators.append(speculator)
+            with joining_prefetches(confirmed):
+                answer, agent_steps = await agent.act(input_msg, max_iters=max_iters, verbose=verbose,
+                                                      on_event=on_event, on_token=speculator.feed if speculator else None)
+            steps.extend(agent_steps)
+            if _out_of_time():
+                steps.append(f"**{current_agent}:** Goal deadline reached.")
                 break
-            current_agent = next_agent
-            input_msg = answer
-        else:
-            idx = [cfg["name"] for cfg in agent_configs].index(current_agent)
-            if idx + 1 >= len(agent_configs):
+            # Human-in-the-loop: user can approve/modify/stop
+            if human_callback and not await _maybe_await(human_callback(current_agent, answer)):
+                steps.append(f"**{current_agent}:** Human stopped or modified output.")
                 break
-            current_agent = agent_configs[idx + 1]["name"]
-            input_msg = answer
+            # Critic/review loop: if agent is a reviewer, can send back for revision
+            if "review" in agent.name.lower() and "needs revision" in answer.lower():
+                steps.append(f"**{current_agent}:** Sent back for revision.")
+                current_agent = agent_configs[1]["name"]  # Send back to writer, for example
+                input_msg = workspace.get(f"{current_agent}_last_tool_result", answer)
+                emit(on_event, HANDOFF, from_agent=agent.name, to_agent=current_agent, content=input_msg)
+                continue
+            # Dynamic routing: routing_fn decides next agent
+            if routing_fn:
+                next_agent = await _maybe_await(routing_fn(current_agent, answer, workspace))
+                if next_agent is None:
+                    break
+                current_agent = next_agent
+                input_msg = answer
+            else:
+                next_agent = _successor(agent_configs, current_agent)
+                if next_agent is None:
+                    break
+                current_agent = next_agent
+                input_msg = answer
+            emit(on_event, HANDOFF, from_agent=agent.name, to_agent=current_agent, content=input_msg)
+        if speculator is not None:  # stopped before the predicted agent ran
+            pipeline_span.incr("speculation_misses")
+    finally:
+        # Nothing speculative outlives the pipeline, whether or not it was used
+        for pending in speculators:
+            pending.cancel()
+    remember_answer(goal, answer)
+    return answer, steps, workspace.all()
+
+def advanced_pipeline(goal: str, agent_configs: List[Dict[str, Any]],
+                     routing_fn: Optional[Callable[[str, str, Workspace], str]] = None,
+                     max_iters: int = 5, verbose: bool = True, parallel: bool = False,
+                     human_callback: Optional[Callable[[str, str], bool]] = None,
+                     on_event=None, workspace: Optional[Workspace] = None, deadline: Optional[float] = None,
+                     speculative: Optional[bool] = None):
+    return run_sync(async_advanced_pipeline(
+        goal, agent_configs, routing_fn=routing_fn, max_iters=max_iters, verbose=verbose,
+        parallel=parallel, human_callback=human_callback, on_event=on_event, workspace=workspace,
+        deadline=deadline, speculative=speculative
+    ))
+
+def stream_advanced_pipeline(goal: str, agent_configs: List[Dict[str, Any]], **kwargs):
+    """Generator of events for advanced_pipeline(); the last event is DONE
+    with result=(final_answer, steps, workspace)."""
+    return iter_events(lambda on_event: advanced_pipeline(goal, agent_configs, on_event=on_event, **kwargs))
+
+# --- DAG Pipelines (parallel branches, fan-in, bounded critic loops) ---
+@traced(PIPELINE, "dag_pipeline")
+async def async_dag_pipeline(goal: str, agent_configs: List[Dict[str, Any]], max_iters: int = 5,
+                             verbose: bool = True, max_concurrency: Optional[int] = None, on_event=None,
+                             workspace: Optional[Workspace] = None, deadline: Optional[float] = None):
+    """Run agents as a DAG instead of a chain.
+
+    Besides the usual Agent fields, each config may declare:
+      "inputs": names of agents whose answers it consumes (roots get only the goal)
+      "revise": {"target": "Writer", "max_rounds": 2, "keyword": "needs revision"}
+                a critic loop that re-runs `target` and everything after it
+                while this agent's answer contains `keyword`
+    Every agent whose inputs are ready runs concurrently. Without any "inputs"
+    the configs form a linear chain in list order.
+
+    When `workspace` already holds a run of the same goal (e.g. a persistent
+    workspace reopened after a crash), agents whose output was saved are not
+    re-run. `deadline` bounds the whole goal as in async_advanced_pipeline().
+    """
+    current_span().set(goal=goal[:200])
+    with deadline_scope(GOAL_DEADLINE if deadline is None else deadline):
+        return await _dag_pipeline(goal, agent_configs, max_iters, verbose, max_concurrency, on_event, workspace)
+
+async def _dag_pipeline(goal, agent_configs, max_iters, verbose, max_concurrency, on_event, workspace):
+    workspace = workspace if workspace is not None else Workspace()
+    resuming = workspace.get("goal") == goal
+    workspace.set("goal", goal)
+    bus = MessageBus()
+    agents, deps, back_edges = {}, {}, {}
+    declared = any("inputs" in cfg for cfg in agent_configs)
+    chain = linear_dag([cfg["name"] for cfg in agent_configs])
+    for cfg in agent_configs:
+        cfg = dict(cfg)
+        name = cfg["name"]
+        deps[name] = cfg.pop("inputs", []) if declared else chain[name]
+        revise = cfg.pop("revise", None)
+        if revise:
+            keyword = revise.get("keyword", "needs revision").lower()
+            back_edges[name] = BackEdge(revise["target"], lambda out, kw=keyword: kw in (out or "").lower(),
+                                        max_rounds=revise.get("max_rounds", 2))
+        agents[name] = AsyncAgent(**cfg)
+        agents[name].set_workspace(workspace)
+        agents[name].set_bus(bus)
+    steps = []
+    async def run_node(name: str, inputs: Dict[str, Any], feedback: Optional[str]):
+        if feedback is not None:
+            # A critic sent this node back: what was saved after it is stale, in this run and on a later resume
+            for node in descendants(deps, name):
+                workspace.delete(f"{node}_output")
+        saved = workspace.get(f"{name}_output") if resuming and feedback is None else None
+        if saved is not None:
+            steps.append(f"**{name}:** Restored saved output.")
+            return saved
+        parts = [goal] + [f"### Output from {dep}:\n{output}" for dep, output in inputs.items()]
+        if feedback:
+            parts.append(f"### Reviewer feedback on your previous draft:\n{feedback}")
+        for dep, output in inputs.items():
+            emit(on_event, HANDOFF, from_agent=dep, to_agent=name, content=output)
+        answer, agent_steps = await agents[name].act("\n\n".join(parts), max_iters=max_iters,
+                                                     verbose=verbose, on_event=on_event)
+        steps.extend(agent_steps)
+        if not _out_of_time():  # a run cut short by the deadline is redone on resume
+            workspace.set(f"{name}_output", answer)
+        return answer
+    outputs = await arun_dag(deps, run_node, back_edges=back_edges, max_concurrency=max_concurrency)
+    final = [outputs[name] for name in sinks(deps)]
+    answer = final[0] if len(final) == 1 else "\n\n".join(f"### {n}\n{outputs[n]}" for n in sinks(deps))
+    remember_answer(goal, answer)
     return answer, steps, workspace.all()
 
+def dag_pipeline(goal: str, agent_configs: List[Dict[str, Any]], max_iters: int = 5, verbose: bool = True,
+                 max_concurrency: Optional[int] = None, on_event=None, workspace: Optional[Workspace] = None,
+                 deadline: Optional[float] = None):
+    return run_sync(async_dag_pipeline(goal, agent_configs, max_iters=max_iters, verbose=verbose,
+                                          max_concurrency=max_concurrency, on_event=on_event, workspace=workspace,
+                                          deadline=deadline))
+
 # --- Example Usage ---
 if __name__ == "__main__":
     agent_configs = [
@@ -0,0 +1,64 @@
+import argparse
+import json
+from typing import Any, Callable, Dict, List
+from agentic_core.batch import read_jsonl, run_batch
+
+# --- DEFAULT PIPELINE ---
+DEFAULT_AGENT_CONFIGS = [
+    {
+        "name": "Researcher",
+        "system_prompt": "You are a research agent. Use web search, Wikipedia, and summarization to gather and condense information for the topic provided.",
+        "toolset": ["web_search", "wikipedia_search", "summarize"]
+    },
+    {
+        "name": "Writer",
+        "system_prompt": "You are a blog writer. Use summarization, translation, and entity extraction to write a clear, engaging article from the research notes provided.",
+        "toolset": ["summarize", "translate", "extract_entities"]
+    },
+    {
+        "name": "Reviewer",
+        "system_prompt": "You are a critical reviewer. Use sentiment analysis and summarization to review and improve the article provided.",
+        "toolset": ["summarize", "sentiment_analysis"]
+    }
+]
+
+PIPELINES = ("agent", "multiagent", "advanced")
+
+def make_handler(pipeline: str, agent_configs: List[Dict[str, Any]], max_iters: int) -> Callable[[str], str]:
+    """Return goal -> final answer for the chosen pipeline (imported lazily)."""
+    if pipeline == "agent":
+        from agentic_framework import agentic_function_calling_agent
+        return lambda goal: agentic_function_calling_agent(goal, max_iters=max_iters, verbose=False)[0]
+    if pipeline == "multiagent":
+        from agentic_multiagent_framework import multiagent_pipeline
+        return lambda goal: multiagent_pipeline(goal, agent_configs, max_iters=max_iters, verbose=False)[0]
+    if pipeline == "advanced":
+        from agentic_advanced_framework import advanced_pipeline
+        return lambda goal: advanced_pipeline(goal, agent_configs, max_iters=max_iters, verbose=False)[0]
+    raise ValueError(f"Unknown pipeline: {pipeline}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run goals from a JSONL file through an agent pipeline.")
+    parser.add_argument("input", help="JSONL file; each line has an id/request_id and a goal (or title/body)")
+    parser.add_argument("output", help="JSONL file results are appended to")
+    parser.add_argument("--pipeline", choices=PIPELINES, default="agent")
+    parser.add_argument("--agents", help="JSON file with agent_configs for the multiagent/advanced pipelines")
+    parser.add_argument("--concurrency", type=int, default=4, help="Goals in flight at once")
+    parser.add_argument("--max-iters", type=int, default=5)
+    parser.add_argument("--no-resume", action="store_true", help="Re-run ids already completed in the output file")
+    args = parser.parse_args(argv)
+
+    agent_configs = DEFAULT_AGENT_CONFIGS
+    if args.agents:
+        with open(args.agents, encoding="utf-8") as f:
+            agent_configs = json.load(f)
+    handler = make_handler(args.pipeline, agent_configs, args.max_iters)
+    counts = run_batch(
+        read_jsonl(args.input), handler, args.output,
+        concurrency=args.concurrency, resume=not args.no_resume,
+        on_result=lambda r: print(f"[{r['status']}] {r['id']} ({r['elapsed']}s)", flush=True)
+    )
+    print(f"\n--- Batch complete: {counts['ok']} ok, {counts['error']} failed, {counts['skipped']} skipped ---")
+
+if __name__ == "__main__":
+    main()
@@ -5,17 +5,24 @@ from typing import List, Dict, Any, Optional, Callable
 from .tool import ToolRegistry
 from .memory import Memory
 from .messaging import Messaging
+from .semantic_memory import SemanticMemory
 
 class Agent:
-    def __init__(self, name: str, system_prompt: str, toolset: Optional[List[str]] = None, model: str = "gpt-3.5-turbo-1106"):
+    def __init__(self, name: str, system_prompt: str, toolset: Optional[List[str]] = None, model: str = "gpt-3.5-turbo-1106",
+                 semantic_memory: Optional[SemanticMemory] = None):
         self.name = name
         self.system_prompt = system_prompt
         self.toolset = toolset or []
         self.model = model
         self.memory = Memory()
         self.messaging = Messaging(self.name)
+        self.semantic_memory = semantic_memory
     def available_tools(self):
+        ToolRegistry.discover()
         return ToolRegistry.get_tools(self.toolset)
+    def recall(self, query: str, k: int = 3):
+        """Top-k (score, item) pairs from long-term semantic memory."""
+        return self.semantic_memory.search(query, k=k) if self.semantic_memory is not None else []
     def act(self, input_msg: str, max_iters: int = 5, verbose: bool = True) -> (str, List[str]):
         # Placeholder for agent act loop
         return "[Agent output]", []
@@ -0,0 +1,142 @@
+"""
+Safe arithmetic: AST-compiled expressions with size guards, math functions and batch evaluation
+"""
+import ast
+import math
+import operator
+import re
+from functools import lru_cache
+from typing import Callable, List, Union
+
+MAX_EXPRESSION_CHARS = 1000
+MAX_NODES = 200
+MAX_INT_BITS = 10000      # ~3000 decimal digits; larger integer results are refused
+MAX_FACTORIAL = 1000
+
+Number = Union[int, float]
+
+class CalculatorError(ValueError):
+    pass
+
+def _check_int(value):
+    if isinstance(value, int) and value.bit_length() > MAX_INT_BITS:
+        raise CalculatorError(f"result exceeds {MAX_INT_BITS} bits")
+    return value
+
+def _pow(base, exp):
+    if isinstance(base, int) and isinstance(exp, int) and exp > 0 and abs(base) > 1:
+        if (abs(base).bit_length() - 1) * exp > MAX_INT_BITS:
+            raise CalculatorError(f"exponent too large: {base} ** {exp}")
+    result = operator.pow(base, exp)
+    if isinstance(result, complex):
+        raise CalculatorError("result is not a real number")
+    return _check_int(result)
+
+def _mul(a, b):
+    if isinstance(a, int) and isinstance(b, int) and a.bit_length() + b.bit_length() > MAX_INT_BITS + 1:
+        raise CalculatorError(f"result exceeds {MAX_INT_BITS} bits")
+    return a * b
+
+def _factorial(n):
+    if not isinstance(n, int) or isinstance(n, bool):
+        if isinstance(n, float) and n.is_integer():
+            n = int(n)
+        else:
+            raise CalculatorError("factorial() needs a non-negative integer")
+    if n > MAX_FACTORIAL:
+        raise CalculatorError(f"factorial() argument above {MAX_FACTORIAL}")
+    return math.factorial(n)
+
+def _comb(n, k):
+    if isinstance(n, int) and n > MAX_FACTORIAL * 10:
+        raise CalculatorError(f"comb() argument above {MAX_FACTORIAL * 10}")
+    return _check_int(math.comb(n, k))
+
+_BINARY = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: _mul, ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod, ast.Pow: _pow,
+}
+_UNARY = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau, "inf": math.inf}
+FUNCTIONS = {
+    "abs": abs, "round": round, "min": min, "max": max, "sum": lambda *args: sum(args), "pow": _pow,
+    "sqrt": math.sqrt, "exp": math.exp, "log": math.log, "log10": math.log10, "log2": math.log2,
+    "sin": math.sin, "cos": math.cos, "tan": math.tan, "asin": math.asin, "acos": math.acos,
+    "atan": math.atan, "atan2": math.atan2, "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "degrees": math.degrees, "radians": math.radians, "hypot": math.hypot, "floor": math.floor,
+    "ceil": math.ceil, "trunc": math.trunc, "factorial": _factorial, "gcd": math.gcd,
+    "comb": _comb,
+}
+
+def _compile(node) -> Callable[[], Number]:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        return lambda: value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+        op, left, right = _BINARY[type(node.op)], _compile(node.left), _compile(node.right)
+        return lambda: op(left(), right())
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY:
+        op, operand = _UNARY[type(node.op)], _compile(node.operand)
+        return lambda: op(operand())
+    if isinstance(node, ast.Name) and node.id in CONSTANTS:
+        value = CONSTANTS[node.id]
+        return lambda: value
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS
+            and not node.keywords):
+        func, args = FUNCTIONS[node.func.id], [_compile(a) for a in node.args]
+        return lambda: func(*[a() for a in args])
+    if isinstance(node, ast.Name):
+        raise CalculatorError(f"unknown name {node.id!r}")
+    raise CalculatorError(f"unsupported syntax: {type(node).__name__}")
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> Callable[[], Number]:
+    """Parse and compile once; returns a zero-argument function computing the value."""
+    expression = expression.strip()
+    if len(expression) > MAX_EXPRESSION_CHARS:
+        raise CalculatorError(f"expression longer than {MAX_EXPRESSION_CHARS} chars")
+    try:
+        tree = ast.parse(expression.replace("^", "**"), mode="eval")
+    except (SyntaxError, RecursionError) as e:
+        raise CalculatorError(f"invalid expression: {e}") from None
+    if sum(1 for _ in ast.walk(tree)) > MAX_NODES:
+        raise CalculatorError(f"expression has more than {MAX_NODES} parts")
+    compiled = _compile(tree.body)
+    if not any(isinstance(n, ast.Call) for n in ast.walk(tree)):
+        # Pure constant arithmetic: fold once so cache hits cost nothing
+        value = compiled()
+        return lambda: value
+    return compiled
+
+def evaluate(expression: str) -> Number:
+    """Value of `expression`; raises CalculatorError for anything invalid, unsafe or out of range."""
+    try:
+        return compile_expression(expression)()
+    except CalculatorError:
+        raise
+    except (ArithmeticError, ValueError, TypeError) as e:
+        raise CalculatorError(str(e)) from None
+
+def evaluate_many(expressions: List[str]) -> List[Union[Number, CalculatorError]]:
+    """Evaluate a batch; failures are returned in place as CalculatorError instances."""
+    results = []
+    for expression in expressions:
+        try:
+            results.append(evaluate(expression))
+        except CalculatorError as e:
+            results.append(e)
+    return results
+
+_SEPARATORS = re.compile(r"[;\n]+")
+
+def calculate(text: str) -> str:
+    """Tool-facing entry point: one expression, or several separated by ';' or newlines."""
+    expressions = [e for e in (part.strip() for part in _SEPARATORS.split(text)) if e]
+    if not expressions:
+        return "[Calculator error: empty expression]"
+    results = evaluate_many(expressions)
+    if len(results) == 1:
+        result = results[0]
+        return f"[Calculator error: {result}]" if isinstance(result, CalculatorError) else str(result)
+    return "\n".join(f"{expr} = [Calculator error: {r}]" if isinstance(r, CalculatorError) else f"{expr} = {r}"
+                     for expr, r in zip(expressions, results))
@@ -0,0 +1,78 @@
+"""
+Streaming batch execution of goals from JSONL files
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield records one line at a time so large files are never fully loaded."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def record_id(record: Dict[str, Any], index: int) -> str:
+    return str(record.get("id") or record.get("request_id") or index)
+
+def record_goal(record: Dict[str, Any]) -> str:
+    if record.get("goal"):
+        return record["goal"]
+    return "\n\n".join(part for part in (record.get("title"), record.get("body")) if part)
+
+def completed_ids(output_path: str) -> Set[str]:
+    """Ids already written successfully to `output_path` (for resuming)."""
+    if not os.path.exists(output_path):
+        return set()
+    done = set()
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue  # Partially written line from a crash
+            if result.get("status") == "ok":
+                done.add(result["id"])
+    return done
+
+def run_batch(records: Iterable[Dict[str, Any]], handler: Callable[[str], Any], output_path: str,
+              concurrency: int = 4, resume: bool = True,
+              on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, int]:
+    """Run `handler(goal)` for every record, appending one JSON line per result.
+
+    At most `concurrency` goals run at once and at most 2 * concurrency are
+    read ahead, so memory stays flat regardless of the input size. Results are
+    flushed as they finish; with `resume`, ids already marked ok are skipped.
+    """
+    skip = completed_ids(output_path) if resume else set()
+    counts = {"ok": 0, "error": 0, "skipped": 0}
+    slots = threading.BoundedSemaphore(concurrency * 2)
+    write_lock = threading.Lock()
+    with open(output_path, "a", encoding="utf-8") as out:
+        def run_one(rid: str, goal: str):
+            start = time.perf_counter()
+            try:
+                result = {"id": rid, "status": "ok", "answer": handler(goal)}
+            except Exception as e:
+                result = {"id": rid, "status": "error", "error": f"{type(e).__name__}: {e}"}
+            result["elapsed"] = round(time.perf_counter() - start, 3)
+            with write_lock:
+                out.write(json.dumps(result, default=str) + "\n")
+                out.flush()
+                counts[result["status"]] += 1
+            if on_result:
+                on_result(result)
+        def release(_):
+            slots.release()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for index, record in enumerate(records):
+                rid = record_id(record, index)
+                if rid in skip:
+                    counts["skipped"] += 1
+                    continue
+                slots.acquire()
+                executor.submit(run_one, rid, record_goal(record)).add_done_callback(release)
+    return counts
@@ -0,0 +1,97 @@
+"""
+Content-addressed tool result cache (in-memory LRU + optional SQLite tier)
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+def make_key(name: str, args: Dict[str, Any]) -> str:
+    """Stable key for a tool call: same name and args in any order -> same key."""
+    payload = json.dumps([name, args], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ToolCache:
+    """Caches tool results keyed on (tool name, canonicalized args).
+
+    Entries expire after a per-tool TTL (seconds, None = never). The memory
+    tier is a size-bounded LRU; when `path` is given, entries are also written
+    to a SQLite file so they survive restarts and are shared between workers.
+    """
+    def __init__(self, max_entries: int = 1024, ttls: Optional[Dict[str, Optional[float]]] = None,
+                 default_ttl: Optional[float] = None, path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "disk_hits": 0, "evictions": 0}
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS tool_cache (key TEXT PRIMARY KEY, value TEXT, expires REAL)")
+            self._db.commit()
+    def ttl_for(self, name: str) -> Optional[float]:
+        return self.ttls.get(name, self.default_ttl)
+    def lookup(self, name: str, args: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Return (True, value) on a fresh hit, (False, None) otherwise."""
+        key = make_key(name, args)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return True, value
+                del self._entries[key]
+            if self._db is not None:
+                row = self._db.execute("SELECT value, expires FROM tool_cache WHERE key = ?", (key,)).fetchone()
+                if row and (row[1] is None or row[1] > now):
+                    value = json.loads(row[0])
+                    self._remember(key, value, row[1])
+                    self._stats["hits"] += 1
+                    self._stats["disk_hits"] += 1
+                    return True, value
+            self._stats["misses"] += 1
+            return False, None
+    def store(self, name: str, args: Dict[str, Any], value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl_for(name) if ttl is None else ttl
+        expires = None if ttl is None else self.clock() + ttl
+        key = make_key(name, args)
+        with self._lock:
+            self._remember(key, value, expires)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO tool_cache VALUES (?, ?, ?)",
+                                 (key, json.dumps(value, default=str), expires))
+                self._db.commit()
+    def get_or_call(self, name: str, args: Dict[str, Any], func: Callable[[], Any],
+                    should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        hit, value = self.lookup(name, args)
+        if hit:
+            return value
+        value = func()
+        if should_cache is None or should_cache(value):
+            self.store(name, args, value)
+        return value
+    def _remember(self, key: str, value: Any, expires: Optional[float]):
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM tool_cache")
+                self._db.commit()
@@ -0,0 +1,98 @@
+"""
+Context window management: token budgeting and compaction of agent conversations
+"""
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken is optional; fall back to ~4 chars per token
+    _encoding = None
+
+Message = Dict[str, Any]
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(text) // 4 + 1
+
+def message_tokens(message: Message) -> int:
+    # ~4 tokens of per-message framing on top of the content
+    tokens = 4 + count_tokens(message.get("content") or "")
+    if message.get("tool_calls"):
+        tokens += count_tokens(json.dumps(message["tool_calls"]))
+    return tokens
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    if limit == 0:
+        return "[Earlier tool output removed to save context]"
+    return text[:limit] + f"... [truncated {len(text) - limit} chars]"
+
+class ContextManager:
+    """Keeps a conversation under `max_tokens` before each completion.
+
+    The system prompt and the first user message are always kept, as are the
+    last `keep_recent` turns (an assistant tool-call message and its tool
+    replies count as one turn, so they are never split). Older turns are
+    compacted in increasingly lossy stages until the budget is met:
+      1. truncate their tool outputs to `stale_tool_chars`
+      2. drop their tool outputs entirely
+      3. replace them with a rolling summary (if `summarizer` is given) or
+         drop them oldest-first
+      4. truncate tool outputs in the recent turns as a last resort
+    """
+    def __init__(self, max_tokens: int = 12000, keep_recent: int = 4, stale_tool_chars: int = 500,
+                 summarizer: Optional[Callable[[str], str]] = None):
+        self.max_tokens = max_tokens
+        self.keep_recent = keep_recent
+        self.stale_tool_chars = stale_tool_chars
+        self.summarizer = summarizer
+        self.tokens_saved = 0
+    def total(self, messages: List[Message]) -> int:
+        return sum(message_tokens(m) for m in messages)
+    def _split(self, messages: List[Message]):
+        head_len = 2 if len(messages) >= 2 and messages[0].get("role") == "system" else 1
+        head, rest = messages[:head_len], messages[head_len:]
+        turns: List[List[Message]] = []
+        for m in rest:
+            if m.get("role") == "tool" and turns and turns[-1][0].get("tool_calls"):
+                turns[-1].append(m)
+            else:
+                turns.append([m])
+        return head, turns
+    def _fits(self, head, older, recent) -> bool:
+        flat = head + [m for t in older + recent for m in t]
+        return self.total(flat) <= self.max_tokens
+    def _shrink_tools(self, turns, limit: int):
+        return [[dict(m, content=_truncate(m.get("content") or "", limit)) if m.get("role") == "tool" else m
+                 for m in turn] for turn in turns]
+    def compact(self, messages: List[Message]) -> List[Message]:
+        """Return `messages` unchanged if within budget, else a compacted copy."""
+        before = self.total(messages)
+        if before <= self.max_tokens:
+            return messages
+        head, turns = self._split(messages)
+        split_at = max(0, len(turns) - self.keep_recent)
+        older, recent = turns[:split_at], turns[split_at:]
+        for limit in (self.stale_tool_chars, 0):
+            older = self._shrink_tools(older, limit)
+            if self._fits(head, older, recent):
+                return self._finish(head, older, recent, before)
+        if older and self.summarizer is not None:
+            transcript = "\n".join(f"{m['role']}: {m.get('content') or ''}" for t in older for m in t)
+            summary = self.summarizer(transcript)
+            older = [[{"role": "user", "content": f"[Summary of earlier steps]: {summary}"}]]
+        while older and not self._fits(head, older, recent):
+            older.pop(0)
+        if not self._fits(head, older, recent):
+            recent = self._shrink_tools(recent, self.stale_tool_chars)
+        return self._finish(head, older, recent, before)
+    def _finish(self, head, older, recent, before: int) -> List[Message]:
+        compacted = head + [m for t in older + recent for m in t]
+        self.tokens_saved += before - self.total(compacted)
+        return compacted
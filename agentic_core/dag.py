@@ -0,0 +1,105 @@
+"""
+DAG scheduling for pipelines: run every agent whose inputs are ready concurrently
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+def validate_dag(deps: Dict[str, List[str]]) -> List[str]:
+    """Check every dependency exists and there are no cycles; return a topological order."""
+    for node, inputs in deps.items():
+        for dep in inputs:
+            if dep not in deps:
+                raise ValueError(f"{node!r} depends on unknown node {dep!r}")
+    order, state = [], {}
+    def visit(node, path):
+        if state.get(node) == "done":
+            return
+        if state.get(node) == "visiting":
+            raise ValueError(f"Cycle in pipeline: {' -> '.join(path + [node])}")
+        state[node] = "visiting"
+        for dep in deps[node]:
+            visit(dep, path + [node])
+        state[node] = "done"
+        order.append(node)
+    for node in deps:
+        visit(node, [])
+    return order
+
+def descendants(deps: Dict[str, List[str]], node: str) -> Set[str]:
+    """All nodes that (transitively) consume `node`'s output."""
+    found, frontier = set(), [node]
+    while frontier:
+        current = frontier.pop()
+        for other, inputs in deps.items():
+            if current in inputs and other not in found:
+                found.add(other)
+                frontier.append(other)
+    return found
+
+def sinks(deps: Dict[str, List[str]]) -> List[str]:
+    used = {dep for inputs in deps.values() for dep in inputs}
+    return [node for node in deps if node not in used]
+
+class BackEdge:
+    """Bounded critic loop: when `when(critic_output)` is true, re-run `target`
+    (with the critic output as feedback) and everything downstream of it, at
+    most `max_rounds` times."""
+    def __init__(self, target: str, when: Callable[[Any], bool], max_rounds: int = 2):
+        self.target = target
+        self.when = when
+        self.max_rounds = max_rounds
+
+async def arun_dag(deps: Dict[str, List[str]],
+                   run_node: Callable[[str, Dict[str, Any], Optional[Any]], Awaitable[Any]],
+                   back_edges: Optional[Dict[str, BackEdge]] = None,
+                   max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """Run `run_node(name, inputs, feedback)` for every node once its inputs are done.
+
+    `deps` maps each node to the nodes whose outputs it consumes; all ready
+    nodes run concurrently (up to `max_concurrency`). `back_edges` maps a critic
+    node to a BackEdge. Returns {node: output} for the final round.
+    """
+    order = validate_dag(deps)
+    back_edges = back_edges or {}
+    for critic, edge in back_edges.items():
+        if critic not in deps or edge.target not in deps:
+            raise ValueError(f"Back-edge {critic!r} -> {edge.target!r} references an unknown node")
+    outputs: Dict[str, Any] = {}
+    feedback: Dict[str, Any] = {}
+    rounds: Dict[str, int] = {}
+    running: Dict[asyncio.Task, str] = {}
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def run(node: str, inputs: Dict[str, Any], note: Optional[Any]):
+        if semaphore is None:
+            return await run_node(node, inputs, note)
+        async with semaphore:
+            return await run_node(node, inputs, note)
+
+    try:
+        while True:
+            active = set(running.values())
+            for node in order:
+                if node not in outputs and node not in active and all(d in outputs for d in deps[node]):
+                    inputs = {d: outputs[d] for d in deps[node]}
+                    running[asyncio.ensure_future(run(node, inputs, feedback.pop(node, None)))] = node
+            if not running:
+                return outputs
+            finished, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                node = running.pop(task)
+                outputs[node] = task.result()
+                edge = back_edges.get(node)
+                if edge and rounds.get(node, 0) < edge.max_rounds and edge.when(outputs[node]):
+                    rounds[node] = rounds.get(node, 0) + 1
+                    feedback[edge.target] = outputs[node]
+                    stale = {edge.target} | descendants(deps, edge.target)
+                    for other_task, other in list(running.items()):
+                        if other in stale:
+                            other_task.cancel()
+                            del running[other_task]
+                    for other in stale:
+                        outputs.pop(other, None)
+    finally:
+        for task in running:
+            task.cancel()
@@ -0,0 +1,208 @@
+"""
+Deadlines, cooperative cancellation, tool timeouts and hedged calls
+"""
+import asyncio
+import contextvars
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+class DeadlineExceeded(TimeoutError):
+    """The work ran out of time or was cancelled."""
+
+class Deadline:
+    """A point in time after which work should stop, plus a cancel flag.
+
+    A child deadline never outlives its parent and is cancelled with it, so a
+    per-goal deadline bounds every tool timeout started under it. Cancellation
+    is cooperative: code polls expired/check() at safe points (before a retry,
+    before an LLM call) because Python threads cannot be killed.
+    """
+    def __init__(self, seconds: Optional[float] = None, parent: Optional["Deadline"] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.parent = parent
+        self._clock = clock
+        self._cancelled = False
+        self.expires_at = None if seconds is None else clock() + seconds
+        if parent is not None and parent.expires_at is not None:
+            self.expires_at = parent.expires_at if self.expires_at is None else min(self.expires_at, parent.expires_at)
+        self.budget = self.remaining()
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None if there is no time limit."""
+        return None if self.expires_at is None else max(0.0, self.expires_at - self._clock())
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self.parent is not None and self.parent.cancelled)
+    @property
+    def expired(self) -> bool:
+        return self.cancelled or (self.expires_at is not None and self._clock() >= self.expires_at)
+    def cancel(self):
+        self._cancelled = True
+    def check(self):
+        if self.cancelled:
+            raise DeadlineExceeded("cancelled")
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+_current: contextvars.ContextVar = contextvars.ContextVar("agentic_deadline", default=None)
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+def check_deadline():
+    """Raise DeadlineExceeded if the current deadline has passed or was cancelled."""
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check()
+
+def cap_timeout(timeout):
+    """`timeout` (seconds, a (connect, read) tuple or None) shortened to the current deadline."""
+    deadline = _current.get()
+    left = deadline.remaining() if deadline is not None else None
+    if left is None:
+        return timeout
+    left = max(left, 0.001)
+    if timeout is None:
+        return left
+    if isinstance(timeout, tuple):
+        return tuple(left if t is None else min(t, left) for t in timeout)
+    return min(timeout, left)
+
+@contextmanager
+def deadline_scope(seconds: Optional[float] = None):
+    """Run the block under a deadline `seconds` from now; nested scopes can
+    only shorten an outer one. Asyncio tasks and call_with_timeout() workers
+    started inside inherit it."""
+    deadline = Deadline(seconds, parent=_current.get())
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+def _timed_out(scope: Deadline) -> DeadlineExceeded:
+    if scope.cancelled:
+        return DeadlineExceeded("cancelled")
+    return DeadlineExceeded(f"no result within {scope.budget:.3g}s")
+
+def _run_under(deadline: Deadline, func: Callable[[], Any]) -> Any:
+    _current.set(deadline)
+    return func()
+
+def call_with_timeout(func: Callable[[], Any], timeout: Optional[float] = None, hedge_after: Optional[float] = None,
+                      on_latency: Optional[Callable[[float], None]] = None, executor: Optional[Executor] = None) -> Any:
+    """Run `func()` on a worker thread, waiting at most `timeout` seconds (and
+    never past the current deadline); raises DeadlineExceeded when it runs out.
+
+    With `hedge_after`, an identical second call starts if the first has not
+    finished by then and the first success wins. Calls that lose or time out
+    keep their thread until they return, but their deadline is cancelled so
+    retries and further requests inside them stop early. `on_latency` gets
+    the duration of every call that succeeds. Pass a bounded `executor` to
+    cap the threads that slow calls can hold (the default is a new thread
+    per call); time spent queued for a worker counts against `timeout`.
+    """
+    scope = Deadline(timeout, parent=_current.get())
+    results: "queue.SimpleQueue" = queue.SimpleQueue()
+    def launch():
+        attempt = Deadline(parent=scope)
+        context = contextvars.copy_context()
+        def run():
+            start = time.monotonic()
+            try:
+                value = context.run(_run_under, attempt, func)
+            except BaseException as e:
+                results.put((False, e))
+                return
+            if on_latency is not None:
+                on_latency(time.monotonic() - start)
+            results.put((True, value))
+        if executor is not None:
+            executor.submit(run)
+        else:
+            threading.Thread(target=run, daemon=True).start()
+    launch()
+    running, hedged = 1, hedge_after is None
+    try:
+        while True:
+            wait = scope.remaining()
+            if not hedged:
+                wait = hedge_after if wait is None else min(wait, hedge_after)
+            try:
+                ok, value = results.get(timeout=wait)
+            except queue.Empty:
+                if not hedged and not scope.expired:
+                    launch()
+                    running, hedged = running + 1, True
+                    continue
+                raise _timed_out(scope) from None
+            running -= 1
+            if ok:
+                return value
+            if not running:
+                raise value
+    finally:
+        scope.cancel()
+
+async def acall_with_timeout(func: Callable[[], Awaitable[Any]], timeout: Optional[float] = None,
+                             hedge_after: Optional[float] = None,
+                             on_latency: Optional[Callable[[float], None]] = None) -> Any:
+    """Async counterpart of call_with_timeout(); `func()` returns an awaitable.
+    Losing and timed-out attempts are cancelled outright."""
+    scope = Deadline(timeout, parent=_current.get())
+    async def attempt():
+        _current.set(Deadline(parent=scope))  # tasks run in a copy of the context
+        start = time.monotonic()
+        value = await func()
+        if on_latency is not None:
+            on_latency(time.monotonic() - start)
+        return value
+    pending = {asyncio.ensure_future(attempt())}
+    hedged, error = hedge_after is None, None
+    try:
+        while pending:
+            wait = scope.remaining()
+            if not hedged:
+                wait = hedge_after if wait is None else min(wait, hedge_after)
+            done, pending = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled():  # cancelled by someone else: a failed attempt, not our cancellation
+                    error = DeadlineExceeded("attempt cancelled")
+                elif task.exception() is None:
+                    return task.result()
+                else:
+                    error = task.exception()
+            if done:
+                continue
+            if not hedged and not scope.expired:
+                pending.add(asyncio.ensure_future(attempt()))
+                hedged = True
+                continue
+            raise _timed_out(scope)
+        raise error
+    finally:
+        scope.cancel()
+        for task in pending:
+            task.cancel()
+
+class LatencyTracker:
+    """Rolling window of recent latencies per key, e.g. to hedge at the p95."""
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+    def record(self, key: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+    def percentile(self, key: str, q: float = 0.95) -> Optional[float]:
+        """The q-quantile of recent latencies, or None until min_samples are recorded."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
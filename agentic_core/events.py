@@ -0,0 +1,47 @@
+"""
+Streaming events emitted by agent loops and pipelines
+"""
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Event types; every event is a dict with a "type" key plus the fields noted
+TOKEN = "token"            # agent, text: a chunk of the answer as the model writes it
+TOOL_START = "tool_start"  # agent, tool, args
+TOOL_END = "tool_end"      # agent, tool, args, result
+HANDOFF = "handoff"        # from_agent, to_agent, content: pipeline moved to the next agent
+FINAL = "final"            # agent, content: an agent finished its turn
+DONE = "done"              # result: whatever the pipeline function returned
+
+EventCallback = Callable[[Dict[str, Any]], None]
+
+def emit(on_event: Optional[EventCallback], event_type: str, **fields):
+    if on_event is not None:
+        on_event(dict(type=event_type, **fields))
+
+class _Failure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+def iter_events(run: Callable[[EventCallback], Any]) -> Iterator[Dict[str, Any]]:
+    """Turn a callback-style pipeline into a generator of events.
+
+    `run(on_event)` executes on a background thread; events are yielded on the
+    caller's thread as they arrive (so UI code such as Streamlit can render
+    them), ending with a DONE event carrying the return value. Exceptions
+    raised by `run` are re-raised here.
+    """
+    events: "queue.Queue" = queue.Queue()
+    def target():
+        try:
+            events.put({"type": DONE, "result": run(events.put)})
+        except BaseException as e:
+            events.put(_Failure(e))
+    threading.Thread(target=target, daemon=True).start()
+    while True:
+        event = events.get()
+        if isinstance(event, _Failure):
+            raise event.exc
+        yield event
+        if event["type"] == DONE:
+            return
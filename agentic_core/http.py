@@ -0,0 +1,64 @@
+"""
+Shared, pooled HTTP clients for network tools (requests for sync, httpx for async)
+"""
+import asyncio
+import importlib.util
+import os
+import threading
+import weakref
+from .runtime import on_loop_close
+
+POOL_SIZE = int(os.getenv("AGENTIC_HTTP_POOL_SIZE", "32"))
+CONNECT_TIMEOUT = float(os.getenv("AGENTIC_HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("AGENTIC_HTTP_READ_TIMEOUT", "20"))
+
+_session = None
+_session_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+def default_timeout():
+    """(connect, read) timeout tuple in the form requests expects."""
+    return (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+def get_session():
+    """Process-wide requests.Session with keep-alive connection pooling.
+
+    urllib3's pool is thread-safe, so every tool and worker thread shares the
+    same session and reuses TCP/TLS connections per host.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                # Retries are handled by agentic_core.ratelimit.RetryPolicy
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+def get_async_http_client():
+    """Pooled httpx.AsyncClient for the running event loop (HTTP/2 if `h2` is installed)."""
+    import httpx
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            http2=http2_available(),
+            follow_redirects=True,
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE)
+        )
+    return client
+
+@on_loop_close
+async def _close_async_http_client(loop):
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
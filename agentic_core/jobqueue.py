@@ -0,0 +1,112 @@
+"""
+Persistent job queue for the pipeline server: SQLite-backed, safe to share between worker processes
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+class JobQueue:
+    """Jobs in a SQLite file (WAL mode), claimed with leases.
+
+    A worker claims the oldest queued job and must heartbeat() before its
+    lease runs out; a job whose lease expired (the worker crashed or was
+    killed) is handed to the next claimer, up to `max_attempts` times, so
+    nothing submitted is lost across restarts. Every process opens its own
+    JobQueue on the same path.
+    """
+    def __init__(self, path: str, lease_seconds: float = 60.0, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, status TEXT, payload TEXT,"
+                         " result TEXT, error TEXT, attempts INTEGER DEFAULT 0, worker TEXT, created REAL,"
+                         " started REAL, finished REAL, lease_until REAL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created)")
+    def _row(self, row) -> Dict[str, Any]:
+        (job_id, status, payload, result, error, attempts, worker, created, started, finished, _) = row
+        return {"id": job_id, "status": status, "payload": json.loads(payload),
+                "result": json.loads(result) if result is not None else None, "error": error,
+                "attempts": attempts, "worker": worker, "created": created, "started": started, "finished": finished}
+    def submit(self, payload: Dict[str, Any], job_id: Optional[str] = None) -> str:
+        job_id = job_id or uuid.uuid4().hex
+        with self._lock:
+            self._db.execute("INSERT INTO jobs (id, status, payload, created) VALUES (?, ?, ?, ?)",
+                             (job_id, QUEUED, json.dumps(payload, default=str), time.time()))
+        return job_id
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """Take the oldest runnable job (queued, or running with an expired lease), or None."""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                # Jobs whose worker died too often are given up on rather than retried forever
+                self._db.execute("UPDATE jobs SET status = ?, error = 'worker lost', finished = ? WHERE status = ?"
+                                 " AND lease_until < ? AND attempts >= ?", (FAILED, now, RUNNING, now, self.max_attempts))
+                row = self._db.execute("SELECT * FROM jobs WHERE status = ? OR (status = ? AND lease_until < ?)"
+                                       " ORDER BY created LIMIT 1", (QUEUED, RUNNING, now)).fetchone()
+                if row is None:
+                    self._db.execute("COMMIT")
+                    return None
+                self._db.execute("UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, started = ?,"
+                                 " lease_until = ? WHERE id = ?", (RUNNING, worker, now, now + self.lease_seconds, row[0]))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        job = self._row(row)
+        job.update(status=RUNNING, worker=worker, attempts=job["attempts"] + 1, started=now)
+        return job
+    def heartbeat(self, job_id: str, worker: str) -> bool:
+        """Extend the lease; False if the job is no longer this worker's (cancelled or reclaimed)."""
+        with self._lock:
+            return self._db.execute("UPDATE jobs SET lease_until = ? WHERE id = ? AND worker = ? AND status = ?",
+                                    (time.time() + self.lease_seconds, job_id, worker, RUNNING)).rowcount == 1
+    def _finish(self, job_id: str, worker: str, status: str, result=None, error: Optional[str] = None) -> bool:
+        with self._lock:
+            return self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished = ?, lease_until = NULL"
+                " WHERE id = ? AND worker = ? AND status = ?",
+                (status, None if result is None else json.dumps(result, default=str), error, time.time(),
+                 job_id, worker, RUNNING)).rowcount == 1
+    def complete(self, job_id: str, worker: str, result: Any) -> bool:
+        return self._finish(job_id, worker, DONE, result=result)
+    def fail(self, job_id: str, worker: str, error: str) -> bool:
+        return self._finish(job_id, worker, FAILED, error=error)
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet."""
+        with self._lock:
+            return self._db.execute("UPDATE jobs SET status = ?, finished = ? WHERE id = ? AND status = ?",
+                                    (CANCELLED, time.time(), job_id, QUEUED)).rowcount == 1
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row(row) if row else None
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent jobs first, without their results."""
+        query, params = "SELECT * FROM jobs", []
+        if status:
+            query, params = query + " WHERE status = ?", [status]
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY created DESC LIMIT ?", params + [limit]).fetchall()
+        return [dict(self._row(row), result=None) for row in rows]
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+def default_path() -> str:
+    return os.getenv("AGENTIC_JOB_DB", ".agentic_jobs.sqlite")
@@ -0,0 +1,88 @@
+"""
+Deterministic LLM completion cache with record / replay / read-through modes
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+# Request fields that do not change what the model returns
+_IGNORED_FIELDS = {"stream", "timeout", "extra_headers", "user"}
+
+class CompletionCacheMiss(KeyError):
+    """Raised in replay mode when a request was never recorded."""
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Stable hash of (model, messages, tools/functions schema, sampling params)."""
+    material = {k: v for k, v in request.items() if k not in _IGNORED_FIELDS}
+    payload = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class CompletionCache:
+    """Stores completions in an append-only JSONL file (last write wins).
+
+    Modes:
+      off          - always call the API, never touch the file
+      record       - always call the API and (over)write the stored response
+      replay       - only serve stored responses; a miss raises CompletionCacheMiss
+      read_through - serve stored responses, call and store on a miss
+    """
+    MODES = ("off", "record", "replay", "read_through")
+    def __init__(self, path: Optional[str] = None, mode: str = "off"):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown completion cache mode: {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        if mode != "off" and path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry["response"]
+    def get(self, request: Dict[str, Any]) -> Optional[Any]:
+        with self._lock:
+            return self._entries.get(request_key(request))
+    def put(self, request: Dict[str, Any], response: Any):
+        key = request_key(request)
+        with self._lock:
+            self._entries[key] = response
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"key": key, "response": response}, separators=(",", ":")) + "\n")
+    def _lookup(self, request: Dict[str, Any]):
+        if self.mode in ("replay", "read_through"):
+            stored = self.get(request)
+            if stored is not None:
+                self.hits += 1
+                return stored
+            self.misses += 1
+            if self.mode == "replay":
+                raise CompletionCacheMiss(f"No recorded completion for model={request.get('model')!r}")
+        return None
+    def complete(self, request: Dict[str, Any], create: Callable[[], Any],
+                 to_dict: Callable[[Any], Any], from_dict: Callable[[Any], Any]) -> Any:
+        """Serve `request` from the cache or via `create()` according to the mode."""
+        if self.mode == "off":
+            return create()
+        stored = self._lookup(request)
+        if stored is not None:
+            return from_dict(stored)
+        response = create()
+        self.put(request, to_dict(response))
+        return response
+    async def acomplete(self, request: Dict[str, Any], create: Callable[[], Any],
+                        to_dict: Callable[[Any], Any], from_dict: Callable[[Any], Any]) -> Any:
+        """Async counterpart of complete(); `create()` returns an awaitable."""
+        if self.mode == "off":
+            return await create()
+        stored = self._lookup(request)
+        if stored is not None:
+            return from_dict(stored)
+        response = await create()
+        self.put(request, to_dict(response))
+        return response
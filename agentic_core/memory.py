@@ -1,14 +1,210 @@
 """
-Shared and per-agent memory/workspace
+Shared and per-agent memory/workspace, with pluggable (optionally persistent) backends
 """
-class Memory:
+import copy
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+LAZY_THRESHOLD = 64 * 1024  # values at least this many bytes are loaded on demand by all(lazy=True)
+
+class LazyValue:
+    """Placeholder for a large stored value; call load() to read it."""
+    def __init__(self, backend, key: str, size: int):
+        self.backend = backend
+        self.key = key
+        self.size = size
+    def load(self) -> Any:
+        return self.backend.get(self.key)
+    def __repr__(self):
+        return f"<LazyValue {self.key!r} ({self.size} bytes)>"
+
+class DictBackend:
+    """In-process dict storage (the original behaviour); checkpoints are deep copies."""
     def __init__(self):
-        self._store = {}
+        self._store: Dict[str, Any] = {}
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    def get(self, key, default=None):
+        with self._lock:
+            return self._store.get(key, default)
+    def set(self, key, value):
+        with self._lock:
+            self._store[key] = value
+    def append(self, key, value):
+        with self._lock:
+            self._store.setdefault(key, []).append(value)
+    def delete(self, key) -> bool:
+        with self._lock:
+            if key not in self._store:
+                return False
+            del self._store[key]
+            return True
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._store)
+    def all(self, lazy: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._store)
+    def checkpoint(self, label: str):
+        with self._lock:
+            self._checkpoints[label] = copy.deepcopy(self._store)
+    def restore(self, label: str):
+        with self._lock:
+            if label not in self._checkpoints:
+                raise KeyError(f"No checkpoint {label!r}")
+            self._store = copy.deepcopy(self._checkpoints[label])
+    def checkpoints(self) -> List[str]:
+        with self._lock:
+            return list(self._checkpoints)
+    def clear(self):
+        """Delete every key and checkpoint."""
+        with self._lock:
+            self._store.clear()
+            self._checkpoints.clear()
+    def close(self):
+        pass
+
+class SQLiteBackend:
+    """Durable storage in a SQLite file (WAL mode, memory-mapped reads).
+
+    Nothing is cached on the Python heap: every get() reads from SQLite, whose
+    page cache is capped at `cache_kib`, so resident memory stays bounded no
+    matter how large tool outputs get. append() inserts a row instead of
+    rewriting the list. Several namespaces (e.g. one per pipeline run) can share
+    a file, and checkpoints are copies of a namespace made inside SQLite.
+    """
+    def __init__(self, path: str, namespace: str = "default", lazy_threshold: int = LAZY_THRESHOLD,
+                 cache_kib: int = 8192, mmap_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.namespace = namespace
+        self.lazy_threshold = lazy_threshold
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA cache_size=-{int(cache_kib)}")
+        self._db.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+        with self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS memory (ns TEXT, key TEXT, value TEXT, size INTEGER,"
+                             " is_list INTEGER, PRIMARY KEY (ns, key))")
+            self._db.execute("CREATE TABLE IF NOT EXISTS memory_items (ns TEXT, key TEXT, seq INTEGER, value TEXT,"
+                             " PRIMARY KEY (ns, key, seq))")
+            self._db.execute("CREATE TABLE IF NOT EXISTS memory_checkpoints (ns TEXT, label TEXT, created REAL,"
+                             " PRIMARY KEY (ns, label))")
+    def _checkpoint_ns(self, label: str) -> str:
+        return f"{self.namespace}#checkpoint:{label}"
+    def _read(self, key, row) -> Any:
+        value, is_list = row
+        if not is_list:
+            return json.loads(value)
+        items = self._db.execute("SELECT value FROM memory_items WHERE ns = ? AND key = ? ORDER BY seq",
+                                 (self.namespace, key)).fetchall()
+        return [json.loads(item) for (item,) in items]
+    def get(self, key, default=None):
+        with self._lock:
+            row = self._db.execute("SELECT value, is_list FROM memory WHERE ns = ? AND key = ?",
+                                   (self.namespace, key)).fetchone()
+            return default if row is None else self._read(key, row)
+    def set(self, key, value) -> int:
+        """Store `value`; returns its serialized size."""
+        data = json.dumps(value, default=str)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM memory_items WHERE ns = ? AND key = ?", (self.namespace, key))
+            self._db.execute("INSERT OR REPLACE INTO memory VALUES (?, ?, ?, ?, 0)",
+                             (self.namespace, key, data, len(data)))
+        return len(data)
+    def append(self, key, value):
+        data = json.dumps(value, default=str)
+        ns = self.namespace
+        with self._lock, self._db:
+            row = self._db.execute("SELECT value, is_list FROM memory WHERE ns = ? AND key = ?", (ns, key)).fetchone()
+            if row is None or not row[1]:
+                # First append (or a list stored with set()): switch the key to row-per-item storage
+                existing = json.loads(row[0]) if row else []
+                if not isinstance(existing, list):
+                    raise TypeError(f"Cannot append to non-list value at {key!r}")
+                self._db.execute("INSERT OR REPLACE INTO memory VALUES (?, ?, '', 0, 1)", (ns, key))
+                self._db.executemany("INSERT INTO memory_items VALUES (?, ?, ?, ?)",
+                                     [(ns, key, seq, json.dumps(item, default=str))
+                                      for seq, item in enumerate(existing)])
+            self._db.execute("INSERT INTO memory_items SELECT ?, ?, COALESCE(MAX(seq) + 1, 0), ? FROM memory_items"
+                             " WHERE ns = ? AND key = ?", (ns, key, data, ns, key))
+            self._db.execute("UPDATE memory SET size = size + ? WHERE ns = ? AND key = ?", (len(data), ns, key))
+    def delete(self, key) -> bool:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM memory_items WHERE ns = ? AND key = ?", (self.namespace, key))
+            return self._db.execute("DELETE FROM memory WHERE ns = ? AND key = ?",
+                                    (self.namespace, key)).rowcount > 0
+    def keys(self) -> List[str]:
+        with self._lock:
+            return [k for (k,) in self._db.execute("SELECT key FROM memory WHERE ns = ?", (self.namespace,))]
+    def all(self, lazy: bool = False) -> Dict[str, Any]:
+        """Every key and value; with lazy=True, large values come back as LazyValue."""
+        with self._lock:
+            rows = self._db.execute("SELECT key, size FROM memory WHERE ns = ?", (self.namespace,)).fetchall()
+        result = {}
+        for key, size in rows:
+            if lazy and size >= self.lazy_threshold:
+                result[key] = LazyValue(self, key, size)
+            else:
+                result[key] = self.get(key)
+        return result
+    def _copy_namespace(self, src: str, dst: str):
+        self._db.execute("DELETE FROM memory WHERE ns = ?", (dst,))
+        self._db.execute("DELETE FROM memory_items WHERE ns = ?", (dst,))
+        self._db.execute("INSERT INTO memory SELECT ?, key, value, size, is_list FROM memory WHERE ns = ?", (dst, src))
+        self._db.execute("INSERT INTO memory_items SELECT ?, key, seq, value FROM memory_items WHERE ns = ?",
+                         (dst, src))
+    def checkpoint(self, label: str):
+        with self._lock, self._db:
+            self._copy_namespace(self.namespace, self._checkpoint_ns(label))
+            self._db.execute("INSERT OR REPLACE INTO memory_checkpoints VALUES (?, ?, ?)",
+                             (self.namespace, label, time.time()))
+    def restore(self, label: str):
+        with self._lock, self._db:
+            found = self._db.execute("SELECT 1 FROM memory_checkpoints WHERE ns = ? AND label = ?",
+                                     (self.namespace, label)).fetchone()
+            if not found:
+                raise KeyError(f"No checkpoint {label!r}")
+            self._copy_namespace(self._checkpoint_ns(label), self.namespace)
+    def checkpoints(self) -> List[str]:
+        with self._lock:
+            return [label for (label,) in self._db.execute(
+                "SELECT label FROM memory_checkpoints WHERE ns = ? ORDER BY created", (self.namespace,))]
+    def clear(self):
+        """Delete every key and checkpoint of this namespace (e.g. once its run has finished)."""
+        with self._lock, self._db:
+            labels = [label for (label,) in self._db.execute(
+                "SELECT label FROM memory_checkpoints WHERE ns = ?", (self.namespace,))]
+            for ns in [self.namespace] + [self._checkpoint_ns(label) for label in labels]:
+                self._db.execute("DELETE FROM memory WHERE ns = ?", (ns,))
+                self._db.execute("DELETE FROM memory_items WHERE ns = ?", (ns,))
+            self._db.execute("DELETE FROM memory_checkpoints WHERE ns = ?", (self.namespace,))
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+class Memory:
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else DictBackend()
     def get(self, key, default=None):
-        return self._store.get(key, default)
+        return self.backend.get(key, default)
     def set(self, key, value):
-        self._store[key] = value
+        self.backend.set(key, value)
     def append(self, key, value):
-        self._store.setdefault(key, []).append(value)
-    def all(self):
-        return dict(self._store)
+        self.backend.append(key, value)
+    def delete(self, key) -> bool:
+        return self.backend.delete(key)
+    def keys(self) -> List[str]:
+        return self.backend.keys()
+    def all(self, lazy: bool = False):
+        return self.backend.all(lazy=lazy)
+    def checkpoint(self, label: str):
+        self.backend.checkpoint(label)
+    def restore(self, label: str):
+        self.backend.restore(label)
+    def checkpoints(self) -> List[str]:
+        return self.backend.checkpoints()
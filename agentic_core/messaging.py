@@ -1,15 +1,164 @@
 """
 Agent-to-agent messaging, chat, critique
 """
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+class Mailbox:
+    """Bounded FIFO usable from threads and coroutines alike.
+
+    put()/aput() wait while the box is full (backpressure); get()/aget() wait
+    until a message arrives or the timeout expires, so receivers wake on
+    delivery instead of polling. Coroutines must use aput()/aget(): the
+    blocking variants would stall their event loop, and with it the receiver
+    that could make room.
+    """
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._waiters = []  # (loop, future) of coroutines blocked in aget()
+        self._space_waiters = []  # ... and in aput()
+    def __len__(self):
+        with self._cond:
+            return len(self._items)
+    def _append(self, item):
+        # Caller holds the lock; returns the coroutines to wake
+        self._items.append(item)
+        self._cond.notify_all()
+        waiters, self._waiters = self._waiters, []
+        return waiters
+    def _take(self, count: int = 1) -> Tuple[List[Any], list]:
+        # Caller holds the lock; returns (items taken, coroutines waiting for room)
+        items = [self._items.popleft() for _ in range(min(count, len(self._items)))]
+        self._cond.notify_all()
+        waiters, self._space_waiters = self._space_waiters, []
+        return items, waiters
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """Deliver `item`; returns False if the box stayed full for `timeout` seconds."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: len(self._items) < self.maxsize, timeout):
+                return False
+            waiters = self._append(item)
+        _wake(waiters)
+        return True
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items, timeout):
+                return None
+            items, waiters = self._take()
+        _wake(waiters)
+        return items[0]
+    def drain(self) -> List[Any]:
+        """Take everything queued right now without blocking."""
+        if not self._items:  # cheap check for the common empty case; a racing put is seen next time
+            return []
+        with self._cond:
+            items, waiters = self._take(len(self._items))
+        _wake(waiters)
+        return items
+    async def _await(self, future, deadline) -> bool:
+        remaining = None if deadline is None else deadline - asyncio.get_running_loop().time()
+        if remaining is not None and remaining <= 0:
+            return False
+        try:
+            await asyncio.wait_for(future, remaining)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    async def aput(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """put() for coroutines: waits for room without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._cond:
+                if len(self._items) < self.maxsize:
+                    waiters = self._append(item)
+                    break
+                future = loop.create_future()
+                self._space_waiters.append((loop, future))
+            if not await self._await(future, deadline):
+                return False
+        _wake(waiters)
+        return True
+    async def aget(self, timeout: Optional[float] = None) -> Optional[Any]:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._cond:
+                if self._items:
+                    items, waiters = self._take()
+                    break
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+            if not await self._await(future, deadline):
+                return None
+        _wake(waiters)
+        return items[0]
+
+def _wake(waiters):
+    for loop, future in waiters:
+        loop.call_soon_threadsafe(_resolve, future)
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
+
+class MessageBus:
+    """In-process message bus: one bounded mailbox per agent plus pub/sub topics."""
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._mailboxes: Dict[str, Mailbox] = {}
+        self._topics: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+    def mailbox(self, agent_name: str) -> Mailbox:
+        with self._lock:
+            if agent_name not in self._mailboxes:
+                self._mailboxes[agent_name] = Mailbox(self.maxsize)
+            return self._mailboxes[agent_name]
+    def send(self, to_agent: str, message: Dict[str, Any], timeout: Optional[float] = None) -> bool:
+        return self.mailbox(to_agent).put(message, timeout)
+    async def asend(self, to_agent: str, message: Dict[str, Any], timeout: Optional[float] = None) -> bool:
+        return await self.mailbox(to_agent).aput(message, timeout)
+    def receive(self, agent_name: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        return self.mailbox(agent_name).get(timeout)
+    async def areceive(self, agent_name: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        return await self.mailbox(agent_name).aget(timeout)
+    def drain(self, agent_name: str) -> List[Dict[str, Any]]:
+        return self.mailbox(agent_name).drain()
+    def subscribe(self, agent_name: str, topic: str):
+        with self._lock:
+            self._topics.setdefault(topic, set()).add(agent_name)
+    def unsubscribe(self, agent_name: str, topic: str):
+        with self._lock:
+            self._topics.get(topic, set()).discard(agent_name)
+    def publish(self, topic: str, message: Dict[str, Any], timeout: Optional[float] = None) -> int:
+        """Send `message` to every subscriber of `topic`; returns how many accepted it."""
+        with self._lock:
+            subscribers = sorted(self._topics.get(topic, ()))
+        message = dict(message, topic=topic)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delivered = 0
+        for name in subscribers:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            delivered += self.send(name, message, remaining)
+        return delivered
+
 class Messaging:
-    def __init__(self, agent_name: str):
+    def __init__(self, agent_name: str, bus: Optional[MessageBus] = None):
         self.agent_name = agent_name
+        self.bus = bus
         self._inbox = []
-    def send(self, to_agent: str, content: str):
-        # Placeholder: In real system, would use shared workspace or message bus
-        pass
+    def send(self, to_agent: str, content: str, timeout: Optional[float] = None) -> bool:
+        if self.bus is None:
+            return False
+        return self.bus.send(to_agent, {"from": self.agent_name, "content": content}, timeout)
     def receive(self):
-        # Placeholder: In real system, would pull from shared workspace
+        if self.bus is not None:
+            self._inbox.extend(self.bus.drain(self.agent_name))
         return self._inbox
     def add_message(self, msg):
         self._inbox.append(msg)
@@ -0,0 +1,91 @@
+"""
+Micro-batching: coalesce concurrent calls into one batched call and fan the results back out
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, List, Optional, Sequence
+from agentic_core.deadline import DeadlineExceeded, current_deadline
+
+class MicroBatcher:
+    """Collects items submitted within `window` seconds (up to `max_batch`)
+    and runs them with a single `run_batch(items) -> results` call.
+
+    A batch of one goes to `run_one(item)` instead, so a lone caller pays
+    only the window. Callers may be threads (call) or coroutines on any
+    event loop (acall); batches run on a small thread pool, outside any one
+    caller's deadline, while each caller waits only as long as its own
+    deadline allows. An exception from a batch is raised in every caller.
+    """
+    def __init__(self, run_batch: Callable[[List[Any]], Sequence[Any]], run_one: Optional[Callable[[Any], Any]] = None,
+                 window: float = 0.02, max_batch: int = 8, max_concurrency: int = 8):
+        self.run_batch = run_batch
+        self.run_one = run_one or (lambda item: run_batch([item])[0])
+        self.window = window
+        self.max_batch = max_batch
+        self.stats = {"items": 0, "batches": 0}
+        self._cond = threading.Condition()
+        self._pending: List[tuple] = []
+        self._oldest = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="microbatch")
+        self._flusher: Optional[threading.Thread] = None
+    def submit(self, item) -> Future:
+        future = Future()
+        with self._cond:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name="microbatch-flush")
+                self._flusher.start()
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((item, future))
+            self._cond.notify()
+        return future
+    def call(self, item):
+        deadline = current_deadline()
+        future = self.submit(item)
+        try:
+            return future.result(deadline.remaining() if deadline is not None else None)
+        except FutureTimeout:
+            future.cancel()
+            raise DeadlineExceeded("deadline exceeded waiting for a batch") from None
+    async def acall(self, item):
+        deadline = current_deadline()
+        # Cancelling the wait (timeout, hedging) withdraws the item if its batch has not started
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(self.submit(item)),
+                                          deadline.remaining() if deadline is not None else None)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("deadline exceeded waiting for a batch") from None
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                while len(self._pending) < self.max_batch:
+                    left = self._oldest + self.window - time.monotonic()
+                    if left <= 0:
+                        break
+                    self._cond.wait(left)
+                # Leftovers beyond max_batch have already waited and go out on the next pass
+                batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            self._executor.submit(self._run, batch)
+    def _run(self, batch):
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        with self._cond:
+            self.stats["items"] += len(batch)
+            self.stats["batches"] += 1
+        items = [item for item, _ in batch]
+        try:
+            results = [self.run_one(items[0])] if len(items) == 1 else list(self.run_batch(items))
+            if len(results) != len(items):
+                raise ValueError(f"batch of {len(items)} returned {len(results)} results")
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
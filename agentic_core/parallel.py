@@ -1,8 +1,19 @@
 """
 Parallel execution utilities (thread/process pool, async)
 """
+import contextvars
 from concurrent.futures import ThreadPoolExecutor
 
-def run_parallel(tasks):
-    with ThreadPoolExecutor() as executor:
-        return list(executor.map(lambda t: t(), tasks))
+def run_parallel(tasks, max_workers=None):
+    """Run zero-arg callables concurrently; results come back in task order.
+
+    Each task runs in a copy of the caller's context, so context variables
+    such as the current deadline carry over into the worker threads.
+    """
+    tasks = list(tasks)
+    if len(tasks) <= 1:
+        # Not worth a thread hop for a single task
+        return [t() for t in tasks]
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as executor:
+        contexts = [contextvars.copy_context() for _ in tasks]
+        return list(executor.map(lambda context, t: context.run(t), contexts, tasks))
@@ -0,0 +1,207 @@
+"""
+Rate limiting (token buckets, concurrency caps) and retry with jittered backoff
+"""
+import asyncio
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, Optional
+from .deadline import DeadlineExceeded, check_deadline, current_deadline
+
+RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Allows `per_minute` units per minute with bursts up to one minute's worth.
+
+    reserve() always succeeds and returns how long the caller must wait, so
+    concurrent callers queue up in order instead of spinning on the lock.
+    """
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+    def reserve(self, amount: float = 1.0) -> float:
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class _Limit:
+    def __init__(self, rpm: Optional[float], tpm: Optional[float], concurrency: Optional[int], clock):
+        self.requests = TokenBucket(rpm, clock) if rpm else None
+        self.tokens = TokenBucket(tpm, clock) if tpm else None
+        self.concurrency = threading.BoundedSemaphore(concurrency) if concurrency else None
+        self.paused_until = 0.0
+
+class RateLimiter:
+    """Per-key (model name or host) requests/min, tokens/min and concurrency caps.
+
+    limits maps a key to {"rpm": ..., "tpm": ..., "concurrency": ...}; keys not
+    listed use `default` (None = unlimited).
+    """
+    def __init__(self, limits: Optional[Dict[str, Dict[str, Any]]] = None,
+                 default: Optional[Dict[str, Any]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.limits = dict(limits or {})
+        self.default = default or {}
+        self.clock = clock
+        self._state: Dict[str, _Limit] = {}
+        self._lock = threading.Lock()
+    def _limit(self, key: str) -> _Limit:
+        with self._lock:
+            if key not in self._state:
+                cfg = self.limits.get(key, self.default)
+                self._state[key] = _Limit(cfg.get("rpm"), cfg.get("tpm"), cfg.get("concurrency"), self.clock)
+            return self._state[key]
+    def delay(self, key: str, tokens: int = 0) -> float:
+        """Reserve capacity for one request and return the seconds to wait first."""
+        limit = self._limit(key)
+        wait = max(0.0, limit.paused_until - self.clock())
+        if limit.requests:
+            wait = max(wait, limit.requests.reserve(1))
+        if limit.tokens and tokens:
+            wait = max(wait, limit.tokens.reserve(tokens))
+        return wait
+    def penalize(self, key: str, seconds: float):
+        """Hold back every caller of `key`, e.g. after a 429 with Retry-After."""
+        limit = self._limit(key)
+        limit.paused_until = max(limit.paused_until, self.clock() + seconds)
+    @contextmanager
+    def slot(self, key: str, tokens: int = 0):
+        wait = self.delay(key, tokens)
+        if wait:
+            time.sleep(wait)
+        sem = self._limit(key).concurrency
+        if sem is None:
+            yield
+            return
+        with sem:
+            yield
+    @asynccontextmanager
+    async def aslot(self, key: str, tokens: int = 0):
+        wait = self.delay(key, tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        sem = self._limit(key).concurrency
+        if sem is None:
+            yield
+            return
+        # The semaphore is shared with threads, so poll it instead of blocking the loop
+        while not sem.acquire(blocking=False):
+            await asyncio.sleep(0.01)
+        try:
+            yield
+        finally:
+            sem.release()
+
+def _status_of(obj) -> Optional[int]:
+    status = getattr(obj, "status_code", None)
+    if status is None and getattr(obj, "response", None) is not None:
+        status = getattr(obj.response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+def retry_after(obj) -> Optional[float]:
+    """Seconds from a Retry-After header on a response or API error, if any."""
+    headers = getattr(obj, "headers", None)
+    if headers is None and getattr(obj, "response", None) is not None:
+        headers = getattr(obj.response, "headers", None)
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+def is_transient(exc: BaseException) -> bool:
+    """429/5xx API errors, timeouts and dropped connections are worth retrying."""
+    status = _status_of(exc)
+    if status is not None:
+        return status in RETRY_STATUSES
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    names = [cls.__name__ for cls in type(exc).__mro__]
+    return any(n.endswith(("Timeout", "TimeoutError", "TimeoutException", "ConnectionError", "ConnectError"))
+               for n in names)
+
+class RetryPolicy:
+    """Retries transient failures with full-jitter exponential backoff.
+
+    A Retry-After hint overrides the computed delay and, when a limiter and key
+    are given, pauses that key for every caller to avoid a thundering herd.
+    Responses (not just exceptions) with a retryable status are retried too.
+    Under a deadline (agentic_core.deadline) no retry is started that could
+    not finish in time, and a failure after the deadline passed is raised as
+    DeadlineExceeded.
+    """
+    def __init__(self, max_retries: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+                 rng: Callable[[], float] = random.random):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng
+    def backoff(self, attempt: int, hint: Optional[float] = None) -> float:
+        if hint is not None:
+            return min(hint, self.max_delay)
+        return self.rng() * min(self.max_delay, self.base_delay * (2 ** attempt))
+    def _next_delay(self, attempt: int, outcome, limiter, key) -> Optional[float]:
+        """Delay before retrying `outcome`, or None if it should be returned/raised."""
+        if attempt >= self.max_retries or isinstance(outcome, DeadlineExceeded):
+            return None
+        if isinstance(outcome, BaseException):
+            if not is_transient(outcome):
+                return None
+        elif _status_of(outcome) not in RETRY_STATUSES:
+            return None
+        hint = retry_after(outcome)
+        if hint is not None and limiter is not None and key is not None:
+            limiter.penalize(key, hint)
+        delay = self.backoff(attempt, hint)
+        deadline = current_deadline()
+        left = deadline.remaining() if deadline is not None else None
+        if deadline is not None and (deadline.expired or (left is not None and delay >= left)):
+            return None
+        return delay
+    def _give_up(self, outcome):
+        if isinstance(outcome, BaseException):
+            deadline = current_deadline()
+            if deadline is not None and deadline.expired and not isinstance(outcome, DeadlineExceeded):
+                raise DeadlineExceeded("deadline exceeded") from outcome
+            raise outcome
+        return outcome
+    def call(self, fn: Callable[[], Any], limiter: Optional[RateLimiter] = None, key: Optional[str] = None,
+             sleep: Callable[[float], None] = time.sleep) -> Any:
+        attempt = 0
+        while True:
+            try:
+                check_deadline()
+                outcome = fn()
+            except Exception as e:
+                outcome = e
+            delay = self._next_delay(attempt, outcome, limiter, key)
+            if delay is None:
+                return self._give_up(outcome)
+            if not isinstance(outcome, BaseException) and hasattr(outcome, "close"):
+                outcome.close()  # a streamed response being retried would otherwise hold its connection
+            sleep(delay)
+            attempt += 1
+    async def acall(self, fn: Callable[[], Any], limiter: Optional[RateLimiter] = None,
+                    key: Optional[str] = None) -> Any:
+        """Async counterpart of call(); `fn()` returns an awaitable."""
+        attempt = 0
+        while True:
+            try:
+                check_deadline()
+                outcome = await fn()
+            except Exception as e:
+                outcome = e
+            delay = self._next_delay(attempt, outcome, limiter, key)
+            if delay is None:
+                return self._give_up(outcome)
+            if not isinstance(outcome, BaseException) and hasattr(outcome, "aclose"):
+                await outcome.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
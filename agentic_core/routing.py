@@ -8,3 +8,7 @@ def default_routing_fn(current_agent, answer, workspace):
     if idx + 1 < len(pipeline):
         return pipeline[idx + 1]
     return None
+
+def linear_dag(pipeline):
+    # Express a linear pipeline as DAG dependencies (each agent consumes the previous one)
+    return {name: ([pipeline[i - 1]] if i else []) for i, name in enumerate(pipeline)}
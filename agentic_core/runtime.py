@@ -0,0 +1,75 @@
+"""
+Shared event loop for the blocking wrappers, and cleanup of pooled clients bound to a loop
+"""
+import asyncio
+import atexit
+import threading
+from typing import Awaitable, Callable, List
+
+_closers: List[Callable[[asyncio.AbstractEventLoop], Awaitable[None]]] = []
+_loop = None
+_thread = None
+_lock = threading.Lock()
+
+def on_loop_close(closer):
+    """Register `closer(loop)`, a coroutine function releasing what was pooled for `loop` (usable as a decorator)."""
+    _closers.append(closer)
+    return closer
+
+async def aclose_loop_clients():
+    """Close the running loop's pooled clients. run_sync() does this at exit; code
+    that runs the async API under its own asyncio.run() should await it last."""
+    loop = asyncio.get_running_loop()
+    for closer in _closers:
+        try:
+            await closer(loop)
+        except Exception:
+            pass  # a client that fails to close must not stop the others
+
+def _shared_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="agentic-loop", daemon=True)
+            _thread.start()
+        return _loop
+
+def run_sync(coro):
+    """Run `coro` to completion from synchronous code and return its result.
+
+    Like asyncio.run(), but all calls share one long-lived loop on a
+    background thread, so pooled LLM/HTTP clients and their keep-alive
+    connections are reused across goals (and closed at exit). The caller's
+    context variables (deadline, trace span) carry over into `coro`.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from a running event loop; await the coroutine instead")
+    future = asyncio.run_coroutine_threadsafe(coro, _shared_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()  # e.g. KeyboardInterrupt: do not leave the goal running in the background
+        raise
+
+@atexit.register
+def shutdown(timeout: float = 5.0):
+    """Close the shared loop's clients and stop the loop (a later run_sync() starts a new one)."""
+    global _loop
+    with _lock:
+        loop, thread, _loop = _loop, _thread, None
+    if loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(aclose_loop_clients(), loop).result(timeout)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if not thread.is_alive():
+        loop.close()
@@ -0,0 +1,177 @@
+"""
+Process-pool sandbox for untrusted code: pre-warmed workers with CPU, wall-clock, memory and output limits
+"""
+import atexit
+import contextlib
+import io
+import multiprocessing
+import os
+import queue
+import threading
+import types
+from typing import Optional, Tuple
+
+WORKERS = int(os.getenv("AGENTIC_SANDBOX_WORKERS", "2"))
+CPU_SECONDS = float(os.getenv("AGENTIC_SANDBOX_CPU_SECONDS", "5"))
+WALL_SECONDS = float(os.getenv("AGENTIC_SANDBOX_WALL_SECONDS", "10"))
+MEMORY_MB = int(os.getenv("AGENTIC_SANDBOX_MEMORY_MB", "512"))
+MAX_OUTPUT_CHARS = int(os.getenv("AGENTIC_SANDBOX_MAX_OUTPUT", "10000"))
+MAX_INPUT_CHARS = 50000
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, only the wall-clock limit applies
+    resource = None
+
+def _cap(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit] + f"\n... [truncated {len(text) - limit} chars]"
+
+def _set_memory_limit(memory_mb: int):
+    if resource is not None and memory_mb:
+        limit = memory_mb * 1024 * 1024
+        with contextlib.suppress(ValueError, OSError):
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _set_cpu_limit(seconds: float):
+    # RLIMIT_CPU counts the worker's whole lifetime, so allow `seconds` more than used so far
+    if resource is not None and seconds:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = int(usage.ru_utime + usage.ru_stime + seconds) + 1
+        with contextlib.suppress(ValueError, OSError):
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, resource.getrlimit(resource.RLIMIT_CPU)[1]))
+
+def _run_exec(code: str) -> str:
+    namespace = {"__name__": "__sandbox__"}
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        exec(code, namespace)
+    variables = {k: v for k, v in namespace.items()
+                 if not k.startswith("__") and not isinstance(v, types.ModuleType)}
+    parts = [stdout.getvalue().rstrip("\n")] if stdout.getvalue() else []
+    if variables:
+        parts.append(str(variables))
+    return "\n".join(parts) if parts else "[Code executed successfully, no output.]"
+
+JOBS = {"exec": _run_exec}
+
+def _worker_main(conn, memory_mb: int, cpu_seconds: float, max_output: int):
+    _set_memory_limit(memory_mb)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        kind, payload = job
+        _set_cpu_limit(cpu_seconds)
+        try:
+            reply = (True, _cap(JOBS[kind](payload), max_output))
+        except MemoryError:
+            reply = (False, "memory limit exceeded")
+        except BaseException as e:
+            reply = (False, f"{type(e).__name__}: {e}")
+        conn.send(reply)
+
+class _Worker:
+    def __init__(self, ctx, pool: "SandboxPool"):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, daemon=True,
+                                   args=(child, pool.memory_mb, pool.cpu_seconds, pool.max_output_chars))
+        self.process.start()
+        child.close()
+    def kill(self):
+        with contextlib.suppress(Exception):
+            self.process.kill()
+            self.process.join(1)
+        self.conn.close()
+
+class SandboxPool:
+    """Fixed set of worker processes that run tool code away from the agent process.
+
+    Each job runs under a CPU-time limit (RLIMIT_CPU, counted from the job's
+    start), a wall-clock limit (the worker is killed and replaced when it
+    overruns), an address-space limit and an output size cap. Workers are
+    reused between jobs, so the interpreter start-up cost is paid once.
+    """
+    def __init__(self, workers: int = WORKERS, cpu_seconds: float = CPU_SECONDS, wall_seconds: float = WALL_SECONDS,
+                 memory_mb: int = MEMORY_MB, max_output_chars: int = MAX_OUTPUT_CHARS, start_method: Optional[str] = None):
+        self.workers = max(1, workers)
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.memory_mb = memory_mb
+        self.max_output_chars = max_output_chars
+        if start_method is None:
+            # Forking a threaded orchestrator is unsafe; forkserver forks from a clean helper instead
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._ctx = multiprocessing.get_context(start_method)
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all = []
+        self._lock = threading.Lock()
+        self._started = False
+    def start(self) -> "SandboxPool":
+        """Spawn every worker now (otherwise done on first use)."""
+        with self._lock:
+            if not self._started:
+                for _ in range(self.workers):
+                    self._spawn()
+                self._started = True
+        return self
+    def _spawn(self):
+        worker = _Worker(self._ctx, self)
+        self._all.append(worker)
+        self._idle.put(worker)
+    def _replace(self, worker: _Worker):
+        worker.kill()
+        with self._lock:
+            self._all.remove(worker)
+            self._spawn()
+    def run(self, kind: str, payload: str) -> Tuple[bool, str]:
+        """Run a job; returns (ok, output) where output is the error text when ok is False."""
+        if len(payload) > MAX_INPUT_CHARS:
+            return False, f"input larger than {MAX_INPUT_CHARS} chars"
+        self.start()
+        worker = self._idle.get()
+        try:
+            worker.conn.send((kind, payload))
+            if not worker.conn.poll(self.wall_seconds):
+                self._replace(worker)
+                worker = None
+                return False, f"timed out after {self.wall_seconds:g}s"
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            # The worker died mid-job: SIGXCPU from the CPU limit, or killed by the OS
+            self._replace(worker)
+            worker = None
+            return False, f"worker exceeded its resource limits (cpu {self.cpu_seconds:g}s, memory {self.memory_mb} MB)"
+        finally:
+            if worker is not None:
+                self._idle.put(worker)
+    def shutdown(self):
+        with self._lock:
+            for worker in self._all:
+                with contextlib.suppress(Exception):
+                    worker.conn.send(None)
+                worker.kill()
+            self._all = []
+            self._idle = queue.Queue()
+            self._started = False
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> SandboxPool:
+    """Process-wide sandbox pool configured from AGENTIC_SANDBOX_* env vars."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SandboxPool()
+                atexit.register(_pool.shutdown)
+    return _pool
+
+def run_code(code: str) -> str:
+    ok, output = get_pool().run("exec", code)
+    return output if ok else f"[Code execution error: {output}]"
@@ -0,0 +1,267 @@
+"""
+Long-term semantic memory: embed past tool results and answers, retrieve the top-k relevant ones
+"""
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# numpy is optional (the pure-Python paths are fine for a few thousand items) and
+# imported on first use rather than at import time, since it is slow to load
+_np = False
+
+def _numpy():
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+class HashingEmbedder:
+    """Offline embedder: signed feature hashing of words and word bigrams, L2-normalised.
+
+    Deterministic across processes and needs no model or network, so it works
+    in tests and air-gapped runs; swap in a real embedding model for better recall.
+    """
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+    def _features(self, text: str) -> Dict[int, float]:
+        words = _WORD.findall(text.lower())
+        features: Dict[int, float] = {}
+        for token in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+            h = zlib.crc32(token.encode("utf-8"))
+            index = h % self.dim
+            features[index] = features.get(index, 0.0) + (1.0 if (h >> 31) & 1 else -1.0)
+        return features
+    def __call__(self, texts: Sequence[str]):
+        """Embed a batch; returns an (n, dim) float32 array with numpy, else a list of lists."""
+        np = _numpy()
+        if np is not None:
+            matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+            for row, text in enumerate(texts):
+                for index, value in self._features(text).items():
+                    matrix[row, index] = value
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            return matrix / np.where(norms == 0, 1, norms)
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dim
+            for index, value in self._features(text).items():
+                vector[index] = value
+            norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+            vectors.append([v / norm for v in vector])
+        return vectors
+
+class FlatIndex:
+    """Exact inner-product search over normalised vectors.
+
+    With numpy, vectors live in one preallocated float32 matrix (grown by
+    doubling) and queries are scored with a single batched matrix product.
+    """
+    def __init__(self, dim: int):
+        self.dim = dim
+        self._np = _numpy()
+        self.reset()
+    def __len__(self):
+        return self.size
+    def reset(self):
+        """Drop every vector (used to rebuild the index after eviction)."""
+        np = self._np
+        self.size = 0
+        self._matrix = np.zeros((64, self.dim), dtype=np.float32) if np is not None else None
+        self._rows: List[List[float]] = []
+    def add(self, vectors):
+        np = self._np
+        if np is None:
+            self._rows.extend(list(v) for v in vectors)
+            self.size = len(self._rows)
+            return
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        needed = self.size + len(vectors)
+        if needed > len(self._matrix):
+            grown = np.zeros((max(needed, 2 * len(self._matrix)), self.dim), dtype=np.float32)
+            grown[:self.size] = self._matrix[:self.size]
+            self._matrix = grown
+        self._matrix[self.size:needed] = vectors
+        self.size = needed
+    def vectors(self):
+        return self._matrix[:self.size] if self._np is not None else self._rows
+    def search(self, queries, k: int) -> List[List[Tuple[int, float]]]:
+        """Top-k (row, score) per query, best first."""
+        if not self.size:
+            return [[] for _ in queries]
+        np = self._np
+        if np is None:
+            return [heapq.nlargest(k, ((row, sum(a * b for a, b in zip(q, vec))) for row, vec in enumerate(self._rows)),
+                                   key=lambda hit: hit[1]) for q in queries]
+        scores = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim) @ self._matrix[:self.size].T
+        return [_top_k(row_scores, np.arange(self.size), k) for row_scores in scores]
+
+def _top_k(scores, ids, k: int) -> List[Tuple[int, float]]:
+    np = _numpy()
+    if len(scores) > k:
+        keep = np.argpartition(-scores, k - 1)[:k]
+        scores, ids = scores[keep], ids[keep]
+    order = np.argsort(-scores)
+    return [(int(ids[i]), float(scores[i])) for i in order]
+
+class IVFIndex(FlatIndex):
+    """Approximate search for large memories (numpy only): vectors are bucketed
+    by k-means into `nlist` cells once `train_after` items exist, and a query
+    scans only its `nprobe` closest cells. Below that size it is a FlatIndex."""
+    def __init__(self, dim: int, nlist: int = 64, nprobe: int = 8, train_after: int = 4096, iterations: int = 10):
+        if _numpy() is None:
+            raise ImportError("IVFIndex requires numpy")
+        super().__init__(dim)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_after = train_after
+        self.iterations = iterations
+        self.reset()
+    def reset(self):
+        super().reset()
+        self.centroids = None
+        self._assignment = self._np.zeros(0, dtype=self._np.int64)
+    def _train(self):
+        np = self._np
+        data = self._matrix[:self.size]
+        rng = np.random.default_rng(0)
+        centroids = data[rng.choice(self.size, self.nlist, replace=False)].copy()
+        for _ in range(self.iterations):
+            labels = np.argmax(data @ centroids.T, axis=1)
+            for cell in range(self.nlist):
+                members = data[labels == cell]
+                if len(members):
+                    mean = members.mean(axis=0)
+                    centroids[cell] = mean / (np.linalg.norm(mean) or 1.0)
+        self.centroids = centroids
+        self._assignment = np.argmax(data @ centroids.T, axis=1)
+    def add(self, vectors):
+        np = self._np
+        start = self.size
+        super().add(vectors)
+        if self.centroids is not None:
+            new = self._matrix[start:self.size]
+            self._assignment = np.concatenate([self._assignment, np.argmax(new @ self.centroids.T, axis=1)])
+        elif self.size >= max(self.train_after, self.nlist):
+            self._train()
+    def search(self, queries, k: int) -> List[List[Tuple[int, float]]]:
+        if self.centroids is None:
+            return super().search(queries, k)
+        np = self._np
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        cells = np.argsort(-(queries @ self.centroids.T), axis=1)[:, :self.nprobe]
+        results = []
+        for query, probe in zip(queries, cells):
+            ids = np.flatnonzero(np.isin(self._assignment, probe))
+            results.append(_top_k(self._matrix[ids] @ query, ids, k) if len(ids) else [])
+        return results
+
+class SemanticMemory:
+    """Items (tool results, final answers, notes) indexed by the question they answer.
+
+    add(text, key=...) embeds `key` (e.g. the search query or goal) and stores
+    `text`; search()/context_for() return the closest items to a new question.
+    When `path` is given, items are appended to a JSONL file and re-indexed on
+    start-up, so memory carries across runs. With `max_items`, the oldest
+    items are evicted (and the file compacted) once the memory is full.
+    """
+    def __init__(self, embedder: Optional[Callable[[Sequence[str]], Any]] = None, path: Optional[str] = None,
+                 index=None, max_chars: int = 8000, max_items: Optional[int] = None):
+        self.embedder = embedder or HashingEmbedder()
+        self.path = path
+        self.max_chars = max_chars
+        self.max_items = max_items
+        self.items: List[Dict[str, Any]] = []
+        self._seen = set()
+        self._index = index
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                loaded = [json.loads(line) for line in f if line.strip()]
+            self._add_items(loaded[-max_items:] if max_items else loaded, persist=False)
+    def __len__(self):
+        return len(self.items)
+    def _digest(self, key: str, text: str) -> str:
+        return hashlib.sha256(f"{key}\x00{text}".encode("utf-8")).hexdigest()
+    def _add_items(self, items: List[Dict[str, Any]], persist: bool) -> int:
+        fresh = []
+        for item in items:
+            digest = self._digest(item["key"], item["text"])
+            if digest not in self._seen:
+                self._seen.add(digest)
+                fresh.append(item)
+        if not fresh:
+            return 0
+        vectors = self.embedder([item["key"] for item in fresh])
+        if self._index is None:
+            self._index = FlatIndex(len(vectors[0]))
+        self._index.add(vectors)
+        self.items.extend(fresh)
+        if persist and self.path:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for item in fresh:
+                    f.write(json.dumps(item, default=str) + "\n")
+        if self.max_items and len(self.items) > self.max_items:
+            self._evict()
+        return len(fresh)
+    def _evict(self):
+        # Drop the oldest quarter at once so the index is rebuilt rarely
+        keep = self.max_items - self.max_items // 4
+        drop = len(self.items) - keep
+        vectors = self._index.vectors()[drop:]
+        vectors = vectors.copy() if hasattr(vectors, "copy") else list(vectors)
+        self.items = self.items[drop:]
+        self._seen = {self._digest(item["key"], item["text"]) for item in self.items}
+        self._index.reset()
+        self._index.add(vectors)
+        if self.path:
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                for item in self.items:
+                    f.write(json.dumps(item, default=str) + "\n")
+            os.replace(tmp, self.path)
+    def add(self, text: str, kind: str = "note", key: Optional[str] = None, **metadata) -> bool:
+        """Remember `text`; returns False if the same (key, text) is already stored."""
+        return self.add_many([dict(metadata, text=text, kind=kind, key=key)]) == 1
+    def add_many(self, items: List[Dict[str, Any]]) -> int:
+        """Batch add of {"text", "kind", "key", ...} dicts (embedded in one call)."""
+        prepared = []
+        for item in items:
+            text = str(item["text"])[:self.max_chars]
+            if text.strip():
+                prepared.append(dict(item, text=text, key=item.get("key") or text, time=item.get("time", time.time())))
+        with self._lock:
+            return self._add_items(prepared, persist=True)
+    def search(self, query: str, k: int = 5, kinds: Optional[Sequence[str]] = None,
+               min_score: float = 0.0, max_age: Optional[float] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """Top-k (score, item) by cosine similarity, best first; `max_age` (seconds) skips older items."""
+        oldest = time.time() - max_age if max_age is not None else None
+        with self._lock:
+            if not self.items:
+                return []
+            # Over-fetch when filtering so the filter still leaves k results
+            fetch = min(len(self.items), k * 4 if kinds or oldest is not None else k)
+            hits = self._index.search(self.embedder([query]), fetch)[0]
+            found = [(score, self.items[row]) for row, score in hits if score >= min_score
+                     and (not kinds or self.items[row]["kind"] in kinds)
+                     and (oldest is None or self.items[row]["time"] >= oldest)]
+        return found[:k]
+    def context_for(self, query: str, k: int = 3, min_score: float = 0.3, max_chars: int = 1500) -> str:
+        """Prompt-ready bullet list of the most relevant items ("" if none qualify)."""
+        lines = []
+        for score, item in self.search(query, k=k, min_score=min_score):
+            label = item["kind"] if item["key"] == item["text"] else f"{item['kind']}: {item['key'][:120]}"
+            lines.append(f"- [{label}] {item['text'][:max_chars // max(k, 1)]}")
+        return "\n".join(lines)
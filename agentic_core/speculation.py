@@ -0,0 +1,136 @@
+"""
+Speculative warm-up for the agent expected to run next in a pipeline
+"""
+import asyncio
+import contextvars
+import re
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from .cache import make_key
+
+PREFETCH_TOOLS = ("wikipedia_search",)
+
+_PHRASE = re.compile(r"\b[A-Z][\w'’-]*(?:\s+[A-Z][\w'’-]*)*")
+_SENTENCE_END = re.compile(r"[.!?:;\n]\s")
+_STOPWORDS = {"a", "an", "and", "as", "at", "but", "by", "for", "from", "he", "her", "his", "however", "i", "if",
+              "in", "it", "its", "of", "on", "or", "our", "she", "so", "that", "the", "their", "there", "these",
+              "they", "this", "those", "to", "we", "what", "when", "which", "while", "with", "you", "step",
+              "final", "answer", "summary", "note", "notes", "output", "overall"}
+
+def candidate_entities(text: str, limit: int = 5) -> List[str]:
+    """Capitalised phrases of `text` most likely to be looked up, most frequent first."""
+    counts, first = {}, {}
+    for i, match in enumerate(_PHRASE.finditer(text)):
+        words = match.group().split()
+        while words and words[0].lower() in _STOPWORDS:
+            words.pop(0)
+        phrase = " ".join(words)
+        if len(phrase) < 3 or phrase.lower() in _STOPWORDS:
+            continue
+        counts[phrase] = counts.get(phrase, 0) + 1
+        first.setdefault(phrase, i)
+    return sorted(counts, key=lambda p: (-counts[p], first[p]))[:limit]
+
+async def _quietly(awaitable):
+    # Speculative work must never fail the pipeline; a miss only costs the wasted call
+    try:
+        return await awaitable
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return None
+
+_joinable: contextvars.ContextVar = contextvars.ContextVar("agentic_speculation", default=None)
+
+@contextmanager
+def joining_prefetches(speculator: Optional["Speculator"]):
+    """Within the block, prefetched() serves the lookups of `speculator` (a confirmed one, or None)."""
+    token = _joinable.set(speculator)
+    try:
+        yield
+    finally:
+        _joinable.reset(token)
+
+def prefetched(tool: str, args: dict) -> Optional[asyncio.Future]:
+    """The confirmed prefetch of `tool(**args)`, finished or still in flight, or None."""
+    speculator = _joinable.get()
+    return speculator.joinable(tool, args) if speculator is not None else None
+
+class Speculator:
+    """Warm-up for the agent predicted to run next, started while the current one works.
+
+    `warm` (run in a thread) prepares what the agent needs before its first
+    call, e.g. its tools' schema payload and lazily imported modules. Text
+    fed in as the current agent's answer streams is scanned for entities at
+    each sentence end, and up to `max_prefetch` of them are looked up ahead
+    of time with `prefetch(tool, args)` for every PREFETCH_TOOLS tool the
+    agent has. `prefetch` must not store its result (None = nothing to keep):
+    resolve() hands the results to `commit(tool, args, result)` (the tool
+    cache and semantic memory) only if routing picked the predicted agent,
+    committing lookups still in flight once they finish, and cancels and
+    discards everything otherwise. Under joining_prefetches() the agent's own
+    identical call awaits a confirmed lookup instead of repeating it.
+    """
+    def __init__(self, agent: str, toolset: Iterable[str], prefetch: Callable[[str, dict], Awaitable[Any]],
+                 warm: Optional[Callable[[], Any]] = None, commit: Optional[Callable[[str, dict, Any], Any]] = None,
+                 tools: Iterable[str] = PREFETCH_TOOLS, max_prefetch: int = 3):
+        self.agent = agent
+        self.tools = [t for t in tools if t in set(toolset)]
+        self.prefetch = prefetch
+        self.commit = commit
+        self.max_prefetch = max_prefetch
+        self.queries: List[str] = []
+        self.confirmed = False
+        self._text, self._scanned = "", 0
+        self._tasks: List[asyncio.Task] = []
+        self._prefetches: Dict[str, Tuple[str, dict, asyncio.Task]] = {}
+        if warm is not None:
+            self._spawn(asyncio.to_thread(warm))
+    def _spawn(self, awaitable) -> asyncio.Task:
+        task = asyncio.ensure_future(_quietly(awaitable))
+        self._tasks.append(task)
+        return task
+    def feed(self, text: str):
+        """on_token callback for the current agent."""
+        if not self.tools or len(self.queries) >= self.max_prefetch:
+            return
+        self._text += text
+        ends = [m.end() for m in _SENTENCE_END.finditer(self._text, self._scanned)]
+        if not ends:
+            return
+        # Only complete sentences: a name cut off mid-stream would be a wasted lookup
+        self._scanned = ends[-1]
+        for entity in candidate_entities(self._text[:self._scanned]):
+            if len(self.queries) >= self.max_prefetch:
+                break
+            if entity not in self.queries:
+                self.queries.append(entity)
+                for tool in self.tools:
+                    args = {"query": entity}
+                    self._prefetches[make_key(tool, args)] = (tool, args, self._spawn(self.prefetch(tool, args)))
+    @property
+    def pending(self) -> int:
+        return sum(not task.done() for task in self._tasks)
+    def resolve(self, next_agent: Optional[str]) -> bool:
+        """True (work committed) if `next_agent` is the predicted one; otherwise cancel()."""
+        if next_agent != self.agent:
+            self.cancel()
+            return False
+        if not self.confirmed:
+            self.confirmed = True
+            for tool, args, task in self._prefetches.values():
+                if task.done():
+                    self._commit(tool, args, task)
+                else:
+                    task.add_done_callback(lambda task, tool=tool, args=args: self._commit(tool, args, task))
+        return True
+    def _commit(self, tool: str, args: dict, task: asyncio.Task):
+        if self.commit is not None and not task.cancelled() and task.result() is not None:
+            self.commit(tool, args, task.result())
+    def joinable(self, tool: str, args: dict) -> Optional[asyncio.Task]:
+        """The lookup of `tool(**args)` if the prediction was confirmed and it was not cancelled."""
+        entry = self._prefetches.get(make_key(tool, args)) if self.confirmed else None
+        return entry[2] if entry is not None and not entry[2].cancelled() else None
+    def cancel(self):
+        for task in self._tasks:
+            task.cancel()
@@ -1,22 +1,256 @@
 """
 Tool base class, registry, dynamic loading
 """
-from typing import Callable, Dict, Any
+import importlib
+import importlib.metadata
+import inspect
+import json
+import threading
+import typing
+from typing import Callable, Dict, Any, List, Optional, Sequence
+from .cache import ToolCache
+
+class ToolArgumentError(ValueError):
+    """Arguments from the model do not match the tool's schema."""
+
+_JSON_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean", list: "array", dict: "object"}
+_PY_TYPES = {"string": str, "integer": int, "number": (int, float), "boolean": bool, "array": list, "object": dict}
+
+def _json_type(annotation) -> Optional[str]:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _json_type(args[0]) if len(args) == 1 else None
+    return _JSON_TYPES.get(origin or annotation)
+
+def schema_from_function(func: Callable, name: Optional[str] = None, description: Optional[str] = None) -> Dict[str, Any]:
+    """OpenAI function schema from a signature: annotated types, defaults, required params.
+
+    Parameters whose names start with "_" are internal and left out.
+    """
+    properties, required = {}, []
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:  # unresolvable forward references: fall back to raw annotations
+        hints = {}
+    for param in inspect.signature(func).parameters.values():
+        if param.name.startswith("_") or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        prop = {}
+        json_type = _json_type(hints.get(param.name, param.annotation))
+        if json_type:
+            prop["type"] = json_type
+        if param.default is param.empty:
+            required.append(param.name)
+        elif param.default is not None:
+            prop["default"] = param.default
+        properties[param.name] = prop
+    doc = (inspect.getdoc(func) or "").split("\n")[0]
+    return {
+        "name": name or func.__name__,
+        "description": description or doc,
+        "parameters": {"type": "object", "properties": properties, "required": required}
+    }
+
 class Tool:
-    def __init__(self, name: str, description: str, func: Callable):
+    def __init__(self, name: str, description: str, func: Callable, cacheable: bool = False,
+                 parameters: Optional[Dict[str, Any]] = None, async_func: Optional[Callable] = None):
         self.name = name
         self.description = description
         self.func = func
+        self.cacheable = cacheable  # Deterministic enough to reuse results for the same args
+        self.async_func = async_func  # Native coroutine variant, if any
+        self.schema = schema_from_function(func, name, description)
+        if parameters is not None:
+            self.schema["parameters"] = parameters
+        params = self.schema["parameters"]
+        self._properties = params.get("properties", {})
+        self._required = params.get("required", [])
+    def validate(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Check model-supplied arguments against the schema; coerces numbers given as strings."""
+        if not isinstance(args, dict):
+            raise ToolArgumentError(f"{self.name} expects an object of arguments")
+        unknown = [k for k in args if k not in self._properties]
+        if unknown:
+            raise ToolArgumentError(f"{self.name} got unexpected argument(s): {', '.join(unknown)}")
+        missing = [k for k in self._required if k not in args]
+        if missing:
+            raise ToolArgumentError(f"{self.name} is missing required argument(s): {', '.join(missing)}")
+        cleaned = dict(args)
+        for key, value in args.items():
+            expected = self._properties[key].get("type")
+            if expected is None or value is None or (isinstance(value, _PY_TYPES[expected])
+                                                      and not (expected != "boolean" and isinstance(value, bool))):
+                continue
+            if expected in ("integer", "number") and isinstance(value, str):
+                try:
+                    cleaned[key] = int(value) if expected == "integer" else float(value)
+                    continue
+                except ValueError:
+                    pass
+            if expected == "string" and isinstance(value, (int, float)):
+                cleaned[key] = str(value)
+                continue
+            raise ToolArgumentError(f"{self.name}: argument {key!r} should be {expected}, got {type(value).__name__}")
+        return cleaned
+
+ENTRY_POINT_GROUP = "agentic_tools"
+
+def load_entry(entry: str) -> Callable:
+    """Resolve an entry-point style reference, "package.module:attribute"."""
+    module_name, _, attr = entry.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attr.split(".") if attr else []:
+        obj = getattr(obj, part)
+    return obj
+
+class LazyTool(Tool):
+    """Tool described by metadata; its module is imported on the first call.
+
+    Listing the tool or building its schema payload imports nothing, so a
+    large catalogue costs nothing at start-up.
+    """
+    def __init__(self, name: str, description: str, entry: str, parameters: Dict[str, Any],
+                 cacheable: bool = False, async_entry: Optional[str] = None):
+        self.name = name
+        self.description = description
+        self.entry = entry
+        self.async_entry = async_entry
+        self.cacheable = cacheable
+        self.schema = {"name": name, "description": description, "parameters": parameters}
+        self._properties = parameters.get("properties", {})
+        self._required = parameters.get("required", [])
+        self._func = None
+        self._async_func = None
+    @property
+    def func(self) -> Callable:
+        if self._func is None:
+            self._func = load_entry(self.entry)
+        return self._func
+    @property
+    def async_func(self) -> Optional[Callable]:
+        if self._async_func is None and self.async_entry:
+            self._async_func = load_entry(self.async_entry)
+        return self._async_func
+    @property
+    def loaded(self) -> bool:
+        return self._func is not None
+
 class ToolRegistry:
+    """The one registry of tools for every agent loop.
+
+    Tool definitions for a given toolset are built once and cached (the
+    cache is invalidated whenever a tool is registered), so agents can ask
+    for their definitions on every LLM call at dict-lookup cost.
+    """
     _tools: Dict[str, Tool] = {}
+    cache: Optional[ToolCache] = None  # Set to a ToolCache to memoize cacheable tools
+    cache_filter: Optional[Callable[[Any], bool]] = None  # Results it rejects (e.g. errors) are not cached
+    _payloads: Dict[Any, Any] = {}
+    _payload_chars: Dict[int, int] = {}  # id(definitions list) -> length of its JSON
+    _lock = threading.Lock()
+    _discovered = set()
     @classmethod
     def register_tool(cls, tool: Tool):
-        cls._tools[tool.name] = tool
+        with cls._lock:
+            cls._tools[tool.name] = tool
+            cls._payloads = {}
+            cls._payload_chars = {}
+    @classmethod
+    def register(cls, func: Callable, name: Optional[str] = None, description: Optional[str] = None, **kwargs) -> Tool:
+        """Register a plain function; the schema is generated from its signature."""
+        tool = Tool(name or func.__name__, description or (inspect.getdoc(func) or "").split("\n")[0], func, **kwargs)
+        cls.register_tool(tool)
+        return tool
+    @classmethod
+    def register_entry(cls, name: str, entry: str, description: str, parameters: Dict[str, Any],
+                       **kwargs) -> LazyTool:
+        tool = LazyTool(name, description, entry, parameters, **kwargs)
+        cls.register_tool(tool)
+        return tool
+    @classmethod
+    def discover(cls, package: str = "tools", override: bool = False) -> List[str]:
+        """Register tools listed in `package`'s TOOLS metadata and in installed
+        "agentic_tools" entry points. Metadata tools stay lazy; entry points
+        without metadata are imported to generate their schema. Existing
+        registrations win unless `override`. Repeat calls for the same package
+        are free. Returns the names added."""
+        if package in cls._discovered and not override:
+            return []
+        cls._discovered.add(package)
+        added = []
+        try:
+            manifest = getattr(importlib.import_module(package), "TOOLS", {})
+        except ImportError:
+            manifest = {}
+        for name, meta in manifest.items():
+            if override or name not in cls._tools:
+                cls.register_entry(name, meta["entry"], meta["description"], meta["parameters"],
+                                   cacheable=meta.get("cacheable", False), async_entry=meta.get("async_entry"))
+                added.append(name)
+        for ep in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+            if override or ep.name not in cls._tools:
+                cls.register(ep.load(), name=ep.name)
+                added.append(ep.name)
+        return added
+    @classmethod
+    def get(cls, name: str) -> Tool:
+        return cls._tools[name]
+    @classmethod
+    def names(cls) -> List[str]:
+        return list(cls._tools)
     @classmethod
     def get_tools(cls, names=None):
         if names is None:
             return list(cls._tools.values())
         return [cls._tools[n] for n in names if n in cls._tools]
     @classmethod
+    def _cached(cls, kind: str, names: Optional[Sequence[str]], build: Callable[[List[Tool]], Any]):
+        key = (kind, None if names is None else tuple(names))
+        payload = cls._payloads.get(key)
+        if payload is None:
+            # Registry order, not request order, so the same toolset always yields the same payload
+            wanted = None if names is None else set(names)
+            tools = [t for t in cls._tools.values() if wanted is None or t.name in wanted]
+            payload = cls._payloads[key] = build(tools)
+        return payload
+    @classmethod
+    def definitions(cls, names: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """`tools` payload for chat completions (shared; do not mutate)."""
+        return cls._cached("definitions", names, cls._build_definitions)
+    @classmethod
+    def _build_definitions(cls, tools: List[Tool]) -> List[Dict[str, Any]]:
+        payload = [{"type": "function", "function": t.schema} for t in tools]
+        cls._payload_chars[id(payload)] = len(json.dumps(payload))
+        return payload
+    @classmethod
+    def payload_chars(cls, definitions: Optional[List[Dict[str, Any]]]) -> int:
+        """Serialized size of a `tools` payload; free for payloads from definitions()."""
+        if not definitions:
+            return 0
+        size = cls._payload_chars.get(id(definitions))
+        return size if size is not None else len(json.dumps(definitions, default=str))
+    @classmethod
+    def describe(cls, names: Optional[Sequence[str]] = None) -> str:
+        """'- name: description' lines for text-prompted (non function-calling) agents."""
+        return cls._cached("describe", names, lambda tools: "\n".join(f"- {t.name}: {t.description}" for t in tools))
+    @classmethod
+    def validate(cls, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        tool = cls._tools.get(name)
+        if tool is None:
+            raise ToolArgumentError(f"Unknown tool {name!r}")
+        return tool.validate(args)
+    @classmethod
+    def parse_arguments(cls, name: str, raw: Optional[str]) -> Dict[str, Any]:
+        """Decode and validate a tool call's JSON arguments string."""
+        try:
+            args = json.loads(raw or "{}")
+        except json.JSONDecodeError as e:
+            raise ToolArgumentError(f"{name} arguments are not valid JSON: {e}") from None
+        return cls.validate(name, args)
+    @classmethod
     def call_tool(cls, name: str, *args, **kwargs) -> Any:
-        return cls._tools[name].func(*args, **kwargs)
+        tool = cls._tools[name]
+        if cls.cache is not None and tool.cacheable and not args:
+            return cls.cache.get_or_call(name, kwargs, lambda: tool.func(**kwargs), should_cache=cls.cache_filter)
+        return tool.func(*args, **kwargs)
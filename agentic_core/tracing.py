@@ -0,0 +1,295 @@
+"""
+Tracing: timed spans for pipelines, agents, LLM calls and tools, exported as JSONL or OTLP/JSON
+
+Set AGENTIC_TRACE_PATH to record spans to a file (AGENTIC_TRACE_FORMAT=otlp for
+OpenTelemetry's OTLP/JSON file format), then summarise where time, tokens and
+money went per goal with:
+
+    python -m agentic_core.tracing traces.jsonl
+"""
+import contextvars
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# Span kinds
+PIPELINE = "pipeline"
+AGENT = "agent"
+LLM = "llm"
+TOOL = "tool"
+HTTP = "http"
+INTERNAL = "internal"
+
+# USD per 1K (prompt, completion) tokens; AGENTIC_PRICES='{"model": [in, out]}' overrides
+PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+    "gpt-3.5-turbo-1106": (0.001, 0.002),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4o": (0.005, 0.015),
+    "gpt-4o-mini": (0.00015, 0.0006),
+}
+PRICES.update({k: tuple(v) for k, v in json.loads(os.getenv("AGENTIC_PRICES", "{}")).items()})
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """Dollar cost of one call, or None for an unknown model (dated variants match their base name)."""
+    price = PRICES.get(model or "")
+    if price is None:
+        matches = [name for name in PRICES if model and model.startswith(name)]
+        if not matches:
+            return None
+        price = PRICES[max(matches, key=len)]
+    return (prompt_tokens * price[0] + completion_tokens * price[1]) / 1000
+
+class Span:
+    """One timed operation; attributes hold what happened (tokens, cache hits, attempts...)."""
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "_t0",
+                 "attributes", "status", "error")
+    def __init__(self, name: str, kind: str, parent: Optional["Span"] = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_ns = time.time_ns()
+        self._t0 = time.perf_counter_ns()
+        self.end_ns = None
+        self.attributes: Dict[str, Any] = {}
+        self.status = "ok"
+        self.error = None
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+    def incr(self, key: str, amount: int = 1):
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+    def fail(self, message: str):
+        self.status = "error"
+        self.error = message
+    def finish(self):
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._t0)
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+    def to_dict(self) -> Dict[str, Any]:
+        return {"trace_id": self.trace_id, "span_id": self.span_id, "parent_id": self.parent_id,
+                "name": self.name, "kind": self.kind, "start": self.start_ns / 1e9, "end": (self.end_ns or 0) / 1e9,
+                "duration_ms": round(self.duration_ms, 3), "status": self.status, "error": self.error,
+                "attributes": self.attributes}
+
+class _NoopSpan:
+    """Stands in for a span when tracing is off, so call sites need no checks."""
+    def set(self, **attributes):
+        pass
+    def incr(self, key: str, amount: int = 1):
+        pass
+    def fail(self, message: str):
+        pass
+
+NOOP_SPAN = _NoopSpan()
+
+class MemoryExporter:
+    """Keeps finished spans in a list (tests, benchmarks)."""
+    def __init__(self):
+        self.spans: List[Span] = []
+    def export(self, span: Span):
+        self.spans.append(span)
+    def close(self):
+        pass
+
+class JSONLExporter:
+    """Appends one JSON object per finished span (Span.to_dict()) to `path`."""
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+    def encode(self, span: Span) -> Dict[str, Any]:
+        return span.to_dict()
+    def export(self, span: Span):
+        line = json.dumps(self.encode(span), default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+_OTLP_KIND = {PIPELINE: 1, AGENT: 1, INTERNAL: 1, LLM: 3, TOOL: 1, HTTP: 3}  # INTERNAL, CLIENT
+
+def _otlp_value(value) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value if isinstance(value, str) else json.dumps(value, default=str)}
+
+class OTLPJSONExporter(JSONLExporter):
+    """OpenTelemetry OTLP/JSON lines, the format of the collector's file
+    exporter/receiver: one ExportTraceServiceRequest per span."""
+    def __init__(self, path: str, service: str = "agentic"):
+        super().__init__(path)
+        self.service = service
+    def encode(self, span: Span) -> Dict[str, Any]:
+        otlp = {
+            "traceId": span.trace_id, "spanId": span.span_id, "name": span.name,
+            "kind": _OTLP_KIND.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns), "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)}
+                           for k, v in dict(span.attributes, **{"agentic.kind": span.kind}).items() if v is not None],
+            "status": {"code": 2, "message": span.error or ""} if span.status == "error" else {"code": 1},
+        }
+        if span.parent_id:
+            otlp["parentSpanId"] = span.parent_id
+        return {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service}}]},
+            "scopeSpans": [{"scope": {"name": "agentic"}, "spans": [otlp]}],
+        }]}
+
+_current: contextvars.ContextVar = contextvars.ContextVar("agentic_span", default=None)
+
+def current_span():
+    """The innermost open span (a no-op stand-in when there is none)."""
+    span = _current.get()
+    return span if span is not None else NOOP_SPAN
+
+class Tracer:
+    """Creates spans and hands them to an exporter when they end.
+
+    With no exporter, tracing is off and span() costs one attribute check.
+    Spans nest through a context variable, so asyncio tasks and worker
+    threads started with a copied context (run_parallel, call_with_timeout)
+    parent correctly.
+    """
+    def __init__(self, exporter=None):
+        self.exporter = exporter
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+    @contextmanager
+    def span(self, name: str, kind: str = INTERNAL, **attributes):
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+        span = Span(name, kind, _current.get())
+        span.attributes.update(attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.fail(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current.reset(token)
+            span.finish()
+            self.exporter.export(span)
+
+def _exporter_from_env():
+    path = os.getenv("AGENTIC_TRACE_PATH")
+    if not path:
+        return None
+    if os.getenv("AGENTIC_TRACE_FORMAT", "jsonl").lower() == "otlp":
+        return OTLPJSONExporter(path)
+    return JSONLExporter(path)
+
+tracer = Tracer(_exporter_from_env())
+
+def span(name: str, kind: str = INTERNAL, **attributes):
+    """Context manager for a span on the process-wide tracer."""
+    return tracer.span(name, kind, **attributes)
+
+def traced(kind: str, name: Union[str, Callable[..., str], None] = None):
+    """Decorator running a function or coroutine inside a span; `name` may be
+    a callable taking the function's arguments."""
+    def decorate(func):
+        def span_name(args, kwargs):
+            return name(*args, **kwargs) if callable(name) else (name or func.__qualname__)
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with tracer.span(span_name(args, kwargs), kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name(args, kwargs), kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def record_usage(span, response, model: Optional[str]):
+    """Copy token usage (and its estimated cost) from a chat completion onto `span`."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    prompt = getattr(usage, "prompt_tokens", 0) or 0
+    completion = getattr(usage, "completion_tokens", 0) or 0
+    span.set(prompt_tokens=prompt, completion_tokens=completion, cost_usd=estimate_cost(model, prompt, completion))
+
+# --- ANALYSIS ---
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """Spans from a JSONL trace file (the default format)."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def busy_ms(spans: Iterable[Dict[str, Any]]) -> float:
+    """Wall time covered by the spans, counting overlapping (parallel) spans once."""
+    total, end = 0.0, None
+    for start, stop in sorted((s["start"], s["end"]) for s in spans):
+        if end is None or start > end:
+            total += stop - start
+            end = stop
+        elif stop > end:
+            total += stop - end
+            end = stop
+    return total * 1000
+
+def summarize_traces(spans: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Per-trace (per-goal) totals: wall time, time in LLM calls and tools,
+    the remaining orchestration time, tokens, cost, cache hits and retries."""
+    traces: Dict[str, List[Dict[str, Any]]] = {}
+    for s in spans:
+        traces.setdefault(s["trace_id"], []).append(s)
+    summaries = []
+    for trace_id, members in traces.items():
+        root = next((s for s in members if not s["parent_id"]), max(members, key=lambda s: s["duration_ms"]))
+        llm = [s for s in members if s["kind"] == LLM]
+        tools = [s for s in members if s["kind"] == TOOL]
+        attrs = [s["attributes"] for s in llm]
+        costs = [a.get("cost_usd") for a in attrs if a.get("cost_usd") is not None]
+        summaries.append({
+            "trace_id": trace_id, "name": root["name"], "goal": root["attributes"].get("goal"),
+            "duration_ms": root["duration_ms"], "llm_ms": busy_ms(llm), "tool_ms": busy_ms(tools),
+            "orchestration_ms": max(0.0, root["duration_ms"] - busy_ms(llm + tools)),
+            "llm_calls": len(llm), "tool_calls": len(tools),
+            "prompt_tokens": sum(a.get("prompt_tokens", 0) for a in attrs),
+            "completion_tokens": sum(a.get("completion_tokens", 0) for a in attrs),
+            "cost_usd": sum(costs) if costs else None,
+            "llm_cache_hits": sum(1 for a in attrs if a.get("cache_hit")),
+            "tool_cache_hits": sum(1 for s in tools if s["attributes"].get("source") in ("cache", "memory")),
+            "retries": sum(max(0, s["attributes"].get("attempts", 1) - 1) for s in members),
+            "errors": sum(1 for s in members if s["status"] == "error"),
+        })
+    return summaries
+
+def main(argv=None):
+    path = (argv or sys.argv[1:] or [os.getenv("AGENTIC_TRACE_PATH", "")])[0]
+    print(f"{'trace':18} {'total ms':>9} {'llm ms':>8} {'tool ms':>8} {'orch ms':>8} {'llm':>4} {'tools':>5} "
+          f"{'tokens':>7} {'cost $':>8} {'hits':>5} {'retry':>5}  goal")
+    for t in summarize_traces(load_spans(path)):
+        cost = f"{t['cost_usd']:.4f}" if t["cost_usd"] is not None else "-"
+        print(f"{t['name'][:18]:18} {t['duration_ms']:9.0f} {t['llm_ms']:8.0f} {t['tool_ms']:8.0f} "
+              f"{t['orchestration_ms']:8.0f} {t['llm_calls']:4} {t['tool_calls']:5} "
+              f"{t['prompt_tokens'] + t['completion_tokens']:7} {cost:>8} "
+              f"{t['llm_cache_hits'] + t['tool_cache_hits']:5} {t['retries']:5}  {(t['goal'] or '')[:60]}")
+
+if __name__ == "__main__":
+    main()
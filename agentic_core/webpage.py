@@ -0,0 +1,198 @@
+"""
+Bounded, incremental web page reading: charset-aware decoding, HTML to main text, pagination
+"""
+import codecs
+import re
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Optional, Tuple
+
+TEXT_TYPES = ("text/", "application/xhtml+xml", "application/xml", "application/json", "application/ld+json")
+_SKIP = {"script", "style", "noscript", "template", "svg", "canvas", "iframe", "nav", "footer", "aside", "form",
+         "button", "select", "head"}
+_BLOCK = {"p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "table", "section",
+          "article", "main", "header", "blockquote", "pre", "dd", "dt", "figcaption", "hr", "td", "th"}
+_MAIN = {"main", "article"}
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.I)
+_SPACES = re.compile(r"[ \t\r\f\v\xa0]+")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+SNIFF_BYTES = 1024  # how much of an HTML body to buffer while looking for <meta charset>
+MIN_MAIN_CHARS = 200  # a <main>/<article> shorter than this is probably not the page's content
+
+def parse_content_type(header: Optional[str]) -> Tuple[str, Optional[str]]:
+    """(media type, charset or None) from a Content-Type header."""
+    parts = [p.strip() for p in (header or "").split(";")]
+    charset = next((p.split("=", 1)[1].strip("\"' ") for p in parts[1:] if p.lower().startswith("charset=")), None)
+    return parts[0].lower(), charset
+
+def is_text_type(media_type: str) -> bool:
+    return not media_type or media_type.startswith(TEXT_TYPES) or media_type.endswith(("+xml", "+json"))
+
+def _normalize(text: str) -> str:
+    lines = (_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n", "\n".join(line for line in lines if line)).strip()
+
+class _MainText(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts, self.main_parts = [], []
+        self.title, self.chars, self.main_chars = "", 0, 0
+        self.saw_main = False
+        self._skip = self._main = 0
+        self._in_title = False
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self._skip = 0  # an unclosed <head> must not swallow the page
+        elif tag == "title":
+            self._in_title = True
+        elif tag in _SKIP:
+            self._skip += 1
+        elif tag in _MAIN:
+            self._main += 1
+            self.saw_main = True
+        if tag in _BLOCK:
+            self._text("\n")
+    def handle_startendtag(self, tag, attrs):
+        if tag in _BLOCK:
+            self._text("\n")
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag in _SKIP and self._skip:
+            self._skip -= 1
+        if tag in _BLOCK:
+            self._text("\n")
+        if tag in _MAIN and self._main:
+            self._main -= 1
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip:
+            self._text(data)
+    def _text(self, data):
+        self.parts.append(data)
+        self.chars += len(data)
+        if self._main:
+            self.main_parts.append(data)
+            self.main_chars += len(data)
+    def text(self) -> str:
+        main = _normalize("".join(self.main_parts))
+        body = main if len(main) >= MIN_MAIN_CHARS else _normalize("".join(self.parts))
+        title = _normalize(self.title)
+        return f"{title}\n\n{body}" if title and body else title or body
+
+class PageExtractor:
+    """Feed raw body chunks as they arrive; stops wanting more once it has
+    `max_chars` of text or has read `max_bytes`.
+
+    Bytes are decoded incrementally with the charset from the Content-Type
+    header (or an HTML <meta charset>, else UTF-8), and HTML is reduced to
+    its readable text: scripts, styles, navigation and forms are dropped,
+    and a <main>/<article> element is preferred when the page has one.
+    """
+    def __init__(self, content_type: Optional[str] = None, max_chars: int = 2000, max_bytes: int = 1_000_000):
+        self.media_type, self.charset = parse_content_type(content_type)
+        self.is_html = self.media_type in ("", "text/html", "application/xhtml+xml")
+        self.max_chars = max_chars
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.truncated = False  # stopped before the end of the body
+        self._decoder = None
+        self._head = b""
+        self._parser = _MainText() if self.is_html else None
+        self._plain = []
+        self._plain_chars = 0
+        self._extracted = 0
+        self._measure_at = max_chars
+    def _decoder_for(self, head: bytes):
+        charset = self.charset
+        if charset is None and self.is_html:
+            match = _META_CHARSET.search(head)
+            charset = match.group(1).decode("ascii", "ignore") if match else None
+        try:
+            codecs.lookup(charset or "utf-8")
+        except LookupError:
+            charset = None
+        return codecs.getincrementaldecoder(charset or "utf-8")(errors="replace")
+    @property
+    def chars(self) -> int:
+        """Characters of extracted text so far, counted as text() returns them (whitespace collapsed)."""
+        if self._parser is None:
+            return self._plain_chars
+        raw = self._parser.chars
+        if raw >= self._measure_at:
+            # Extracting is O(n), so measure again only once the raw text could cover the shortfall
+            self._extracted = len(self._parser.text())
+            self._measure_at = raw + max(self.max_chars - self._extracted, raw // 4)
+        return self._extracted
+    @property
+    def done(self) -> bool:
+        return self.chars >= self.max_chars or self.bytes_read >= self.max_bytes
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; True once enough has been read (the caller should stop and close)."""
+        chunk = chunk[:max(0, self.max_bytes - self.bytes_read)]
+        self.bytes_read += len(chunk)
+        if self._decoder is None:
+            self._head += chunk
+            if self.charset is None and self.is_html and len(self._head) < SNIFF_BYTES and not self.done:
+                return False
+            self._decoder = self._decoder_for(self._head)
+            chunk, self._head = self._head, b""
+        self._write(self._decoder.decode(chunk))
+        if self.done:
+            self.truncated = True
+        return self.done
+    def _write(self, text: str):
+        if self._parser is not None:
+            self._parser.feed(text)
+        else:
+            self._plain.append(text)
+            self._plain_chars += len(text)
+    def text(self) -> str:
+        """The text read so far (call once, after the last chunk)."""
+        if self._decoder is None and self._head:
+            self._decoder = self._decoder_for(self._head)
+            self._write(self._decoder.decode(self._head))
+        if self._decoder is not None:
+            self._write(self._decoder.decode(b"", final=True))
+        if self._parser is not None:
+            if self.truncated:
+                self._parser.rawdata = ""  # a tag cut off mid-stream; close() would emit it as text
+            else:
+                self._parser.close()
+            return self._parser.text()
+        return "".join(self._plain).strip()
+
+def paginate(text: str, page: int, page_chars: int, complete: bool) -> str:
+    """Page `page` (1-based) of `text`, with a note on how to get the next one."""
+    pages = max(1, -(-len(text) // page_chars))
+    if page < 1 or page > pages:
+        return f"[No page {page}: the document has {pages}{'' if complete else '+'} page(s).]"
+    chunk = text[(page - 1) * page_chars:page * page_chars]
+    if page < pages or not complete:
+        total = f"{pages}" if complete else f"{pages}+"
+        chunk += f"\n\n[Page {page} of {total}; call url_reader with page={page + 1} for more.]"
+    return chunk
+
+class DocumentCache:
+    """Small LRU of extracted documents: url -> (text, complete), so follow-up
+    pages are served without downloading the start of the page again."""
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._docs: "OrderedDict[str, Tuple[str, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+    def get(self, url: str, chars_needed: int) -> Optional[Tuple[str, bool]]:
+        """The cached document if it covers `chars_needed` characters (or is complete)."""
+        with self._lock:
+            doc = self._docs.get(url)
+            if doc is None or (not doc[1] and len(doc[0]) < chars_needed):
+                return None
+            self._docs.move_to_end(url)
+            return doc
+    def put(self, url: str, text: str, complete: bool):
+        with self._lock:
+            self._docs[url] = (text, complete)
+            self._docs.move_to_end(url)
+            while len(self._docs) > self.max_entries:
+                self._docs.popitem(last=False)
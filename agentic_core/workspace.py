@@ -0,0 +1,243 @@
+"""
+Shared workspace for concurrent pipelines: lock-striped shards, per-key versions, CAS and cheap snapshots
+"""
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .memory import LAZY_THRESHOLD, LazyValue, SQLiteBackend
+
+def _load(value):
+    return value.load() if isinstance(value, LazyValue) else value
+
+class _Shard:
+    __slots__ = ("lock", "data", "versions", "frozen", "owned")
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data: Dict[str, Any] = {}
+        self.versions: Dict[str, int] = {}
+        self.frozen = False  # `data` is referenced by a snapshot; copy before writing
+        self.owned = set()   # list values this shard created and may append to in place
+    def thaw(self):
+        self.data = dict(self.data)
+        self.owned = set()
+        self.frozen = False
+    def write(self, key, value) -> int:
+        if self.frozen:
+            self.thaw()
+        self.data[key] = value
+        self.owned.discard(key)
+        version = self.versions[key] = self.versions.get(key, 0) + 1
+        return version
+
+class Snapshot(Mapping):
+    """Read-only, point-in-time view of a ShardedWorkspace.
+
+    Taking one is O(number of shards): the shard dicts are shared with the
+    workspace and only copied by the next write that touches them.
+    """
+    def __init__(self, shards: List[Dict[str, Any]]):
+        self._shards = shards
+    def __getitem__(self, key):
+        return _load(self._shards[hash(key) % len(self._shards)][key])
+    def __iter__(self) -> Iterator[str]:
+        for data in self._shards:
+            yield from data
+    def __len__(self):
+        return sum(len(data) for data in self._shards)
+    def __repr__(self):
+        return f"Snapshot({dict(self)!r})"
+
+class ShardedWorkspace:
+    """Drop-in replacement for the single-lock Workspace.
+
+    Keys are spread over `shards` independently locked dicts, so writers to
+    different keys rarely contend. Every write bumps the key's version, which
+    compare_and_set() uses for optimistic updates. Lists built by append() are
+    copied on the first append after a snapshot, so snapshots never change.
+
+    With a `store` (an agentic_core.memory backend such as SQLiteBackend) the
+    workspace loads its contents from it and writes every change through, so
+    a restarted pipeline can resume; checkpoint()/restore() save and roll
+    back the whole workspace mid-run. Values of at least the store's
+    `lazy_threshold` are not kept in memory: the workspace holds a LazyValue
+    and reads the value from the store on every access.
+    """
+    def __init__(self, shards: int = 16, store=None):
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._count = len(self._shards)
+        self.store = store
+        self._lazy_threshold = getattr(store, "lazy_threshold", None)
+        if store is not None:
+            self._reload()
+    def _reload(self):
+        """Replace the in-memory contents with the store's, bumping versions of every affected key.
+        Callers other than __init__ must hold every shard lock."""
+        contents = self.store.all(lazy=True)
+        for shard in self._shards:
+            if shard.frozen:
+                shard.thaw()
+            for key in list(shard.data):
+                if key not in contents:
+                    del shard.data[key]
+                    shard.versions[key] = shard.versions.get(key, 0) + 1
+            shard.owned.clear()
+        for key, value in contents.items():
+            shard = self._shard(key)
+            shard.data[key] = value
+            shard.versions[key] = shard.versions.get(key, 0) + 1
+    def _shard(self, key) -> _Shard:
+        return self._shards[hash(key) % self._count]
+    def _preserve(self, shard: _Shard, key):
+        # A snapshot holding a LazyValue would read the store after the write; give it the value first
+        if shard.frozen and isinstance(shard.data.get(key), LazyValue):
+            shard.data[key] = shard.data[key].load()
+    def _write_through(self, shard: _Shard, key, value):
+        """Store `value`; returns what to keep in memory (a LazyValue for large values)."""
+        self._preserve(shard, key)
+        size = self.store.set(key, value)
+        if self._lazy_threshold and size and size >= self._lazy_threshold:
+            return LazyValue(self.store, key, size)
+        return value
+    def get(self, key, default=None):
+        shard = self._shard(key)
+        with shard.lock:
+            return _load(shard.data.get(key, default))
+    def get_versioned(self, key, default=None) -> Tuple[Any, int]:
+        """(value, version); version is 0 for a key that was never written."""
+        shard = self._shard(key)
+        with shard.lock:
+            return _load(shard.data.get(key, default)), shard.versions.get(key, 0)
+    def version(self, key) -> int:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.versions.get(key, 0)
+    def set(self, key, value) -> int:
+        shard = self._shard(key)
+        with shard.lock:
+            if self.store is not None:
+                value = self._write_through(shard, key, value)
+            return shard.write(key, value)
+    def compare_and_set(self, key, expected_version: int, value) -> bool:
+        """Write `value` only if the key is still at `expected_version`."""
+        shard = self._shard(key)
+        with shard.lock:
+            if shard.versions.get(key, 0) != expected_version:
+                return False
+            if self.store is not None:
+                value = self._write_through(shard, key, value)
+            shard.write(key, value)
+            return True
+    def append(self, key, value) -> int:
+        """Atomically append to the list at `key` (created if missing, TypeError if not a list); returns its length."""
+        shard = self._shard(key)
+        with shard.lock:
+            self._preserve(shard, key)
+            owned = key in shard.owned and not shard.frozen  # a snapshot's lists are never appended to
+            existing = None if owned else _load(shard.data.get(key, []))
+            if existing is not None and not isinstance(existing, list):
+                raise TypeError(f"Cannot append to non-list value at {key!r}")
+            if self.store is not None:  # first, so a failed write leaves memory as it was
+                self.store.append(key, value)
+            if shard.frozen:
+                shard.thaw()
+            if owned:
+                items = shard.data[key]
+                items.append(value)
+            else:
+                items = shard.data[key] = existing + [value]
+                shard.owned.add(key)
+            shard.versions[key] = shard.versions.get(key, 0) + 1
+            return len(items)
+    def update(self, key, fn: Callable[[Any], Any], default=None) -> Any:
+        """Atomically replace the value with fn(current) and return it."""
+        shard = self._shard(key)
+        with shard.lock:
+            value = fn(_load(shard.data.get(key, default)))
+            shard.write(key, self._write_through(shard, key, value) if self.store is not None else value)
+            return value
+    def delete(self, key) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            if key not in shard.data:
+                return False
+            if self.store is not None:
+                self._preserve(shard, key)
+                self.store.delete(key)
+            if shard.frozen:
+                shard.thaw()
+            del shard.data[key]
+            shard.owned.discard(key)
+            shard.versions[key] = shard.versions.get(key, 0) + 1
+            return True
+    def _lock_all(self):
+        # Always in shard order, so concurrent whole-workspace operations cannot deadlock
+        for shard in self._shards:
+            shard.lock.acquire()
+    def _unlock_all(self):
+        for shard in reversed(self._shards):
+            shard.lock.release()
+    def snapshot(self) -> Snapshot:
+        """Consistent read-only view; later writes copy the shard they touch first."""
+        self._lock_all()
+        try:
+            for shard in self._shards:
+                shard.frozen = True
+            return Snapshot([shard.data for shard in self._shards])
+        finally:
+            self._unlock_all()
+    def all(self) -> Dict[str, Any]:
+        """Consistent shallow copy as a plain dict (same contract as the old Workspace.all())."""
+        merged: Dict[str, Any] = {}
+        self._lock_all()
+        try:
+            for shard in self._shards:
+                merged.update((key, _load(value)) for key, value in shard.data.items())
+        finally:
+            self._unlock_all()
+        return merged
+    def checkpoint(self, label: str):
+        if self.store is None:
+            raise RuntimeError("checkpoint() needs a workspace created with a store")
+        self._lock_all()
+        try:
+            self.store.checkpoint(label)
+        finally:
+            self._unlock_all()
+    def restore(self, label: str):
+        if self.store is None:
+            raise RuntimeError("restore() needs a workspace created with a store")
+        self._lock_all()
+        try:
+            for shard in self._shards:
+                for key in list(shard.data):
+                    self._preserve(shard, key)
+            self.store.restore(label)
+            self._reload()
+        finally:
+            self._unlock_all()
+    def checkpoints(self) -> List[str]:
+        return self.store.checkpoints() if self.store is not None else []
+
+def persistent_workspace(path: str, namespace: str = "default", shards: int = 16,
+                         lazy_threshold: int = LAZY_THRESHOLD) -> ShardedWorkspace:
+    """Workspace backed by a SQLite file; reopening the same path/namespace resumes it.
+    Values of `lazy_threshold` bytes or more stay on disk until read."""
+    return ShardedWorkspace(shards, store=SQLiteBackend(path, namespace, lazy_threshold=lazy_threshold))
+
+class LockedWorkspace:
+    """The original single-lock workspace, kept as a baseline for benchmarks."""
+    def __init__(self):
+        self.memory: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+    def get(self, key, default=None):
+        with self.lock:
+            return self.memory.get(key, default)
+    def set(self, key, value):
+        with self.lock:
+            self.memory[key] = value
+    def append(self, key, value):
+        with self.lock:
+            self.memory.setdefault(key, []).append(value)
+    def all(self):
+        with self.lock:
+            return dict(self.memory)
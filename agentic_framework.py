@@ -1,42 +1,427 @@
 import os
 import json
-import requests
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from dotenv import load_dotenv
-import openai
 from datetime import datetime
+from agentic_core.parallel import run_parallel
+from agentic_core.cache import ToolCache
+from agentic_core.llm_cache import CompletionCache
+from agentic_core.ratelimit import RateLimiter, RetryPolicy
+from agentic_core.deadline import (
+    DeadlineExceeded, LatencyTracker, cap_timeout, call_with_timeout, acall_with_timeout, deadline_scope
+)
+from agentic_core.http import get_session, get_async_http_client, default_timeout
+from agentic_core.runtime import on_loop_close
+from agentic_core.tracing import span, traced, current_span, record_usage, PIPELINE, AGENT, LLM, TOOL, HTTP
+from agentic_core.events import emit, iter_events, TOKEN, TOOL_START, TOOL_END, FINAL
+from agentic_core.context import ContextManager
+from agentic_core.semantic_memory import SemanticMemory
+from agentic_core.speculation import prefetched
+from agentic_core.arithmetic import calculate
+from agentic_core.microbatch import MicroBatcher
+from agentic_core.webpage import DocumentCache, PageExtractor, is_text_type, paginate, parse_content_type
+from agentic_core.tool import ToolRegistry, ToolArgumentError
 
 load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
 SERPER_API_KEY = os.getenv("SERPER_API_KEY")
+# Upper bound on tools run concurrently for a single multi-tool turn
+MAX_TOOL_WORKERS = int(os.getenv("AGENTIC_MAX_TOOL_WORKERS", "4"))
+# Prompt token budget per agent; older turns are compacted to stay under it
+MAX_CONTEXT_TOKENS = int(os.getenv("AGENTIC_MAX_CONTEXT_TOKENS", "12000"))
+CONTEXT_SUMMARIES = os.getenv("AGENTIC_CONTEXT_SUMMARIES", "").lower() in ("1", "true", "yes")
+
+def _env_number(name: str):
+    value = os.getenv(name)
+    return float(value) if value else None
+
+# --- RATE LIMITS & RETRIES ---
+# Shared by every agent loop and tool in the process. Keys are model names for
+# completions and hostnames for HTTP tools; unset limits mean unlimited.
+rate_limiter = RateLimiter(default={
+    "rpm": _env_number("AGENTIC_RPM"),
+    "tpm": _env_number("AGENTIC_TPM"),
+    "concurrency": int(_env_number("AGENTIC_MAX_CONCURRENCY") or 0) or None
+})
+retry_policy = RetryPolicy(max_retries=int(os.getenv("AGENTIC_MAX_RETRIES", "4")))
+
+# --- TIMEOUTS, DEADLINES & HEDGING ---
+# Every tool call is bounded (seconds; tools not listed get AGENTIC_TOOL_TIMEOUT)
+# and a tool that runs out of time returns an error to the model instead of
+# blocking the agent. None means run inline without a timeout (local, bounded
+# tools). AGENTIC_GOAL_DEADLINE bounds a whole goal: tool timeouts, HTTP and
+# LLM request timeouts and retries are all capped by the time left.
+TOOL_TIMEOUT = float(os.getenv("AGENTIC_TOOL_TIMEOUT", "60"))
+TOOL_TIMEOUTS = {
+    "calculator": None,
+    "get_time": None,
+    "get_date": None,
+    "web_search": 20,
+    "wikipedia_search": 15,
+    "url_reader": 30
+}
+GOAL_DEADLINE = _env_number("AGENTIC_GOAL_DEADLINE")
+OUT_OF_TIME = "[Agent did not complete the goal before the deadline.]"
+# Idempotent lookups may be hedged: when a call is slower than the tool's
+# recent p95 latency, an identical one is started and the first reply wins.
+HEDGED_TOOLS = ("web_search", "wikipedia_search")
+HEDGING = os.getenv("AGENTIC_HEDGING", "off").lower() in ("1", "on", "true", "yes")
+HEDGE_DELAY = float(os.getenv("AGENTIC_HEDGE_DELAY", "2"))  # used until enough latencies are recorded
+tool_latency = LatencyTracker()
+# Timed sync tool calls share a bounded pool, so calls that time out cannot pile up threads
+TOOL_WORKERS = int(os.getenv("AGENTIC_TOOL_WORKERS", "16"))
+tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="agentic-tool")
+
+# Overridable so benchmarks and offline runs can point at local stand-ins
+SERPER_URL = os.getenv("AGENTIC_SERPER_URL", "https://google.serper.dev/search")
+WIKIPEDIA_SUMMARY_URL = os.getenv("AGENTIC_WIKIPEDIA_URL", "https://en.wikipedia.org/api/rest_v1/page/summary/{}")
+SUMMARIZE_PROMPT = "Summarize the following text in 2 sentences:\n{text}"
+ENTITIES_PROMPT = "Extract all named entities (people, places, organizations, dates, etc.) from the following text as a comma-separated list:\n{text}"
+TRANSLATE_PROMPT = "Translate the following text to {target_language}:\n{text}"
+SENTIMENT_PROMPT = "What is the sentiment of the following text? Respond with Positive, Negative, or Neutral.\n{text}"
+
+# --- LLM CLIENTS ---
+# AsyncOpenAI holds an httpx pool bound to the loop it was first used on, so
+# keep one client per event loop; it is closed with the loop's other pooled
+# clients (agentic_core.runtime).
+_async_clients = weakref.WeakKeyDictionary()
+_openai = None
+_openai_lock = threading.Lock()
+
+def get_openai():
+    """The openai module, imported and configured on first use.
+
+    Importing openai takes most of this module's cold-start time, so workers
+    and CLI runs that never call a model (cache replays, tool-only runs) skip it.
+    """
+    global _openai
+    if _openai is None:
+        with _openai_lock:  # concurrent first imports of openai can see it half-initialised
+            if _openai is None:
+                import openai
+                openai.api_key = os.getenv("OPENAI_API_KEY")
+                openai.max_retries = 0  # Retries are coordinated by retry_policy below
+                _openai = openai
+    return _openai
+
+def get_async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        openai = get_openai()
+        client = _async_clients[loop] = openai.AsyncOpenAI(api_key=openai.api_key, max_retries=0)
+    return client
+
+@on_loop_close
+async def _close_async_client(loop):
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.close()
+
+# Set AGENTIC_LLM_CACHE_MODE to record, replay or read_through for offline/regression runs
+completion_cache = CompletionCache(
+    path=os.getenv("AGENTIC_LLM_CACHE_PATH", ".llm_cache.jsonl"),
+    mode=os.getenv("AGENTIC_LLM_CACHE_MODE", "off")
+)
+
+def _completion_to_dict(response) -> dict:
+    return response.model_dump(mode="json", exclude_unset=True)
+
+def _completion_from_dict(data: dict):
+    return get_openai().types.chat.ChatCompletion.model_validate(data)
+
+def _estimate_tokens(request: dict) -> int:
+    # ~4 characters per token for the prompt, plus the completion allowance
+    prompt_chars = len(json.dumps(request.get("messages"), default=str))
+    prompt_chars += ToolRegistry.payload_chars(request.get("tools"))
+    return prompt_chars // 4 + (request.get("max_tokens") or 256)
+
+class StreamInterrupted(RuntimeError):
+    """A streamed completion failed after part of its text reached on_token.
+    Not retried: a new attempt would deliver the text again from the start."""
+
+class _StreamAssembler:
+    """Rebuilds a ChatCompletion from streamed chunks, forwarding text as it arrives."""
+    def __init__(self, on_token):
+        self.on_token = on_token
+        self.content = []
+        self.tool_calls = {}
+        self.finish_reason = None
+        self.meta = {}
+    def add(self, chunk):
+        self.meta = {"id": chunk.id, "created": chunk.created, "model": chunk.model}
+        if not chunk.choices:
+            return
+        choice = chunk.choices[0]
+        self.finish_reason = choice.finish_reason or self.finish_reason
+        delta = choice.delta
+        if delta.content:
+            self.content.append(delta.content)
+            self.on_token(delta.content)
+        for call in delta.tool_calls or []:
+            slot = self.tool_calls.setdefault(call.index, {"id": None, "type": "function", "function": {"name": "", "arguments": ""}})
+            slot["id"] = call.id or slot["id"]
+            if call.function:
+                slot["function"]["name"] += call.function.name or ""
+                slot["function"]["arguments"] += call.function.arguments or ""
+    def completion(self):
+        message = {"role": "assistant", "content": "".join(self.content) or None}
+        if self.tool_calls:
+            message["tool_calls"] = [self.tool_calls[i] for i in sorted(self.tool_calls)]
+        return _completion_from_dict(dict(self.meta, object="chat.completion", choices=[
+            {"index": 0, "finish_reason": self.finish_reason or "stop", "message": message}
+        ]))
+
+def _request_timeout() -> dict:
+    # Per-request timeout for the openai client, only when a deadline is active
+    timeout = cap_timeout(None)
+    return {} if timeout is None else {"timeout": timeout}
+
+def _create_completion(request: dict, on_token=None):
+    model = request["model"]
+    current_span().set(cache_hit=False)
+    def attempt():
+        current_span().incr("attempts")
+        with rate_limiter.slot(model, _estimate_tokens(request)):
+            if on_token is None:
+                return get_openai().chat.completions.create(**request, **_request_timeout())
+            assembler = _StreamAssembler(on_token)
+            try:
+                for chunk in get_openai().chat.completions.create(stream=True, **request, **_request_timeout()):
+                    assembler.add(chunk)
+            except Exception as e:
+                if assembler.content:  # text already reached on_token; only a failure before that is retried
+                    raise StreamInterrupted(f"stream failed after partial output: {e}") from e
+                raise
+            return assembler.completion()
+    return retry_policy.call(attempt, limiter=rate_limiter, key=model)
+
+async def _acreate_completion(request: dict, on_token=None):
+    model = request["model"]
+    current_span().set(cache_hit=False)
+    async def attempt():
+        current_span().incr("attempts")
+        async with rate_limiter.aslot(model, _estimate_tokens(request)):
+            if on_token is None:
+                return await get_async_client().chat.completions.create(**request, **_request_timeout())
+            assembler = _StreamAssembler(on_token)
+            try:
+                async for chunk in await get_async_client().chat.completions.create(stream=True, **request,
+                                                                                   **_request_timeout()):
+                    assembler.add(chunk)
+            except Exception as e:
+                if assembler.content:  # text already reached on_token; only a failure before that is retried
+                    raise StreamInterrupted(f"stream failed after partial output: {e}") from e
+                raise
+            return assembler.completion()
+    return await retry_policy.acall(attempt, limiter=rate_limiter, key=model)
+
+def _replayed(on_token):
+    # A cached completion is "streamed" as a single chunk
+    def from_dict(data):
+        response = _completion_from_dict(data)
+        if on_token is not None and response.choices[0].message.content:
+            on_token(response.choices[0].message.content)
+        return response
+    return from_dict
+
+def chat_completion(on_token=None, **request):
+    """All chat completions go through here so they are rate limited, retried,
+    and can be recorded and replayed. With `on_token`, the answer is streamed
+    and each text chunk is passed to it as it arrives."""
+    model = request.get("model")
+    with span(f"llm {model}", LLM, model=model, cache_hit=True, streamed=on_token is not None) as s:
+        response = completion_cache.complete(
+            request, lambda: _create_completion(request, on_token),
+            to_dict=_completion_to_dict, from_dict=_replayed(on_token)
+        )
+        record_usage(s, response, model)
+        return response
+
+async def achat_completion(on_token=None, **request):
+    """Async counterpart of chat_completion()."""
+    model = request.get("model")
+    with span(f"llm {model}", LLM, model=model, cache_hit=True, streamed=on_token is not None) as s:
+        response = await completion_cache.acomplete(
+            request, lambda: _acreate_completion(request, on_token),
+            to_dict=_completion_to_dict, from_dict=_replayed(on_token)
+        )
+        record_usage(s, response, model)
+        return response
+
+def http_request(method: str, url: str, **kwargs):
+    """Pooled-session request with per-host rate limiting and retries on 429/5xx/timeouts."""
+    host = urlparse(url).netloc
+    kwargs.setdefault("timeout", default_timeout())
+    def attempt():
+        current_span().incr("attempts")
+        with rate_limiter.slot(host):
+            return get_session().request(method, url, **dict(kwargs, timeout=cap_timeout(kwargs["timeout"])))
+    with span(f"http {method} {host}", HTTP, host=host) as s:
+        response = retry_policy.call(attempt, limiter=rate_limiter, key=host)
+        s.set(status_code=response.status_code)
+        return response
+
+async def ahttp_request(method: str, url: str, stream: bool = False, **kwargs):
+    """Async counterpart of http_request() on the loop's pooled httpx client.
+    With `stream`, the body is not read: iterate it and `await response.aclose()`."""
+    host = urlparse(url).netloc
+    async def attempt():
+        current_span().incr("attempts")
+        timeout = cap_timeout(kwargs.get("timeout"))
+        options = kwargs if timeout is None else dict(kwargs, timeout=timeout)
+        async with rate_limiter.aslot(host):
+            client = get_async_http_client()
+            if stream:
+                return await client.send(client.build_request(method, url, **options), stream=True)
+            return await client.request(method, url, **options)
+    with span(f"http {method} {host}", HTTP, host=host) as s:
+        response = await retry_policy.acall(attempt, limiter=rate_limiter, key=host)
+        s.set(status_code=response.status_code)
+        return response
+
+def _complete_one(item) -> str:
+    prompt, max_tokens = item
+    response = chat_completion(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens
+    )
+    return response.choices[0].message.content.strip()
+
+# --- LLM TOOL BATCHING ---
+# With AGENTIC_LLM_BATCH=on, summarize/extract_entities/translate/sentiment_analysis
+# calls made within AGENTIC_LLM_BATCH_WINDOW_MS of each other, from any agent or
+# pipeline in the process, share one JSON-mode completion instead of one request
+# each. A reply that does not fit the format falls back to a request per text.
+LLM_BATCH = os.getenv("AGENTIC_LLM_BATCH", "off").lower() in ("1", "on", "true", "yes")
+LLM_BATCH_WINDOW = float(os.getenv("AGENTIC_LLM_BATCH_WINDOW_MS", "20")) / 1000
+LLM_BATCH_SIZE = int(os.getenv("AGENTIC_LLM_BATCH_SIZE", "8"))
+BATCH_PROMPT = ("Below are {n} independent tasks, each under a \"### Task <number>\" heading. Do each task on its "
+                "own, exactly as its instructions say. Reply with a JSON object of the form "
+                "{{\"results\": [\"<result of task 1>\", ...]}} holding exactly {n} strings, in task order.")
+
+def _batch_results(content: str, n: int):
+    try:
+        results = json.loads(content or "").get("results")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+    if not isinstance(results, list) or len(results) != n:
+        return None
+    return [str(result).strip() for result in results]
+
+def _complete_batch(items) -> list:
+    tasks = "\n\n".join(f"### Task {i + 1}\n{prompt}" for i, (prompt, _) in enumerate(items))
+    response = chat_completion(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "system", "content": BATCH_PROMPT.format(n=len(items))},
+                  {"role": "user", "content": tasks}],
+        max_tokens=min(4096, sum(max_tokens + 10 for _, max_tokens in items)),
+        response_format={"type": "json_object"}
+    )
+    results = _batch_results(response.choices[0].message.content, len(items))
+    if results is None:
+        return run_parallel([lambda item=item: _complete_one(item) for item in items])
+    return results
+
+llm_batcher = (MicroBatcher(_complete_batch, run_one=_complete_one, window=LLM_BATCH_WINDOW, max_batch=LLM_BATCH_SIZE)
+               if LLM_BATCH else None)
+
+def _complete_text(prompt: str, max_tokens: int = 200) -> str:
+    if llm_batcher is not None:
+        return llm_batcher.call((prompt, max_tokens))
+    return _complete_one((prompt, max_tokens))
+
+async def _acomplete_text(prompt: str, max_tokens: int = 200) -> str:
+    if llm_batcher is not None:
+        return await llm_batcher.acall((prompt, max_tokens))
+    response = await achat_completion(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens
+    )
+    return response.choices[0].message.content.strip()
+
+# --- LOCAL NLP FAST PATHS ---
+# sentiment_analysis and extract_entities first score the text in process
+# (tools/sentiment.py, tools/entity_extraction.py: lexicon and compiled
+# patterns, well under a millisecond) and only spend an LLM call when the
+# local confidence is below AGENTIC_LOCAL_NLP_CONFIDENCE. AGENTIC_LOCAL_NLP:
+# auto (default), local (never call the LLM) or llm (always call it).
+LOCAL_NLP = os.getenv("AGENTIC_LOCAL_NLP", "auto").lower()
+LOCAL_NLP_CONFIDENCE = float(os.getenv("AGENTIC_LOCAL_NLP_CONFIDENCE", "0.7"))
+
+def _accept_local(result: str, confidence: float):
+    accepted = LOCAL_NLP == "local" or confidence >= LOCAL_NLP_CONFIDENCE
+    current_span().set(local_confidence=round(confidence, 3), local=accepted)
+    return result if accepted else None
+
+def _local_sentiment(text: str):
+    if LOCAL_NLP == "llm":
+        return None
+    from tools.sentiment import analyze
+    label, confidence, _ = analyze(text)
+    return _accept_local(label, confidence)
+
+def _local_entities(text: str):
+    if LOCAL_NLP == "llm":
+        return None
+    from tools.entity_extraction import analyze, format_entities
+    entities, confidence = analyze(text)
+    return _accept_local(format_entities(entities), confidence)
+
+def _search_snippets(data: dict) -> str:
+    snippets = [res.get("snippet") or res.get("title") for res in data.get("organic", [])]
+    return "\n".join(snippet for snippet in snippets if snippet)
+
+# --- URL READING ---
+# Pages are streamed and read only as far as the requested page needs (never
+# past AGENTIC_URL_MAX_BYTES), decoded incrementally and reduced to their main
+# text. url_reader(url, page=2) continues a document; pages already extracted
+# are kept in a small LRU so follow-up pages do not download the start again.
+URL_PAGE_CHARS = int(os.getenv("AGENTIC_URL_PAGE_CHARS", "2000"))
+URL_MAX_BYTES = int(os.getenv("AGENTIC_URL_MAX_BYTES", "1000000"))
+URL_CHUNK_BYTES = 16384
+url_documents = DocumentCache()
+
+def _chars_for(page: int) -> int:
+    return page * URL_PAGE_CHARS + 1  # one more character tells whether there is a next page
+
+def _page_extractor(response, page: int):
+    """A PageExtractor for the response body, or an error string for the model."""
+    if response.status_code != 200:
+        return f"[URL error: {response.status_code}]"
+    content_type = response.headers.get("content-type")
+    media_type, _ = parse_content_type(content_type)
+    if not is_text_type(media_type):
+        return f"[URL error: unsupported content type {media_type}]"
+    return PageExtractor(content_type, max_chars=_chars_for(page), max_bytes=URL_MAX_BYTES)
+
+def _read_page(url: str, page: int, extractor: PageExtractor) -> str:
+    text, complete = extractor.text(), not extractor.truncated
+    url_documents.put(url, text, complete)
+    current_span().set(bytes_read=extractor.bytes_read)
+    return paginate(text, page, URL_PAGE_CHARS, complete)
 
 # --- TOOL DEFINITIONS ---
 def web_search(query: str) -> str:
-    url = "https://google.serper.dev/search"
     headers = {"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"}
     payload = {"q": query}
-    response = requests.post(url, headers=headers, json=payload)
+    response = http_request("POST", SERPER_URL, headers=headers, json=payload)
     if response.status_code == 200:
-        data = response.json()
-        snippets = [res.get("snippet") or res.get("title") for res in data.get("organic", [])]
-        return "\n".join(snippet for snippet in snippets if snippet)
+        return _search_snippets(response.json())
     else:
         return f"[Error fetching search results: {response.status_code}]"
 
 def calculator(expression: str) -> str:
-    try:
-        result = eval(expression, {"__builtins__": {}})
-        return str(result)
-    except Exception as e:
-        return f"[Calculator error: {e}]"
+    # AST-compiled with size guards (no eval); several expressions may be separated by ';'
+    return calculate(expression)
 
 def summarize(text: str) -> str:
-    prompt = f"Summarize the following text in 2 sentences:\n{text}"
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=200
-    )
-    return response.choices[0].message.content.strip()
+    return _complete_text(SUMMARIZE_PROMPT.format(text=text), max_tokens=200)
 
 def get_time(_: str = None) -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -45,26 +430,16 @@ def get_date(_: str = None) -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 def extract_entities(text: str) -> str:
-    prompt = f"Extract all named entities (people, places, organizations, dates, etc.) from the following text as a comma-separated list:\n{text}"
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=200
-    )
-    return response.choices[0].message.content.strip()
+    local = _local_entities(text)
+    if local is not None:
+        return local
+    return _complete_text(ENTITIES_PROMPT.format(text=text), max_tokens=200)
 
 def translate(text: str, target_language: str) -> str:
-    prompt = f"Translate the following text to {target_language}:\n{text}"
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=200
-    )
-    return response.choices[0].message.content.strip()
+    return _complete_text(TRANSLATE_PROMPT.format(text=text, target_language=target_language), max_tokens=200)
 
 def wikipedia_search(query: str) -> str:
-    url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{query.replace(' ', '_')}"
-    response = requests.get(url)
+    response = http_request("GET", WIKIPEDIA_SUMMARY_URL.format(query.replace(' ', '_')))
     if response.status_code == 200:
         data = response.json()
         return data.get("extract", "No summary found.")
@@ -74,180 +449,454 @@ def wikipedia_search(query: str) -> str:
 def code_executor(code: str, language: str = "python") -> str:
     if language != "python":
         return "[Only Python code execution is supported in this demo.]"
-    try:
-        local_vars = {}
-        exec(code, {}, local_vars)
-        return str(local_vars) if local_vars else "[Code executed successfully, no output.]"
-    except Exception as e:
-        return f"[Code execution error: {e}]"
+    from agentic_core.sandbox import run_code  # multiprocessing is only needed once code actually runs
+    return run_code(code)
 
 def sentiment_analysis(text: str) -> str:
-    prompt = f"What is the sentiment of the following text? Respond with Positive, Negative, or Neutral.\n{text}"
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=20
-    )
-    return response.choices[0].message.content.strip()
+    local = _local_sentiment(text)
+    if local is not None:
+        return local
+    return _complete_text(SENTIMENT_PROMPT.format(text=text), max_tokens=20)
 
-def url_reader(url: str) -> str:
+def url_reader(url: str, page: int = 1) -> str:
+    doc = url_documents.get(url, _chars_for(page))
+    if doc is not None:
+        return paginate(doc[0], page, URL_PAGE_CHARS, doc[1])
     try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code == 200:
-            return resp.text[:2000] + ("..." if len(resp.text) > 2000 else "")
-        else:
-            return f"[URL error: {resp.status_code}]"
+        with http_request("GET", url, stream=True) as resp:
+            extractor = _page_extractor(resp, page)
+            if isinstance(extractor, str):
+                return extractor
+            for chunk in resp.iter_content(URL_CHUNK_BYTES):
+                if extractor.feed(chunk):
+                    break
+        return _read_page(url, page, extractor)
     except Exception as e:
         return f"[URL error: {e}]"
 
-# --- FUNCTION SCHEMAS FOR OPENAI FUNCTION CALLING ---
-function_schemas = [
-    {
-        "name": "web_search",
-        "description": "Search the web for information.",
-        "parameters": {
-            "type": "object",
-            "properties": {"query": {"type": "string"}},
-            "required": ["query"]
-        }
-    },
-    {
-        "name": "calculator",
-        "description": "Evaluate a math expression.",
-        "parameters": {
-            "type": "object",
-            "properties": {"expression": {"type": "string"}},
-            "required": ["expression"]
-        }
-    },
-    {
-        "name": "summarize",
-        "description": "Summarize a block of text.",
-        "parameters": {
-            "type": "object",
-            "properties": {"text": {"type": "string"}},
-            "required": ["text"]
-        }
-    },
-    {
-        "name": "get_time",
-        "description": "Get the current time.",
-        "parameters": {"type": "object", "properties": {}, "required": []}
-    },
-    {
-        "name": "get_date",
-        "description": "Get the current date.",
-        "parameters": {"type": "object", "properties": {}, "required": []}
-    },
-    {
-        "name": "extract_entities",
-        "description": "Extract named entities from text.",
-        "parameters": {
-            "type": "object",
-            "properties": {"text": {"type": "string"}},
-            "required": ["text"]
-        }
-    },
-    {
-        "name": "translate",
-        "description": "Translate text to a target language.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "text": {"type": "string"},
-                "target_language": {"type": "string"}
-            },
-            "required": ["text", "target_language"]
-        }
-    },
-    {
-        "name": "wikipedia_search",
-        "description": "Search Wikipedia for a summary.",
-        "parameters": {
-            "type": "object",
-            "properties": {"query": {"type": "string"}},
-            "required": ["query"]
-        }
-    },
-    {
-        "name": "code_executor",
-        "description": "Execute a Python code snippet.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "code": {"type": "string"},
-                "language": {"type": "string", "default": "python"}
-            },
-            "required": ["code"]
-        }
-    },
-    {
-        "name": "sentiment_analysis",
-        "description": "Analyze sentiment of text.",
-        "parameters": {
-            "type": "object",
-            "properties": {"text": {"type": "string"}},
-            "required": ["text"]
-        }
-    },
-    {
-        "name": "url_reader",
-        "description": "Read and return the content of a URL (first 2000 chars).",
-        "parameters": {
-            "type": "object",
-            "properties": {"url": {"type": "string"}},
-            "required": ["url"]
-        }
-    }
-]
+# --- ASYNC TOOL VARIANTS (non-blocking network I/O for the asyncio runtime) ---
+async def async_web_search(query: str) -> str:
+    headers = {"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"}
+    response = await ahttp_request("POST", SERPER_URL, headers=headers, json={"q": query})
+    if response.status_code == 200:
+        return _search_snippets(response.json())
+    return f"[Error fetching search results: {response.status_code}]"
+
+async def async_summarize(text: str) -> str:
+    return await _acomplete_text(SUMMARIZE_PROMPT.format(text=text), max_tokens=200)
+
+async def async_extract_entities(text: str) -> str:
+    local = _local_entities(text)
+    if local is not None:
+        return local
+    return await _acomplete_text(ENTITIES_PROMPT.format(text=text), max_tokens=200)
+
+async def async_translate(text: str, target_language: str) -> str:
+    return await _acomplete_text(TRANSLATE_PROMPT.format(text=text, target_language=target_language), max_tokens=200)
+
+async def async_wikipedia_search(query: str) -> str:
+    response = await ahttp_request("GET", WIKIPEDIA_SUMMARY_URL.format(query.replace(' ', '_')))
+    if response.status_code == 200:
+        return response.json().get("extract", "No summary found.")
+    return f"[Wikipedia error: {response.status_code}]"
+
+async def async_sentiment_analysis(text: str) -> str:
+    local = _local_sentiment(text)
+    if local is not None:
+        return local
+    return await _acomplete_text(SENTIMENT_PROMPT.format(text=text), max_tokens=20)
+
+async def async_url_reader(url: str, page: int = 1) -> str:
+    doc = url_documents.get(url, _chars_for(page))
+    if doc is not None:
+        return paginate(doc[0], page, URL_PAGE_CHARS, doc[1])
+    try:
+        resp = await ahttp_request("GET", url, stream=True)
+        try:
+            extractor = _page_extractor(resp, page)
+            if isinstance(extractor, str):
+                return extractor
+            async for chunk in resp.aiter_bytes(URL_CHUNK_BYTES):
+                if extractor.feed(chunk):
+                    break
+        finally:
+            await resp.aclose()
+        return _read_page(url, page, extractor)
+    except Exception as e:
+        return f"[URL error: {e}]"
 
 # --- TOOL REGISTRY ---
-tool_funcs = {
-    "web_search": web_search,
-    "calculator": calculator,
-    "summarize": summarize,
-    "get_time": get_time,
-    "get_date": get_date,
-    "extract_entities": extract_entities,
-    "translate": translate,
-    "wikipedia_search": wikipedia_search,
-    "code_executor": code_executor,
-    "sentiment_analysis": sentiment_analysis,
-    "url_reader": url_reader
+# Schemas are generated from the function signatures; descriptions are what the model sees.
+# Coroutine variants are used by the async runtime; tools without one are run on
+# a worker thread so they never block the event loop.
+for _func, _description, _async_func in [
+    (web_search, "Search the web for information.", async_web_search),
+    (calculator, "Evaluate a math expression (or several separated by ';'). Supports + - * / // % ** and functions such as sqrt, log, sin, factorial.", None),
+    (summarize, "Summarize a block of text.", async_summarize),
+    (get_time, "Get the current time.", None),
+    (get_date, "Get the current date.", None),
+    (extract_entities, "Extract named entities from text.", async_extract_entities),
+    (translate, "Translate text to a target language.", async_translate),
+    (wikipedia_search, "Search Wikipedia for a summary.", async_wikipedia_search),
+    (code_executor, "Execute a Python code snippet.", None),
+    (sentiment_analysis, "Analyze sentiment of text.", async_sentiment_analysis),
+    (url_reader, f"Read the main text of a web page, {URL_PAGE_CHARS} characters per page; pass page=2, 3... to read on.", async_url_reader),
+]:
+    ToolRegistry.register(_func, description=_description, async_func=_async_func)
+
+# Read-only views kept for callers that predate the registry
+function_schemas = [tool.schema for tool in ToolRegistry.get_tools()]
+tool_funcs = {tool.name: tool.func for tool in ToolRegistry.get_tools()}
+async_tool_funcs = {tool.name: tool.async_func for tool in ToolRegistry.get_tools() if tool.async_func}
+
+# --- TOOL RESULT CACHE ---
+# Seconds a result stays fresh; tools not listed here (time, calculator, code) are never cached
+TOOL_CACHE_TTLS = {
+    "summarize": 24 * 3600,
+    "extract_entities": 24 * 3600,
+    "translate": 24 * 3600,
+    "sentiment_analysis": 24 * 3600,
+    "wikipedia_search": 6 * 3600,
+    "web_search": 3600,
+    "url_reader": 900
 }
+tool_cache = ToolCache(
+    max_entries=int(os.getenv("AGENTIC_TOOL_CACHE_SIZE", "1024")),
+    ttls=TOOL_CACHE_TTLS,
+    path=os.getenv("AGENTIC_TOOL_CACHE_PATH")
+)
+
+def _is_error_result(result) -> bool:
+    # Tools report failures as "[... error ...]" strings; never cache those
+    return isinstance(result, str) and result.startswith("[") and "error" in result.lower()
+
+# ToolRegistry.call_tool() shares the same cache and policy: the tools with a TTL are the cacheable ones
+for _tool in ToolRegistry.get_tools(TOOL_CACHE_TTLS):
+    _tool.cacheable = True
+ToolRegistry.cache = tool_cache
+ToolRegistry.cache_filter = lambda result: not _is_error_result(result)
+
+# --- SEMANTIC MEMORY ---
+# Opt-in (AGENTIC_SEMANTIC_MEMORY=on). Research results and final answers are
+# remembered under the query/goal they answered. Relevant ones are added to
+# agents' system prompts as notes, and a near-identical repeat search is
+# answered from memory instead of the network while the result is still within
+# the tool's TOOL_CACHE_TTLS. Set AGENTIC_SEMANTIC_MEMORY_PATH to keep memory
+# across runs; the oldest items are evicted past AGENTIC_SEMANTIC_MEMORY_SIZE.
+SEMANTIC_MEMORY_TOOLS = ("web_search", "wikipedia_search", "url_reader")
+SEMANTIC_REUSE_SCORE = float(os.getenv("AGENTIC_SEMANTIC_REUSE_SCORE", "0.92"))
+semantic_memory = None
+if os.getenv("AGENTIC_SEMANTIC_MEMORY", "off").lower() in ("1", "on", "true", "yes"):
+    semantic_memory = SemanticMemory(path=os.getenv("AGENTIC_SEMANTIC_MEMORY_PATH"),
+                                     max_items=int(os.getenv("AGENTIC_SEMANTIC_MEMORY_SIZE", "10000")))
+
+def _tool_query(fn_args: dict) -> str:
+    return " ".join(str(v) for v in fn_args.values())
+
+def _memorable(fn_name: str, fn_args: dict) -> bool:
+    # Later pages of a document look too much like its first page to tell apart by similarity
+    return semantic_memory is not None and fn_name in SEMANTIC_MEMORY_TOOLS and fn_args.get("page", 1) == 1
+
+def recall_tool_result(fn_name: str, fn_args: dict):
+    """Result of an earlier near-identical research call, or None."""
+    if not _memorable(fn_name, fn_args):
+        return None
+    hits = semantic_memory.search(_tool_query(fn_args), k=1, kinds=[fn_name], min_score=SEMANTIC_REUSE_SCORE,
+                                  max_age=TOOL_CACHE_TTLS.get(fn_name))
+    return hits[0][1]["text"] if hits else None
+
+def remember_tool_result(fn_name: str, fn_args: dict, result):
+    if _memorable(fn_name, fn_args) and not _is_error_result(result):
+        semantic_memory.add(str(result), kind=fn_name, key=_tool_query(fn_args))
+
+def remember_answer(goal: str, answer: str):
+    if semantic_memory is not None and answer and not answer.startswith("[Agent did not"):
+        semantic_memory.add(answer, kind="answer", key=goal)
+
+def memory_notes(memory, system_prompt: str, query: str) -> str:
+    """`system_prompt` plus the items in `memory` most relevant to `query`."""
+    notes = memory.context_for(query) if memory is not None else ""
+    if not notes:
+        return system_prompt
+    return (f"{system_prompt}\n\nNotes from earlier research (use them instead of searching again "
+            f"when they already answer the question):\n{notes}")
+
+def _hedge_delay(fn_name: str):
+    if not HEDGING or fn_name not in HEDGED_TOOLS:
+        return None
+    p95 = tool_latency.percentile(fn_name)
+    return HEDGE_DELAY if p95 is None else p95
+
+def _record_latency(fn_name: str):
+    return lambda seconds: tool_latency.record(fn_name, seconds)
+
+def _timed_out(fn_name: str, error: DeadlineExceeded) -> str:
+    return f"[Tool error: {fn_name} timed out ({error})]"
+
+def _execute(fn_name: str, func, fn_args: dict):
+    """Run a tool under its timeout (and the goal deadline), hedged if enabled."""
+    timeout = TOOL_TIMEOUTS.get(fn_name, TOOL_TIMEOUT)
+    if timeout is None:
+        return func(**fn_args)
+    try:
+        return call_with_timeout(lambda: func(**fn_args), timeout, hedge_after=_hedge_delay(fn_name),
+                                 on_latency=_record_latency(fn_name), executor=tool_executor)
+    except DeadlineExceeded as e:
+        return _timed_out(fn_name, e)
+
+async def _aexecute(fn_name: str, tool, fn_args: dict):
+    """Async counterpart of _execute(); timed-out or losing attempts are cancelled."""
+    if tool.async_func is not None:
+        run = lambda: tool.async_func(**fn_args)
+    else:
+        run = lambda: asyncio.to_thread(tool.func, **fn_args)
+    timeout = TOOL_TIMEOUTS.get(fn_name, TOOL_TIMEOUT)
+    if timeout is None:
+        return await run()
+    try:
+        return await acall_with_timeout(run, timeout, hedge_after=_hedge_delay(fn_name),
+                                        on_latency=_record_latency(fn_name))
+    except DeadlineExceeded as e:
+        return _timed_out(fn_name, e)
+
+def _traced_result(s, result):
+    if _is_error_result(result):
+        s.fail(str(result)[:200])
+    return result
+
+def call_tool(fn_name: str, fn_args: dict):
+    """Invoke a tool by name, serving repeat calls from semantic memory or tool_cache."""
+    with span(f"tool {fn_name}", TOOL, tool=fn_name, source="memory") as s:
+        result = recall_tool_result(fn_name, fn_args)
+        if result is not None:
+            return result
+        func = ToolRegistry.get(fn_name).func
+        def run():
+            s.set(source="call")
+            return _execute(fn_name, func, fn_args)
+        if fn_name not in TOOL_CACHE_TTLS:
+            result = run()
+        else:
+            s.set(source="cache")
+            result = tool_cache.get_or_call(fn_name, fn_args, run,
+                                            should_cache=lambda result: not _is_error_result(result))
+        remember_tool_result(fn_name, fn_args, result)
+        return _traced_result(s, result)
+
+def commit_tool_result(fn_name: str, fn_args: dict, result):
+    """Store a result in tool_cache and semantic memory, as call_tool() does."""
+    if fn_name in TOOL_CACHE_TTLS and not _is_error_result(result):
+        tool_cache.store(fn_name, fn_args, result)
+    remember_tool_result(fn_name, fn_args, result)
+
+def _stored(fn_name: str, fn_args: dict) -> bool:
+    return recall_tool_result(fn_name, fn_args) is not None or (
+        fn_name in TOOL_CACHE_TTLS and tool_cache.lookup(fn_name, fn_args)[0])
+
+async def acall_tool(fn_name: str, fn_args: dict):
+    """Async counterpart of call_tool(); joins a confirmed speculative prefetch of the same call."""
+    with span(f"tool {fn_name}", TOOL, tool=fn_name, source="memory") as s:
+        result = recall_tool_result(fn_name, fn_args)
+        if result is not None:
+            return result
+        if fn_name in TOOL_CACHE_TTLS:
+            hit, result = tool_cache.lookup(fn_name, fn_args)
+            if hit:
+                s.set(source="cache")
+                return result
+        pending = prefetched(fn_name, fn_args)
+        if pending is not None:
+            # The prefetch commits its own result; a failed one (None) is retried below
+            result = await asyncio.shield(pending)
+            if result is not None:
+                s.set(source="prefetch")
+                return result
+        s.set(source="call")
+        result = await _aexecute(fn_name, ToolRegistry.get(fn_name), fn_args)
+        commit_tool_result(fn_name, fn_args, result)
+        return _traced_result(s, result)
+
+async def aprefetch_tool(fn_name: str, fn_args: dict):
+    """Speculative acall_tool() that stores nothing: the result (None if already
+    stored or failed) is for a Speculator to commit_tool_result() once confirmed."""
+    if _stored(fn_name, fn_args):
+        return None
+    with span(f"prefetch {fn_name}", TOOL, tool=fn_name, source="prefetch") as s:
+        result = await _aexecute(fn_name, ToolRegistry.get(fn_name), fn_args)
+        _traced_result(s, result)
+        return None if _is_error_result(result) else result
+
+# --- TOOL CALL DISPATCH ---
+def tool_definitions(names=None):
+    """`tools` payload for a toolset (all tools if None), cached by the registry."""
+    return ToolRegistry.definitions(names)
+
+def assistant_tool_message(msg) -> dict:
+    """Echo an assistant tool-call turn back into the conversation history."""
+    return {
+        "role": "assistant",
+        "content": msg.content,
+        "tool_calls": [
+            {"id": call.id, "type": "function",
+             "function": {"name": call.function.name, "arguments": call.function.arguments}}
+            for call in msg.tool_calls
+        ]
+    }
+
+def token_emitter(on_event, agent: str):
+    """on_token callback that forwards streamed text as TOKEN events (None if not streaming)."""
+    if on_event is None:
+        return None
+    return lambda text: emit(on_event, TOKEN, agent=agent, text=text)
+
+def parse_tool_arguments(call):
+    """(validated args, None), or (raw args, error message for the model) if they don't fit the schema."""
+    try:
+        return ToolRegistry.parse_arguments(call.function.name, call.function.arguments), None
+    except ToolArgumentError as e:
+        try:
+            raw = json.loads(call.function.arguments or "{}")
+        except json.JSONDecodeError:
+            raw = {}
+        return raw if isinstance(raw, dict) else {}, f"[Tool argument error: {e}]"
+
+def run_tool_calls(tool_calls, max_workers: int = MAX_TOOL_WORKERS, on_event=None, agent: str = None):
+    """Run every tool call of one turn concurrently.
+
+    Returns (name, args, result) tuples in the same order as `tool_calls`, so
+    the tool messages fed back to the model are deterministic. TOOL_START and
+    TOOL_END events are emitted as each call actually starts and finishes.
+    """
+    def make_task(call):
+        fn_name = call.function.name
+        fn_args, error = parse_tool_arguments(call)
+        def task():
+            emit(on_event, TOOL_START, agent=agent, tool=fn_name, args=fn_args)
+            result = error or call_tool(fn_name, fn_args)
+            emit(on_event, TOOL_END, agent=agent, tool=fn_name, args=fn_args, result=result)
+            return fn_name, fn_args, result
+        return task
+    return run_parallel([make_task(call) for call in tool_calls], max_workers=max_workers)
+
+async def arun_tool_calls(tool_calls, max_workers: int = MAX_TOOL_WORKERS, on_event=None, agent: str = None):
+    """Async counterpart of run_tool_calls(); results keep the call order."""
+    semaphore = asyncio.Semaphore(max_workers)
+    async def run(call):
+        fn_name = call.function.name
+        fn_args, error = parse_tool_arguments(call)
+        async with semaphore:
+            emit(on_event, TOOL_START, agent=agent, tool=fn_name, args=fn_args)
+            result = error or await acall_tool(fn_name, fn_args)
+            emit(on_event, TOOL_END, agent=agent, tool=fn_name, args=fn_args, result=result)
+        return fn_name, fn_args, result
+    return await asyncio.gather(*(run(call) for call in tool_calls))
+
+def make_context_manager(max_tokens: int = None) -> ContextManager:
+    """Per-agent context budget; rolling summaries (one extra LLM call) are opt-in."""
+    return ContextManager(max_tokens=max_tokens or MAX_CONTEXT_TOKENS,
+                          summarizer=summarize if CONTEXT_SUMMARIES else None)
 
 # --- MAIN AGENT LOOP ---
-def agentic_function_calling_agent(goal: str, max_iters: int = 8, verbose: bool = True):
+AGENT_SYSTEM_PROMPT = "You are a helpful, tool-using agent. Use the available functions to solve the user's request. If you have enough information, provide the final answer."
+
+@traced(PIPELINE, "function_calling_agent")
+def agentic_function_calling_agent(goal: str, max_iters: int = 8, verbose: bool = True, on_event=None,
+                                   deadline: float = None):
+    """Answer `goal` with tool calls; `deadline` is seconds for the whole goal (AGENTIC_GOAL_DEADLINE by default)."""
+    current_span().set(goal=goal[:200])
+    with deadline_scope(GOAL_DEADLINE if deadline is None else deadline):
+        return _function_calling_loop(goal, max_iters, on_event)
+
+@traced(AGENT, "agent Agent")
+def _function_calling_loop(goal: str, max_iters: int, on_event):
     messages = [
-        {"role": "system", "content": "You are a helpful, tool-using agent. Use the available functions to solve the user's request. If you have enough information, provide the final answer."},
+        {"role": "system", "content": memory_notes(semantic_memory, AGENT_SYSTEM_PROMPT, goal)},
         {"role": "user", "content": goal}
     ]
     reasoning_steps = []
+    context = make_context_manager()
     for i in range(max_iters):
-        response = openai.chat.completions.create(
-            model="gpt-3.5-turbo-1106",
-            messages=messages,
-            functions=function_schemas,
-            function_call="auto"
-        )
-        st.info(response)
+        messages = context.compact(messages)
+        try:
+            response = chat_completion(
+                model="gpt-3.5-turbo-1106",
+                messages=messages,
+                tools=tool_definitions(),
+                tool_choice="auto",
+                on_token=token_emitter(on_event, "Agent")
+            )
+        except DeadlineExceeded:
+            return OUT_OF_TIME, reasoning_steps
         msg = response.choices[0].message
 
         step_info = f"**Step {i+1}:**\n"
-        if msg.function_call:
-            fn_name = msg.function_call.name
-            fn_args = json.loads(msg.function_call.arguments)
-            step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
-            result = tool_funcs[fn_name](**fn_args)
-            step_info += f"Tool output: {result}\n"
-            messages.append({"role": "function", "name": fn_name, "content": str(result)})
+        if msg.tool_calls:
+            messages.append(assistant_tool_message(msg))
+            results = run_tool_calls(msg.tool_calls, on_event=on_event, agent="Agent")
+            for call, (fn_name, fn_args, result) in zip(msg.tool_calls, results):
+                step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
+                step_info += f"Tool output: {result}\n"
+                messages.append({"role": "tool", "tool_call_id": call.id, "content": str(result)})
         else:
             step_info += f"Agent produced final answer."
             reasoning_steps.append(step_info)
+            emit(on_event, FINAL, agent="Agent", content=msg.content)
+            remember_answer(goal, msg.content)
             return msg.content, reasoning_steps
         reasoning_steps.append(step_info)
     return "[Agent did not complete the goal in time.]", reasoning_steps
 
+@traced(PIPELINE, "function_calling_agent")
+async def async_agentic_function_calling_agent(goal: str, max_iters: int = 8, verbose: bool = True, on_event=None,
+                                               deadline: float = None):
+    """agentic_function_calling_agent() on the current event loop (tools run concurrently as coroutines)."""
+    current_span().set(goal=goal[:200])
+    with deadline_scope(GOAL_DEADLINE if deadline is None else deadline):
+        return await _afunction_calling_loop(goal, max_iters, on_event)
+
+@traced(AGENT, "agent Agent")
+async def _afunction_calling_loop(goal: str, max_iters: int, on_event):
+    messages = [
+        {"role": "system", "content": memory_notes(semantic_memory, AGENT_SYSTEM_PROMPT, goal)},
+        {"role": "user", "content": goal}
+    ]
+    reasoning_steps = []
+    context = make_context_manager()
+    for i in range(max_iters):
+        messages = context.compact(messages)
+        try:
+            response = await achat_completion(
+                model="gpt-3.5-turbo-1106",
+                messages=messages,
+                tools=tool_definitions(),
+                tool_choice="auto",
+                on_token=token_emitter(on_event, "Agent")
+            )
+        except DeadlineExceeded:
+            return OUT_OF_TIME, reasoning_steps
+        msg = response.choices[0].message
+        step_info = f"**Step {i+1}:**\n"
+        if msg.tool_calls:
+            messages.append(assistant_tool_message(msg))
+            results = await arun_tool_calls(msg.tool_calls, on_event=on_event, agent="Agent")
+            for call, (fn_name, fn_args, result) in zip(msg.tool_calls, results):
+                step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
+                step_info += f"Tool output: {result}\n"
+                messages.append({"role": "tool", "tool_call_id": call.id, "content": str(result)})
+        else:
+            step_info += f"Agent produced final answer."
+            reasoning_steps.append(step_info)
+            emit(on_event, FINAL, agent="Agent", content=msg.content)
+            remember_answer(goal, msg.content)
+            return msg.content, reasoning_steps
+        reasoning_steps.append(step_info)
+    return "[Agent did not complete the goal in time.]", reasoning_steps
+
+def stream_agentic_function_calling_agent(goal: str, max_iters: int = 8, verbose: bool = True):
+    """Generator of events for agentic_function_calling_agent(); the last
+    event is DONE with result=(answer, reasoning_steps)."""
+    return iter_events(lambda on_event: agentic_function_calling_agent(goal, max_iters, verbose, on_event=on_event))
+
 if __name__ == "__main__":
     user_goal = input("Enter your complex goal: ")
     final_answer = agentic_function_calling_agent(user_goal)
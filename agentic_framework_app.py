@@ -1,5 +1,5 @@
 import streamlit as st
-from agentic_framework import agentic_function_calling_agent
+from agentic_framework import stream_agentic_function_calling_agent
 
 st.set_page_config(page_title="Agentic Function Calling Agent", layout="centered")
 st.title("🛠️ Universal Tool-Using Agent")
@@ -10,15 +10,26 @@ with st.form("framework_form"):
     submitted = st.form_submit_button("Run Agent")
 
 if submitted and user_goal:
-    with st.spinner("Agent reasoning, using tools, and iterating..."):
-        try:
-            answer, steps = agentic_function_calling_agent(user_goal, verbose=verbose)
-            st.success("Agent completed the task!")
-            if verbose and steps:
-                st.markdown("### Reasoning Steps:")
-                for step in steps:
-                    st.markdown(step)
-            st.markdown("### Final Agent Answer:")
-            st.markdown(answer)
-        except Exception as e:
-            st.error(f"Error: {e}")
+    try:
+        with st.status("Agent reasoning, using tools, and iterating...", expanded=True) as status:
+            # Render tool activity and the answer as they stream in
+            answer_box = st.empty()
+            partial = ""
+            for event in stream_agentic_function_calling_agent(user_goal, verbose=verbose):
+                if event["type"] == "tool_start":
+                    st.write(f"🔧 Calling `{event['tool']}` with {event['args']}")
+                elif event["type"] == "token":
+                    partial += event["text"]
+                    answer_box.markdown(partial)
+                elif event["type"] == "done":
+                    answer, steps = event["result"]
+            answer_box.empty()
+            status.update(label="Agent completed the task!", state="complete", expanded=False)
+        if verbose and steps:
+            st.markdown("### Reasoning Steps:")
+            for step in steps:
+                st.markdown(step)
+        st.markdown("### Final Agent Answer:")
+        st.markdown(answer)
+    except Exception as e:
+        st.error(f"Error: {e}")
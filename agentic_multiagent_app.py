@@ -1,5 +1,5 @@
 import streamlit as st
-from agentic_multiagent_framework import multiagent_pipeline
+from agentic_multiagent_framework import stream_multiagent_pipeline
 
 st.set_page_config(page_title="Multi-Agentic Workflow", layout="wide")
 st.title("🤝 Modular Multi-Agentic Workflow")
@@ -49,17 +49,33 @@ st.markdown("## 📝 Run a Multi-Agent Pipeline")
 user_goal = st.text_area("Enter your multi-agent goal:", value="Write a blog post about the latest AI breakthrough, then review it for sentiment and summarize the review.")
 
 if st.button("Run Multi-Agent Pipeline"):
-    with st.spinner("Agents collaborating and reasoning..."):
-        try:
-            final_answer, steps = multiagent_pipeline(user_goal, agent_configs)
-            st.success("Pipeline completed!")
-            st.markdown("### Reasoning Steps:")
-            for step in steps:
-                st.markdown(step)
-            st.markdown("### Final Output:")
-            st.markdown(final_answer)
-        except Exception as e:
-            st.error(f"Error: {e}")
+    try:
+        with st.status("Agents collaborating and reasoning...", expanded=True) as status:
+            # Render each agent's tool calls and answer as they stream in
+            answer_box = None
+            partial = ""
+            for event in stream_multiagent_pipeline(user_goal, agent_configs):
+                if event["type"] == "tool_start":
+                    st.write(f"🔧 **{event['agent']}** calling `{event['tool']}` with {event['args']}")
+                elif event["type"] == "token":
+                    if answer_box is None:
+                        st.markdown(f"**{event['agent']}:**")
+                        answer_box = st.empty()
+                    partial += event["text"]
+                    answer_box.markdown(partial)
+                elif event["type"] == "handoff":
+                    st.write(f"➡️ Handing off from **{event['from_agent']}** to **{event['to_agent']}**")
+                    answer_box, partial = None, ""
+                elif event["type"] == "done":
+                    final_answer, steps = event["result"]
+            status.update(label="Pipeline completed!", state="complete", expanded=False)
+        st.markdown("### Reasoning Steps:")
+        for step in steps:
+            st.markdown(step)
+        st.markdown("### Final Output:")
+        st.markdown(final_answer)
+    except Exception as e:
+        st.error(f"Error: {e}")
 
 st.markdown("---")
 st.markdown("""
@@ -1,72 +1,153 @@
 import os
 import json
-import requests
 from dotenv import load_dotenv
-import openai
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
 load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
 SERPER_API_KEY = os.getenv("SERPER_API_KEY")
 
 # --- TOOL DEFINITIONS (same as before, omitted for brevity) ---
 # ... (reuse all tool functions and schemas from agentic_framework.py)
 from agentic_framework import (
     web_search, calculator, summarize, get_time, get_date, extract_entities, translate,
-    wikipedia_search, code_executor, sentiment_analysis, url_reader, function_schemas, tool_funcs
+    wikipedia_search, code_executor, sentiment_analysis, url_reader, function_schemas, tool_funcs,
+    tool_definitions, assistant_tool_message, run_tool_calls, chat_completion, token_emitter,
+    make_context_manager, semantic_memory, memory_notes, remember_answer, achat_completion, arun_tool_calls,
+    OUT_OF_TIME
 )
+from agentic_core.deadline import DeadlineExceeded
+from agentic_core.events import emit, iter_events, FINAL, HANDOFF
+from agentic_core.tracing import traced, current_span, PIPELINE, AGENT
 
 # --- AGENT CLASS ---
 class Agent:
-    def __init__(self, name: str, system_prompt: str, toolset: Optional[List[str]] = None):
+    def __init__(self, name: str, system_prompt: str, toolset: Optional[List[str]] = None,
+                 max_context_tokens: Optional[int] = None):
         self.name = name
         self.system_prompt = system_prompt
         self.toolset = toolset or list(tool_funcs.keys())
+        self.context = make_context_manager(max_context_tokens)
 
     def available_functions(self):
-        return [f for f in function_schemas if f["name"] in self.toolset]
+        return tool_definitions(self.toolset)
 
-    def act(self, messages: List[Dict[str, Any]], max_iters: int = 5, verbose: bool = True):
+    @traced(AGENT, lambda self, *args, **kwargs: f"agent {self.name}")
+    def act(self, messages: List[Dict[str, Any]], max_iters: int = 5, verbose: bool = True, on_event=None):
         reasoning_steps = []
         for i in range(max_iters):
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo-1106",
-                messages=messages,
-                functions=self.available_functions(),
-                function_call="auto"
-            )
+            messages = self.context.compact(messages)
+            try:
+                response = chat_completion(
+                    model="gpt-3.5-turbo-1106",
+                    messages=messages,
+                    tools=self.available_functions(),
+                    tool_choice="auto",
+                    on_token=token_emitter(on_event, self.name)
+                )
+            except DeadlineExceeded:
+                return OUT_OF_TIME, reasoning_steps, messages
             msg = response.choices[0].message
             step_info = f"**{self.name} Step {i+1}:**\n"
-            if msg.function_call:
-                fn_name = msg.function_call.name
-                fn_args = json.loads(msg.function_call.arguments)
-                step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
-                result = tool_funcs[fn_name](**fn_args)
-                step_info += f"Tool output: {result}\n"
-                messages.append({"role": "function", "name": fn_name, "content": str(result)})
+            if msg.tool_calls:
+                messages.append(assistant_tool_message(msg))
+                results = run_tool_calls(msg.tool_calls, on_event=on_event, agent=self.name)
+                for call, (fn_name, fn_args, result) in zip(msg.tool_calls, results):
+                    step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
+                    step_info += f"Tool output: {result}\n"
+                    messages.append({"role": "tool", "tool_call_id": call.id, "content": str(result)})
             else:
                 step_info += f"Agent produced final answer."
                 reasoning_steps.append(step_info)
+                emit(on_event, FINAL, agent=self.name, content=msg.content)
+                return msg.content, reasoning_steps, messages
+            reasoning_steps.append(step_info)
+        return "[Agent did not complete the goal in time.]", reasoning_steps, messages
+
+    @traced(AGENT, lambda self, *args, **kwargs: f"agent {self.name}")
+    async def aact(self, messages: List[Dict[str, Any]], max_iters: int = 5, verbose: bool = True, on_event=None):
+        reasoning_steps = []
+        for i in range(max_iters):
+            messages = self.context.compact(messages)
+            try:
+                response = await achat_completion(
+                    model="gpt-3.5-turbo-1106",
+                    messages=messages,
+                    tools=self.available_functions(),
+                    tool_choice="auto",
+                    on_token=token_emitter(on_event, self.name)
+                )
+            except DeadlineExceeded:
+                return OUT_OF_TIME, reasoning_steps, messages
+            msg = response.choices[0].message
+            step_info = f"**{self.name} Step {i+1}:**\n"
+            if msg.tool_calls:
+                messages.append(assistant_tool_message(msg))
+                results = await arun_tool_calls(msg.tool_calls, on_event=on_event, agent=self.name)
+                for call, (fn_name, fn_args, result) in zip(msg.tool_calls, results):
+                    step_info += f"Agent called tool: `{fn_name}` with args: {fn_args}\n"
+                    step_info += f"Tool output: {result}\n"
+                    messages.append({"role": "tool", "tool_call_id": call.id, "content": str(result)})
+            else:
+                step_info += f"Agent produced final answer."
+                reasoning_steps.append(step_info)
+                emit(on_event, FINAL, agent=self.name, content=msg.content)
                 return msg.content, reasoning_steps, messages
             reasoning_steps.append(step_info)
         return "[Agent did not complete the goal in time.]", reasoning_steps, messages
 
 # --- MULTI-AGENT PIPELINE ---
-def multiagent_pipeline(goal: str, agent_configs: List[Dict[str, Any]], max_iters: int = 5, verbose: bool = True):
+@traced(PIPELINE, "multiagent_pipeline")
+def multiagent_pipeline(goal: str, agent_configs: List[Dict[str, Any]], max_iters: int = 5, verbose: bool = True,
+                        on_event=None):
+    current_span().set(goal=goal[:200])
     agents = [Agent(**cfg) for cfg in agent_configs]
-    messages = [{"role": "system", "content": agents[0].system_prompt}, {"role": "user", "content": goal}]
+    messages = [{"role": "system", "content": memory_notes(semantic_memory, agents[0].system_prompt, goal)},
+                {"role": "user", "content": goal}]
     all_steps = []
     last_output = None
     for idx, agent in enumerate(agents):
         if idx > 0:
             # Pass previous output as user message to next agent
-            messages = [{"role": "system", "content": agent.system_prompt}, {"role": "user", "content": last_output}]
-        answer, steps, messages = agent.act(messages, max_iters=max_iters, verbose=verbose)
+            emit(on_event, HANDOFF, from_agent=agents[idx - 1].name, to_agent=agent.name, content=last_output)
+            messages = [{"role": "system", "content": memory_notes(semantic_memory, agent.system_prompt, last_output)},
+                        {"role": "user", "content": last_output}]
+        answer, steps, messages = agent.act(messages, max_iters=max_iters, verbose=verbose, on_event=on_event)
         all_steps.extend(steps)
         last_output = answer
+        if answer == OUT_OF_TIME:
+            break
+    remember_answer(goal, last_output)
     return last_output, all_steps
 
+@traced(PIPELINE, "multiagent_pipeline")
+async def async_multiagent_pipeline(goal: str, agent_configs: List[Dict[str, Any]], max_iters: int = 5,
+                                    verbose: bool = True, on_event=None):
+    """multiagent_pipeline() on the current event loop."""
+    current_span().set(goal=goal[:200])
+    agents = [Agent(**cfg) for cfg in agent_configs]
+    messages = [{"role": "system", "content": memory_notes(semantic_memory, agents[0].system_prompt, goal)},
+                {"role": "user", "content": goal}]
+    all_steps = []
+    last_output = None
+    for idx, agent in enumerate(agents):
+        if idx > 0:
+            emit(on_event, HANDOFF, from_agent=agents[idx - 1].name, to_agent=agent.name, content=last_output)
+            messages = [{"role": "system", "content": memory_notes(semantic_memory, agent.system_prompt, last_output)},
+                        {"role": "user", "content": last_output}]
+        answer, steps, messages = await agent.aact(messages, max_iters=max_iters, verbose=verbose, on_event=on_event)
+        all_steps.extend(steps)
+        last_output = answer
+        if answer == OUT_OF_TIME:
+            break
+    remember_answer(goal, last_output)
+    return last_output, all_steps
+
+def stream_multiagent_pipeline(goal: str, agent_configs: List[Dict[str, Any]], max_iters: int = 5, verbose: bool = True):
+    """Generator of events for multiagent_pipeline(); the last event is DONE
+    with result=(final_answer, steps)."""
+    return iter_events(lambda on_event: multiagent_pipeline(goal, agent_configs, max_iters, verbose, on_event=on_event))
+
 if __name__ == "__main__":
     # Example: Researcher, Writer, Reviewer pipeline
     agent_configs = [
@@ -0,0 +1,328 @@
+"""
+Pipeline server: an HTTP/JSON API in front of a persistent job queue and a pool of worker processes.
+
+    python agentic_server.py --port 8800 --workers 4 --jobs-per-worker 4
+
+    POST   /jobs        {"goal": "...", "pipeline": "agent|multiagent|advanced|dag", "agent_configs": [...],
+                         "max_iters": 5, "deadline": 120}            -> 202 {"id": ..., "status": "queued"}
+    GET    /jobs        ?status=queued&limit=100                     -> recent jobs, without results
+    GET    /jobs/<id>                                                -> status, result/error once finished
+    DELETE /jobs/<id>                                                -> cancel a job that has not started
+    GET    /health                                                   -> queue counts, live workers, draining
+    POST   /drain                                                    -> same as SIGTERM
+
+With AGENTIC_SERVER_TOKEN set, every endpoint but /health requires an
+"Authorization: Bearer <token>" header (401 otherwise).
+
+Jobs live in a SQLite file (AGENTIC_JOB_DB), so they survive restarts. Each
+worker process runs an asyncio loop with several jobs in flight; a job whose
+worker dies is picked up again once its lease expires, and DAG jobs resume
+from their per-job workspace. SIGTERM/SIGINT drain the server: new
+submissions are refused, workers finish the jobs they hold and exit, then
+the API shuts down.
+"""
+import argparse
+import asyncio
+import hmac
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+from agentic_batch_runner import DEFAULT_AGENT_CONFIGS
+from agentic_core.jobqueue import JobQueue, default_path
+
+PIPELINES = ("agent", "multiagent", "advanced", "dag")
+
+# --- CONFIG ---
+WORKERS = int(os.getenv("AGENTIC_SERVER_WORKERS", "0")) or os.cpu_count() or 1
+JOBS_PER_WORKER = int(os.getenv("AGENTIC_SERVER_JOBS_PER_WORKER", "4"))
+JOB_LEASE = float(os.getenv("AGENTIC_JOB_LEASE", "60"))
+JOB_MAX_ATTEMPTS = int(os.getenv("AGENTIC_JOB_MAX_ATTEMPTS", "3"))
+POLL_INTERVAL = float(os.getenv("AGENTIC_SERVER_POLL", "0.25"))
+DRAIN_TIMEOUT = float(os.getenv("AGENTIC_SERVER_DRAIN_TIMEOUT", "300"))
+API_TOKEN = os.getenv("AGENTIC_SERVER_TOKEN") or None
+
+def validate_job(body: Any) -> Dict[str, Any]:
+    """The job payload for a POST /jobs body; raises ValueError with a client-facing message."""
+    if not isinstance(body, dict):
+        raise ValueError("body must be a JSON object")
+    goal = body.get("goal")
+    if not isinstance(goal, str) or not goal.strip():
+        raise ValueError("goal must be a non-empty string")
+    pipeline = body.get("pipeline", "agent")
+    if pipeline not in PIPELINES:
+        raise ValueError(f"pipeline must be one of {', '.join(PIPELINES)}")
+    configs = body.get("agent_configs")
+    if configs is not None and not (isinstance(configs, list) and configs
+                                    and all(isinstance(c, dict) and c.get("name") for c in configs)):
+        raise ValueError("agent_configs must be a non-empty list of objects with a name")
+    max_iters, deadline = body.get("max_iters", 5), body.get("deadline")
+    if not isinstance(max_iters, int) or max_iters < 1:
+        raise ValueError("max_iters must be a positive integer")
+    if deadline is not None and (not isinstance(deadline, (int, float)) or deadline <= 0):
+        raise ValueError("deadline must be a positive number of seconds")
+    return {"goal": goal, "pipeline": pipeline, "agent_configs": configs, "max_iters": max_iters,
+            "deadline": deadline}
+
+# --- JOB EXECUTION (worker processes) ---
+async def run_job(payload: Dict[str, Any], workspace=None) -> Dict[str, Any]:
+    """Run one job payload on the current event loop; pipelines are imported lazily."""
+    from agentic_core.deadline import deadline_scope
+    goal, pipeline, max_iters = payload["goal"], payload["pipeline"], payload["max_iters"]
+    configs = payload.get("agent_configs") or DEFAULT_AGENT_CONFIGS
+    deadline = payload.get("deadline")
+    if pipeline == "advanced":
+        from agentic_advanced_framework import async_advanced_pipeline
+        answer, steps, _ = await async_advanced_pipeline(goal, configs, max_iters=max_iters, verbose=False,
+                                                         deadline=deadline)
+    elif pipeline == "dag":
+        from agentic_advanced_framework import async_dag_pipeline
+        answer, steps, _ = await async_dag_pipeline(goal, configs, max_iters=max_iters, verbose=False,
+                                                    workspace=workspace, deadline=deadline)
+    elif pipeline == "agent":
+        from agentic_framework import async_agentic_function_calling_agent
+        answer, steps = await async_agentic_function_calling_agent(goal, max_iters, False, deadline=deadline)
+    else:
+        from agentic_multiagent_framework import async_multiagent_pipeline
+        with deadline_scope(deadline):
+            answer, steps = await async_multiagent_pipeline(goal, configs, max_iters, False)
+    return {"answer": answer, "steps": steps}
+
+async def _heartbeat(queue: JobQueue, job_id: str, worker: str):
+    """Keep the job's lease alive; returns once the job is no longer this worker's."""
+    while True:
+        await asyncio.sleep(queue.lease_seconds / 3)
+        if not await asyncio.to_thread(queue.heartbeat, job_id, worker):
+            return
+
+async def _run_claimed(queue: JobQueue, job: Dict[str, Any], worker: str):
+    from agentic_core.tracing import PIPELINE, span
+    from agentic_core.workspace import persistent_workspace
+    workspace = None
+    if job["payload"]["pipeline"] == "dag":
+        workspace = persistent_workspace(queue.path + ".workspaces", namespace=job["id"])
+    async def run():
+        with span(f"job {job['payload']['pipeline']}", PIPELINE, job_id=job["id"], attempt=job["attempts"]):
+            return await run_job(job["payload"], workspace)
+    task = asyncio.create_task(run())
+    heartbeat = asyncio.create_task(_heartbeat(queue, job["id"], worker))
+    finished = False
+    try:
+        await asyncio.wait((task, heartbeat), return_when=asyncio.FIRST_COMPLETED)
+        if not task.done():
+            # Our lease lapsed and another worker took the job over: stop rather than run it twice
+            return
+        try:
+            result = task.result()
+        except Exception as e:
+            finished = await asyncio.to_thread(queue.fail, job["id"], worker, f"{type(e).__name__}: {e}")
+        else:
+            finished = await asyncio.to_thread(queue.complete, job["id"], worker, result)
+    finally:
+        heartbeat.cancel()
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if workspace is not None:
+            if finished:  # nothing left to resume; a job taken over keeps its workspace for the new owner
+                workspace.store.clear()
+            workspace.store.close()
+
+async def _worker_loop(queue: JobQueue, worker: str, slots: int, stopping):
+    async def slot():
+        while not stopping():
+            job = await asyncio.to_thread(queue.claim, worker)
+            if job is None:
+                await asyncio.sleep(POLL_INTERVAL)
+            else:
+                await _run_claimed(queue, job, worker)
+    await asyncio.gather(*(slot() for _ in range(slots)))
+
+def worker_main(db_path: str, slots: int, stop_event, lease_seconds: float, max_attempts: int):
+    """Entry point of a worker process: claim and run jobs until the server drains."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C reaches the whole group; the server drains us
+    terminated = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: terminated.set())
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    queue = JobQueue(db_path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    async def main():
+        from agentic_core.runtime import aclose_loop_clients
+        try:
+            await _worker_loop(queue, worker, slots, lambda: stop_event.is_set() or terminated.is_set())
+        finally:
+            await aclose_loop_clients()
+    try:
+        asyncio.run(main())
+    finally:
+        queue.close()
+
+# --- SERVER (API + worker pool) ---
+class PipelineServer:
+    """HTTP API and supervisor of the worker processes; start(), then drain()."""
+    def __init__(self, db_path: Optional[str] = None, host: str = "127.0.0.1", port: int = 8800,
+                 workers: int = WORKERS, jobs_per_worker: int = JOBS_PER_WORKER, lease_seconds: float = JOB_LEASE,
+                 max_attempts: int = JOB_MAX_ATTEMPTS, token: Optional[str] = API_TOKEN):
+        self.db_path = db_path or default_path()
+        self.token = token
+        self.queue = JobQueue(self.db_path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+        self.workers, self.jobs_per_worker = workers, jobs_per_worker
+        self.draining = False
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._ctx = multiprocessing.get_context(start_method)
+        self._stop = self._ctx.Event()
+        self._procs = []
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    def _spawn(self):
+        proc = self._ctx.Process(target=worker_main, daemon=True,
+                                 args=(self.db_path, self.jobs_per_worker, self._stop,
+                                       self.queue.lease_seconds, self.queue.max_attempts))
+        proc.start()
+        return proc
+    def start(self) -> str:
+        self._procs = [self._spawn() for _ in range(self.workers)]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+    def supervise(self):
+        """Replace workers that died outside a drain (their jobs are re-run after the lease)."""
+        if not self.draining:
+            self._procs = [p if p.is_alive() else self._spawn() for p in self._procs]
+    def live_workers(self) -> int:
+        return sum(p.is_alive() for p in self._procs)
+    def drain(self, timeout: float = DRAIN_TIMEOUT) -> bool:
+        """Refuse new jobs, let workers finish what they hold, then stop. False if workers had to be killed."""
+        self.draining = True
+        self._stop.set()
+        end = time.monotonic() + timeout
+        for proc in self._procs:
+            proc.join(max(0.0, end - time.monotonic()))
+        clean = not any(p.is_alive() for p in self._procs)
+        for proc in self._procs:
+            if proc.is_alive():
+                proc.kill()  # its jobs stay "running" and are claimed again after the lease on restart
+                proc.join()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self.queue.close()
+        return clean
+    def health(self) -> Dict[str, Any]:
+        return {"status": "draining" if self.draining else "ok", "workers": self.live_workers(),
+                "jobs_per_worker": self.jobs_per_worker, "queue": self.queue.counts()}
+    def _handler(self):
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            def log_message(self, *args):
+                pass
+            def _json(self, status: int, payload):
+                body = json.dumps(payload, default=str).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def _authorized(self) -> bool:
+                # Sends the 401 itself; compare_digest so the token cannot be guessed by timing
+                if server.token is None:
+                    return True
+                supplied = self.headers.get("Authorization", "").encode()
+                if hmac.compare_digest(supplied, f"Bearer {server.token}".encode()):
+                    return True
+                self._json(401, {"error": "unauthorized"})
+                return False
+            def _job_id(self) -> Optional[str]:
+                parts = urlparse(self.path).path.strip("/").split("/")
+                return parts[1] if len(parts) == 2 and parts[0] == "jobs" else None
+            def do_POST(self):
+                path = urlparse(self.path).path.rstrip("/")
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    self.close_connection = True  # the body cannot be skipped without its length
+                    return self._json(400, {"error": "invalid Content-Length"})
+                raw = self.rfile.read(length)
+                if not self._authorized():
+                    return
+                if path == "/drain":
+                    threading.Thread(target=server.drain, daemon=True).start()
+                    return self._json(202, {"status": "draining"})
+                if path != "/jobs":
+                    return self._json(404, {"error": "not found"})
+                if server.draining:
+                    return self._json(503, {"error": "server is draining"})
+                try:
+                    payload = validate_job(json.loads(raw or b"{}"))
+                except ValueError as e:  # json.JSONDecodeError is a ValueError too
+                    return self._json(400, {"error": str(e)})
+                self._json(202, {"id": server.queue.submit(payload), "status": "queued"})
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.rstrip("/") == "/health":
+                    return self._json(200, server.health())
+                if not self._authorized():
+                    return
+                if url.path.rstrip("/") == "/jobs":
+                    query = parse_qs(url.query)
+                    try:
+                        limit = int(query.get("limit", ["100"])[0])
+                    except ValueError:
+                        return self._json(400, {"error": "limit must be an integer"})
+                    return self._json(200, {"jobs": server.queue.list(query.get("status", [None])[0], limit)})
+                job_id = self._job_id()
+                job = server.queue.get(job_id) if job_id else None
+                if job is None:
+                    return self._json(404, {"error": "not found"})
+                self._json(200, job)
+            def do_DELETE(self):
+                if not self._authorized():
+                    return
+                job_id = self._job_id()
+                job = server.queue.get(job_id) if job_id else None
+                if job is None:
+                    return self._json(404, {"error": "not found"})
+                if not server.queue.cancel(job_id):
+                    return self._json(409, {"error": f"job is {job['status']}", "status": job["status"]})
+                self._json(200, {"id": job_id, "status": "cancelled"})
+        return Handler
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--db", default=default_path(), help="SQLite job queue file (AGENTIC_JOB_DB)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="worker processes (default: CPU count)")
+    parser.add_argument("--jobs-per-worker", type=int, default=JOBS_PER_WORKER, help="jobs in flight per worker")
+    parser.add_argument("--drain-timeout", type=float, default=DRAIN_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    server = PipelineServer(args.db, args.host, args.port, args.workers, args.jobs_per_worker)
+    stop = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: stop.set())
+    print(f"Serving pipelines on {server.start()} with {args.workers} workers x {args.jobs_per_worker} jobs",
+          flush=True)
+    while not stop.wait(1.0) and not server.draining:
+        server.supervise()
+    if not server.draining:  # POST /drain runs its own drain
+        print("Draining: finishing running jobs...", flush=True)
+        clean = server.drain(args.drain_timeout)
+        print("Stopped." if clean else "Drain timed out; unfinished jobs will be re-run on restart.", flush=True)
+    else:
+        server._thread.join()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+End-to-end benchmark: agent loops and pipelines against local mock LLM/search/Wikipedia servers.
+
+    python benchmarks/agent_bench.py --goals 40 --concurrency 8 --llm-latency 0.2 --token-rate 100
+    python benchmarks/agent_bench.py --scenario advanced dag --llm-latency 0 --tool-latency 0 --json
+
+Every goal runs under a tracing span, so besides throughput and latency the
+report gives orchestration overhead per step: goal wall time not covered by
+any LLM call or tool call, divided by the number of LLM calls. Run with zero
+mock latency to isolate that overhead. The `examples` scenario runs the
+three example pipelines once per goal. Memory is peak RSS of the process
+(and the tracemalloc peak with --tracemalloc, which slows the run).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockConfig, MockServer
+
+CONFIGS = [
+    {"name": "Researcher", "system_prompt": "You research the topic.", "toolset": ["web_search", "wikipedia_search", "summarize"]},
+    {"name": "Writer", "system_prompt": "You write the article.", "toolset": ["summarize", "translate", "extract_entities"]},
+    {"name": "Reviewer", "system_prompt": "You review the article.", "toolset": ["summarize", "sentiment_analysis"]},
+]
+DAG_CONFIGS = [
+    {"name": "Web", "system_prompt": "Search the web.", "toolset": ["web_search"]},
+    {"name": "Wiki", "system_prompt": "Search Wikipedia.", "toolset": ["wikipedia_search"]},
+    {"name": "Writer", "system_prompt": "Write it up.", "toolset": ["summarize"], "inputs": ["Web", "Wiki"]},
+]
+
+def scenarios():
+    # Imported after the environment points at the mock server
+    import agentic_framework
+    import agentic_multiagent_framework
+    import agentic_advanced_framework
+    from examples.blog_pipeline import run_blog_pipeline
+    from examples.qa_pipeline import run_qa_pipeline
+    from examples.debate_pipeline import run_debate_pipeline
+    def examples(goal):
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_blog_pipeline()
+            run_qa_pipeline()
+            run_debate_pipeline()
+    return {
+        "function_calling": lambda goal: agentic_framework.agentic_function_calling_agent(goal),
+        "multiagent": lambda goal: agentic_multiagent_framework.multiagent_pipeline(goal, CONFIGS),
+        "advanced": lambda goal: agentic_advanced_framework.advanced_pipeline(goal, CONFIGS),
+        "dag": lambda goal: agentic_advanced_framework.dag_pipeline(goal, DAG_CONFIGS),
+        "examples": examples,
+    }
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+def run_scenario(name, run, goals: int, concurrency: int, exporter):
+    from agentic_core import tracing
+    def one(i):
+        goal = f"Goal {i}: explain topic number {i} for the {name} benchmark"
+        start = time.perf_counter()
+        with tracing.span(f"goal {name}", tracing.PIPELINE, goal=goal):
+            run(goal)
+        return time.perf_counter() - start
+    # One untimed goal first: lazy imports and client set-up are not part of the steady state
+    one(-1)
+    exporter.spans.clear()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(one, range(goals)))
+    wall = time.perf_counter() - start
+    traces = [t for t in tracing.summarize_traces([s.to_dict() for s in exporter.spans])
+              if t["name"] == f"goal {name}"]
+    steps = sum(t["llm_calls"] for t in traces)
+    return {
+        "goals": goals, "goals_per_s": goals / wall,
+        "p50_ms": percentile(latencies, 0.50) * 1000, "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "llm_calls": steps, "tool_calls": sum(t["tool_calls"] for t in traces),
+        "overhead_ms_per_step": sum(t["orchestration_ms"] for t in traces) / steps if steps else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", nargs="*", default=None, help="default: all")
+    parser.add_argument("--goals", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="seconds per completion request")
+    parser.add_argument("--token-rate", type=float, default=0.0, help="completion tokens/s (0 = instant)")
+    parser.add_argument("--tool-latency", type=float, default=0.02, help="seconds per search/Wikipedia request")
+    parser.add_argument("--tracemalloc", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    server = MockServer(MockConfig(args.llm_latency, args.token_rate, tool_latency=args.tool_latency))
+    server.start()
+    os.environ.update(server.env())
+    # Measure the pipelines, not cache or memory hits across goals
+    os.environ.update({"AGENTIC_SEMANTIC_MEMORY": "off", "AGENTIC_LLM_CACHE_MODE": "off"})
+    from agentic_core import tracing
+    exporter = tracing.MemoryExporter()
+    tracing.tracer.exporter = exporter
+    available = scenarios()
+    if args.tracemalloc:
+        tracemalloc.start()
+    results = {}
+    for name in args.scenario or list(available):
+        results[name] = run_scenario(name, available[name], args.goals, args.concurrency, exporter)
+        if args.tracemalloc:
+            results[name]["tracemalloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.reset_peak()
+    server.stop()
+    if args.json:
+        print(json.dumps({"config": vars(args), "server_requests": server.stats, "results": results}, indent=2))
+        return
+    print(f"{'scenario':18} {'goals/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'llm':>5} {'tools':>5} "
+          f"{'ovh ms/step':>11} {'rss MB':>7}")
+    for name, r in results.items():
+        overhead = f"{r['overhead_ms_per_step']:.2f}" if r["overhead_ms_per_step"] is not None else "-"
+        print(f"{name:18} {r['goals_per_s']:8.2f} {r['p50_ms']:8.1f} {r['p95_ms']:8.1f} {r['p99_ms']:8.1f} "
+              f"{r['llm_calls']:5} {r['tool_calls']:5} {overhead:>11} {r['peak_rss_mb']:7.1f}")
+
+if __name__ == "__main__":
+    main()
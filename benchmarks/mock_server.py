@@ -0,0 +1,192 @@
+"""
+Local stand-ins for the OpenAI chat completions API, Serper and Wikipedia, for offline benchmarks.
+
+    python benchmarks/mock_server.py --port 8900 --llm-latency 0.3 --token-rate 80
+
+Chat completions follow a scripted function-call sequence: the step is the
+number of assistant tool-call turns already in the conversation, and each
+step either calls tools (only those offered in the request; arguments may use
+{topic}, the start of the last user message) or answers. Requests without
+tools (summarize, translate...) are answered directly, and JSON-mode requests
+(batched tool calls) get {"results": [...]} with one entry per "### Task"
+heading. Latency is a fixed
+per-request delay plus completion_tokens / token_rate; streaming is supported.
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+
+DEFAULT_SCRIPT = [
+    {"tool_calls": [["web_search", {"query": "{topic}"}], ["wikipedia_search", {"query": "{topic}"}]]},
+    {"tool_calls": [["summarize", {"text": "Notes on {topic}"}]]},
+    {"content": "Final answer about {topic}."},
+]
+
+class MockConfig:
+    def __init__(self, llm_latency: float = 0.05, token_rate: float = 0.0, completion_tokens: int = 60,
+                 tool_latency: float = 0.02, script: Optional[List[Dict[str, Any]]] = None):
+        self.llm_latency = llm_latency
+        self.token_rate = token_rate  # completion tokens per second; 0 = instant
+        self.completion_tokens = completion_tokens
+        self.tool_latency = tool_latency
+        self.script = script or DEFAULT_SCRIPT
+
+_WORDS = "the model reviewed sources and found several relevant results worth noting here".split()
+
+def _filler(tokens: int) -> str:
+    return " ".join(_WORDS[i % len(_WORDS)] for i in range(max(0, tokens)))
+
+def _topic(messages: List[Dict[str, Any]]) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user" and isinstance(message.get("content"), str):
+            return re.sub(r"\s+", " ", message["content"])[:60]
+    return "the question"
+
+def _fill(value, topic: str):
+    if isinstance(value, str):
+        return value.replace("{topic}", topic)
+    if isinstance(value, dict):
+        return {k: _fill(v, topic) for k, v in value.items()}
+    return value
+
+class MockServer:
+    """Threaded HTTP server; start() returns the base URL."""
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self.stats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+    def env(self) -> Dict[str, str]:
+        """Environment variables that point the framework at this server."""
+        return {"OPENAI_BASE_URL": f"{self.url}/v1", "OPENAI_API_KEY": "mock", "SERPER_API_KEY": "mock",
+                "AGENTIC_SERPER_URL": f"{self.url}/search", "AGENTIC_WIKIPEDIA_URL": f"{self.url}/wiki/{{}}"}
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+    def reply(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """The assistant message for a chat completion request."""
+        messages = request.get("messages", [])
+        topic = _topic(messages)
+        if (request.get("response_format") or {}).get("type") == "json_object":
+            tasks = len(re.findall(r"^### Task \d+", messages[-1].get("content") or "", re.M)) or 1
+            filler = _filler(self.config.completion_tokens // tasks)
+            return {"role": "assistant",
+                    "content": json.dumps({"results": [f"Result {i + 1}: {filler}" for i in range(tasks)]})}
+        offered = {t["function"]["name"] for t in request.get("tools") or []}
+        step = sum(1 for m in messages if m.get("role") == "assistant" and m.get("tool_calls"))
+        for entry in self.config.script[step:] if offered else []:
+            calls = [(name, args) for name, args in entry.get("tool_calls", []) if name in offered]
+            if calls:
+                return {"role": "assistant", "content": None, "tool_calls": [
+                    {"id": f"call_{step}_{i}", "type": "function",
+                     "function": {"name": name, "arguments": json.dumps(_fill(args, topic))}}
+                    for i, (name, args) in enumerate(calls)]}
+            if "content" in entry:
+                break
+        final = next((e["content"] for e in self.config.script if "content" in e), "Done.")
+        return {"role": "assistant", "content": f"{_fill(final, topic)} {_filler(self.config.completion_tokens)}"}
+    def _handler(self):
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            def log_message(self, *args):
+                pass
+            def _json(self, status: int, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def _body(self) -> Dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+            def do_POST(self):
+                if self.path.rstrip("/").endswith("/chat/completions"):
+                    return self._chat(self._body())
+                if self.path.startswith("/search"):
+                    query = self._body().get("q", "")
+                    server._count("search")
+                    time.sleep(server.config.tool_latency)
+                    return self._json(200, {"organic": [{"title": f"{query} result {i}",
+                                                         "snippet": f"Snippet {i} about {query}."} for i in range(5)]})
+                self._json(404, {"error": "not found"})
+            def do_GET(self):
+                if self.path.startswith("/wiki/"):
+                    title = unquote(self.path[len("/wiki/"):]).replace("_", " ")
+                    server._count("wikipedia")
+                    time.sleep(server.config.tool_latency)
+                    return self._json(200, {"title": title, "extract": f"{title} is a topic. {_filler(40)}"})
+                self._json(404, {"error": "not found"})
+            def _chat(self, request: Dict[str, Any]):
+                server._count("chat")
+                message = server.reply(request)
+                prompt_tokens = len(json.dumps(request.get("messages", []))) // 4
+                completion_tokens = len((message.get("content") or "").split()) or 20
+                rate = server.config.token_rate
+                time.sleep(server.config.llm_latency + (completion_tokens / rate if rate else 0))
+                meta = {"id": "chatcmpl-mock", "created": int(time.time()), "model": request.get("model", "mock")}
+                usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                         "total_tokens": prompt_tokens + completion_tokens}
+                if not request.get("stream"):
+                    return self._json(200, dict(meta, object="chat.completion", usage=usage, choices=[
+                        {"index": 0, "message": message,
+                         "finish_reason": "tool_calls" if message.get("tool_calls") else "stop"}]))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                def chunk(delta, finish=None):
+                    payload = dict(meta, object="chat.completion.chunk",
+                                   choices=[{"index": 0, "delta": delta, "finish_reason": finish}])
+                    self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+                    self.wfile.flush()
+                if message.get("tool_calls"):
+                    chunk({"role": "assistant", "tool_calls": [dict(call, index=i)
+                                                               for i, call in enumerate(message["tool_calls"])]})
+                    chunk({}, "tool_calls")
+                else:
+                    words = message["content"].split(" ")
+                    for i in range(0, len(words), 8):
+                        chunk({"content": " ".join(words[i:i + 8]) + (" " if i + 8 < len(words) else "")})
+                    chunk({}, "stop")
+                self.wfile.write(b"data: [DONE]\n\n")
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--token-rate", type=float, default=0.0)
+    parser.add_argument("--tool-latency", type=float, default=0.02)
+    args = parser.parse_args()
+    server = MockServer(MockConfig(args.llm_latency, args.token_rate, tool_latency=args.tool_latency), port=args.port)
+    server.start()
+    for key, value in server.env().items():
+        print(f"export {key}={value}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
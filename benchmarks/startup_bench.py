@@ -0,0 +1,76 @@
+"""
+Start-up benchmark: cold import time of the entry-point modules, from `python -X importtime`.
+
+    python benchmarks/startup_bench.py --runs 5
+    python benchmarks/startup_bench.py --json > startup.json
+    python benchmarks/startup_bench.py --baseline startup.json
+
+Each module is imported in a fresh interpreter (so nothing is cached in
+sys.modules) and the cumulative import time reported by -X importtime is
+recorded. The median over --runs is printed with the slowest imports of the
+last run, so a regression points straight at the dependency that caused it.
+With --baseline, the difference from an earlier --json run is shown too.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ["agentic_framework", "agentic_advanced_framework", "agentic_multiagent_framework",
+           "complex_agent", "agentic_batch_runner", "agentic_core.agent"]
+
+def import_times(module: str):
+    """{imported module: cumulative microseconds} for one cold import of `module`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                          capture_output=True, text=True, env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"))
+    if proc.returncode:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cumulative.isdigit():
+            times[name] = int(cumulative)
+    return times
+
+def measure(modules, runs: int):
+    results = {}
+    for module in modules:
+        samples, last = [], {}
+        for _ in range(runs):
+            last = import_times(module)
+            samples.append(last.get(module, 0))
+        offenders = sorted(((t, name) for name, t in last.items() if name != module and "." not in name),
+                           reverse=True)[:5]
+        results[module] = {"median_ms": statistics.median(samples) / 1000,
+                           "top": [[name, t / 1000] for t, name in offenders]}
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--baseline", help="JSON file from an earlier --json run to compare against")
+    args = parser.parse_args()
+    results = measure(args.modules, args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(f"{'module':32} {'median ms':>10} {'vs base':>9}  slowest top-level imports")
+    for module, result in results.items():
+        before = baseline.get(module, {}).get("median_ms")
+        delta = f"{result['median_ms'] - before:+.0f}" if before is not None else "-"
+        top = ", ".join(f"{name} {ms:.0f}" for name, ms in result["top"][:3])
+        print(f"{module:32} {result['median_ms']:10.1f} {delta:>9}  {top}")
+
+if __name__ == "__main__":
+    main()
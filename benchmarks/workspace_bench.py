@@ -0,0 +1,80 @@
+"""
+Micro-benchmark: single-lock Workspace vs ShardedWorkspace under concurrent load.
+
+    python benchmarks/workspace_bench.py --threads 1 2 4 8 16 --ops 20000 --keys 64
+
+Each thread runs a mix of reads, writes and appends over a shared key space
+and periodically takes a full view of the workspace (all() on the locked
+baseline, snapshot() on the sharded one). A second table compares the cost
+of that full view alone as the workspace grows.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agentic_core.workspace import LockedWorkspace, ShardedWorkspace
+
+def run(workspace, threads: int, ops: int, keys: int, snapshot_every: int) -> float:
+    for k in range(keys):
+        workspace.set(f"key{k}", k)
+    view = getattr(workspace, "snapshot", workspace.all)
+    barrier = threading.Barrier(threads + 1)
+    def worker(n):
+        barrier.wait()
+        for i in range(ops):
+            key = f"key{(n * 7919 + i) % keys}"
+            op = i % 10
+            if op < 6:
+                workspace.get(key)
+            elif op < 9:
+                workspace.set(key, i)
+            else:
+                workspace.append(f"log{n % keys}", i)
+            if snapshot_every and i % snapshot_every == 0:
+                view()
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops / elapsed
+
+def view_cost(workspace, size: int, repeat: int = 20) -> float:
+    """Microseconds per full view of a workspace holding `size` keys."""
+    for k in range(size):
+        workspace.set(f"key{k}", k)
+    view = getattr(workspace, "snapshot", workspace.all)
+    start = time.perf_counter()
+    for i in range(repeat):
+        view()
+        workspace.set(f"key{i}", i)  # a write between views forces copy-on-write
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--ops", type=int, default=20000, help="operations per thread")
+    parser.add_argument("--keys", type=int, default=64)
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--snapshot-every", type=int, default=500, help="0 disables snapshots")
+    args = parser.parse_args()
+    print(f"{'threads':>8} {'locked ops/s':>14} {'sharded ops/s':>14} {'speedup':>8}")
+    for threads in args.threads:
+        locked = run(LockedWorkspace(), threads, args.ops, args.keys, args.snapshot_every)
+        sharded = run(ShardedWorkspace(args.shards), threads, args.ops, args.keys, args.snapshot_every)
+        print(f"{threads:>8} {locked:>14,.0f} {sharded:>14,.0f} {sharded / locked:>7.2f}x")
+    print(f"\n{'keys':>8} {'all() us':>14} {'snapshot() us':>14} {'speedup':>8}")
+    for size in (1000, 10000, 100000):
+        locked = view_cost(LockedWorkspace(), size)
+        sharded = view_cost(ShardedWorkspace(args.shards), size)
+        print(f"{size:>8} {locked:>14,.1f} {sharded:>14,.1f} {locked / sharded:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
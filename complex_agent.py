@@ -1,67 +1,29 @@
-import os
-import requests
 from dotenv import load_dotenv
-import openai
 from typing import Callable, Dict, List, Any
+from agentic_framework import chat_completion, call_tool
+from agentic_core.tool import ToolRegistry, ToolArgumentError
 
 load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
-SERPER_API_KEY = os.getenv("SERPER_API_KEY")
 
-# --- Define Tools ---
-def web_search_tool(query: str) -> str:
-    url = "https://google.serper.dev/search"
-    headers = {
-        "X-API-KEY": SERPER_API_KEY,
-        "Content-Type": "application/json"
-    }
-    payload = {"q": query}
-    response = requests.post(url, headers=headers, json=payload)
-    if response.status_code == 200:
-        data = response.json()
-        snippets = [res.get("snippet") or res.get("title") for res in data.get("organic", [])]
-        return "\n".join(snippet for snippet in snippets if snippet)
-    else:
-        return f"[Error fetching search results: {response.status_code}]"
+# --- Tools ---
+# Served from the shared ToolRegistry populated by agentic_framework
+TOOLSET = ["web_search", "calculator", "summarize"]
 
-def calculator_tool(expression: str) -> str:
+def run_text_tool(name: str, text: str) -> str:
+    """Call a registered tool with the model's single text input as its first parameter."""
+    params = list(ToolRegistry.get(name).schema["parameters"]["properties"])
     try:
-        result = eval(expression, {"__builtins__": {}})
-        return str(result)
-    except Exception as e:
-        return f"[Calculator error: {e}]"
-
-def summarize_tool(text: str) -> str:
-    prompt = f"Summarize the following text in 2 sentences:\n{text}"
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=200
-    )
-    return response.choices[0].message.content.strip()
-
-# --- Tool Registry ---
-tools = {
-    "web_search": {
-        "description": "Search the web for information on any topic.",
-        "func": web_search_tool
-    },
-    "calculator": {
-        "description": "Evaluate a math expression.",
-        "func": calculator_tool
-    },
-    "summarize": {
-        "description": "Summarize a block of text.",
-        "func": summarize_tool
-    }
-}
+        args = ToolRegistry.validate(name, {params[0]: text} if params else {})
+    except ToolArgumentError as e:
+        return f"[Tool argument error: {e}]"
+    return call_tool(name, args)
 
 # --- Agent Reasoning Loop ---
 def agentic_reasoning_loop(goal: str, max_iters: int = 5) -> str:
     history = []
     for step in range(max_iters):
         # Compose the agent's prompt
-        tool_descriptions = "\n".join(f"- {name}: {meta['description']}" for name, meta in tools.items())
+        tool_descriptions = ToolRegistry.describe(TOOLSET)
         context = "\n".join(f"Step {i+1}: {h}" for i, h in enumerate(history))
         prompt = (
             f"You are an agent with access to these tools:\n{tool_descriptions}\n\n"
@@ -71,7 +33,7 @@ def agentic_reasoning_loop(goal: str, max_iters: int = 5) -> str:
             "TOOL: <tool_name>\nINPUT: <input_for_tool>\n"
             "If you believe the goal is complete, reply with:\nDONE: <final_answer>\n"
         )
-        response = openai.chat.completions.create(
+        response = chat_completion(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=300
@@ -87,8 +49,8 @@ def agentic_reasoning_loop(goal: str, max_iters: int = 5) -> str:
             if tool_line and input_line:
                 tool_name = tool_line[len("TOOL:"):].strip()
                 tool_input = input_line[len("INPUT:"):].strip()
-                if tool_name in tools:
-                    tool_result = tools[tool_name]["func"](tool_input)
+                if tool_name in TOOLSET:
+                    tool_result = run_text_tool(tool_name, tool_input)
                     history.append(f"Agent used {tool_name} with input '{tool_input}' and got: {tool_result}")
                 else:
                     history.append(f"Agent tried unknown tool '{tool_name}'")
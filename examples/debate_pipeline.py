@@ -1,4 +1,4 @@
-from agentic_core.agent import Agent
+from agentic_advanced_framework import Agent
 from agentic_core.memory import Memory
 
 def run_debate_pipeline():
@@ -0,0 +1,35 @@
+import unittest
+from agentic_core.arithmetic import calculate, evaluate, evaluate_many, compile_expression, CalculatorError
+
+class TestArithmetic(unittest.TestCase):
+    def test_operators_functions_and_constants(self):
+        self.assertEqual(evaluate("2 + 3 * 4"), 14)
+        self.assertEqual(evaluate("2 ^ 10"), 1024)
+        self.assertEqual(evaluate("7 // 2 + 7 % 2"), 4)
+        self.assertAlmostEqual(evaluate("sqrt(16) + sin(pi / 2)"), 5.0)
+        self.assertEqual(evaluate("max(1, factorial(4), 3)"), 24)
+    def test_rejects_unsafe_input(self):
+        for expression in ['__import__("os")', "().__class__", "x + 1", "[1, 2]", "lambda: 1", "open('f')"]:
+            with self.subTest(expression=expression), self.assertRaises(CalculatorError):
+                evaluate(expression)
+    def test_guards_against_huge_results(self):
+        for expression in ["9 ** 9 ** 9", "2 ** 9000 * 2 ** 9000", "factorial(100000)", "10.0 ** 400", "1 / 0",
+                           "1" + " + 1" * 500]:
+            with self.subTest(expression=expression[:30]), self.assertRaises(CalculatorError):
+                evaluate(expression)
+    def test_compiled_expressions_are_cached(self):
+        compile_expression.cache_clear()
+        evaluate("1 + 2")
+        evaluate("1 + 2")
+        self.assertEqual(compile_expression.cache_info().hits, 1)
+    def test_batch_and_tool_output(self):
+        results = evaluate_many(["1 + 1", "1 / 0", "3 * 3"])
+        self.assertEqual(results[0], 2)
+        self.assertIsInstance(results[1], CalculatorError)
+        self.assertEqual(results[2], 9)
+        self.assertEqual(calculate("6 * 7"), "42")
+        self.assertEqual(calculate("1/0"), "[Calculator error: division by zero]")
+        self.assertEqual(calculate("1 + 1; 2 * 3"), "1 + 1 = 2\n2 * 3 = 6")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from agentic_core.batch import run_batch, completed_ids, record_goal
+
+def read_results(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+class TestRunBatch(unittest.TestCase):
+    def setUp(self):
+        self.output = os.path.join(tempfile.mkdtemp(), "results.jsonl")
+    def test_writes_one_result_per_record(self):
+        records = [{"id": str(i), "goal": f"goal {i}"} for i in range(10)]
+        counts = run_batch(records, lambda goal: goal.upper(), self.output, concurrency=3)
+        self.assertEqual(counts["ok"], 10)
+        answers = {r["id"]: r["answer"] for r in read_results(self.output)}
+        self.assertEqual(answers["7"], "GOAL 7")
+    def test_errors_are_recorded_and_retried_on_resume(self):
+        records = [{"id": "a", "goal": "fine"}, {"id": "b", "goal": "boom"}]
+        def flaky(goal):
+            if goal == "boom":
+                raise RuntimeError("rate limited")
+            return goal
+        counts = run_batch(records, flaky, self.output)
+        self.assertEqual((counts["ok"], counts["error"]), (1, 1))
+        self.assertEqual(completed_ids(self.output), {"a"})
+        counts = run_batch(records, lambda goal: goal, self.output)
+        self.assertEqual((counts["ok"], counts["skipped"]), (1, 1))
+        self.assertEqual(completed_ids(self.output), {"a", "b"})
+    def test_concurrency_limit(self):
+        active, peak, lock = [0], [0], threading.Lock()
+        def handler(goal):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+            return goal
+        run_batch(({"id": str(i), "goal": "g"} for i in range(20)), handler, self.output, concurrency=4)
+        self.assertLessEqual(peak[0], 4)
+    def test_goal_from_request_records(self):
+        self.assertEqual(record_goal({"request_id": "x", "title": "T", "body": "B"}), "T\n\nB")
+
+if __name__ == "__main__":
+    unittest.main()
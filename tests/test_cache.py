@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from agentic_core.cache import ToolCache, make_key
+from agentic_core.tool import Tool, ToolRegistry
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    def __call__(self):
+        return self.now
+
+class TestToolCache(unittest.TestCase):
+    def test_key_ignores_arg_order(self):
+        self.assertEqual(make_key("translate", {"text": "hi", "target_language": "fr"}),
+                         make_key("translate", {"target_language": "fr", "text": "hi"}))
+        self.assertNotEqual(make_key("summarize", {"text": "hi"}), make_key("sentiment_analysis", {"text": "hi"}))
+    def test_hit_miss_counters(self):
+        cache = ToolCache()
+        calls = []
+        func = lambda: calls.append(1) or "result"
+        self.assertEqual(cache.get_or_call("web_search", {"query": "ai"}, func), "result")
+        self.assertEqual(cache.get_or_call("web_search", {"query": "ai"}, func), "result")
+        self.assertEqual(len(calls), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = ToolCache(ttls={"web_search": 60}, clock=clock)
+        cache.store("web_search", {"query": "ai"}, "old")
+        self.assertEqual(cache.lookup("web_search", {"query": "ai"}), (True, "old"))
+        clock.now += 61
+        self.assertEqual(cache.lookup("web_search", {"query": "ai"}), (False, None))
+    def test_lru_eviction(self):
+        cache = ToolCache(max_entries=2)
+        cache.store("t", {"x": 1}, 1)
+        cache.store("t", {"x": 2}, 2)
+        cache.lookup("t", {"x": 1})  # x=1 becomes most recently used
+        cache.store("t", {"x": 3}, 3)
+        self.assertEqual(cache.lookup("t", {"x": 2}), (False, None))
+        self.assertEqual(cache.lookup("t", {"x": 1}), (True, 1))
+        self.assertEqual(cache.stats()["evictions"], 1)
+    def test_disk_tier_survives_restart(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+        ToolCache(path=path).store("wikipedia_search", {"query": "Python"}, "A language")
+        cache = ToolCache(path=path)
+        self.assertEqual(cache.lookup("wikipedia_search", {"query": "Python"}), (True, "A language"))
+        self.assertEqual(cache.stats()["disk_hits"], 1)
+    def test_skip_uncacheable_results(self):
+        cache = ToolCache()
+        cache.get_or_call("t", {}, lambda: "[error]", should_cache=lambda r: not r.startswith("["))
+        self.assertEqual(cache.lookup("t", {}), (False, None))
+
+class TestRegistryCache(unittest.TestCase):
+    def setUp(self):
+        self._saved = (ToolRegistry.cache, ToolRegistry.cache_filter)
+    def tearDown(self):
+        ToolRegistry.cache, ToolRegistry.cache_filter = self._saved
+        ToolRegistry._tools.pop("echo_cached", None)
+    def test_call_tool_uses_cache(self):
+        calls = []
+        ToolRegistry.register_tool(Tool("echo_cached", "Echo", lambda text: calls.append(text) or text, cacheable=True))
+        ToolRegistry.cache = ToolCache()
+        ToolRegistry.call_tool("echo_cached", text="hi")
+        ToolRegistry.call_tool("echo_cached", text="hi")
+        self.assertEqual(calls, ["hi"])
+    def test_framework_shares_tool_cache_with_registry(self):
+        import agentic_framework
+        self.assertIs(ToolRegistry.cache, agentic_framework.tool_cache)
+        self.assertEqual({t.name for t in ToolRegistry.get_tools() if t.cacheable},
+                         set(agentic_framework.TOOL_CACHE_TTLS))
+        self.assertFalse(ToolRegistry.cache_filter("[URL error: 404]"))
+    def test_discovered_tools_match_the_framework(self):
+        import agentic_framework
+        from agentic_core.tool import load_entry
+        from tools import TOOLS
+        self.assertEqual({name for name, meta in TOOLS.items() if meta.get("cacheable")},
+                         set(agentic_framework.TOOL_CACHE_TTLS))
+        for name in ("web_search", "wikipedia_search", "url_reader"):
+            meta = TOOLS[name]
+            self.assertIs(load_entry(meta["entry"]), getattr(agentic_framework, name))
+            self.assertIs(load_entry(meta["async_entry"]), getattr(agentic_framework, f"async_{name}"))
+
+if __name__ == "__main__":
+    unittest.main()
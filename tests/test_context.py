@@ -0,0 +1,45 @@
+import unittest
+from agentic_core.context import ContextManager, message_tokens
+
+def tool_turn(i, output):
+    call = {"id": f"call_{i}", "type": "function", "function": {"name": "web_search", "arguments": "{}"}}
+    return [{"role": "assistant", "content": None, "tool_calls": [call]},
+            {"role": "tool", "tool_call_id": f"call_{i}", "content": output}]
+
+def conversation(turns, output_len=4000):
+    messages = [{"role": "system", "content": "You are a researcher."}, {"role": "user", "content": "Research AI."}]
+    for i in range(turns):
+        messages.extend(tool_turn(i, "x" * output_len))
+    return messages
+
+class TestContextManager(unittest.TestCase):
+    def test_within_budget_is_untouched(self):
+        messages = conversation(2, output_len=10)
+        self.assertIs(ContextManager(max_tokens=10000).compact(messages), messages)
+    def test_truncates_stale_tool_outputs_first(self):
+        ctx = ContextManager(max_tokens=3500, keep_recent=2, stale_tool_chars=100)
+        messages = conversation(6)
+        compacted = ctx.compact(messages)
+        self.assertLessEqual(ctx.total(compacted), 3500)
+        self.assertEqual(len(compacted), len(messages))  # nothing dropped, only truncated
+        self.assertEqual(compacted[-1]["content"], "x" * 4000)  # recent turns verbatim
+        self.assertIn("truncated", compacted[3]["content"])
+        self.assertGreater(ctx.tokens_saved, 0)
+    def test_keeps_head_and_tool_call_pairs(self):
+        ctx = ContextManager(max_tokens=1200, keep_recent=1)
+        compacted = ctx.compact(conversation(40))
+        self.assertEqual([m["role"] for m in compacted[:2]], ["system", "user"])
+        ids = {c["id"] for m in compacted if m.get("tool_calls") for c in m["tool_calls"]}
+        answered = {m["tool_call_id"] for m in compacted if m["role"] == "tool"}
+        self.assertEqual(ids, answered)
+        self.assertLessEqual(ctx.total(compacted), 1200)
+    def test_rolling_summary(self):
+        ctx = ContextManager(max_tokens=1200, keep_recent=1, summarizer=lambda text: "searched many times")
+        compacted = ctx.compact(conversation(40))
+        self.assertIn("searched many times", compacted[2]["content"])
+        self.assertEqual(len(compacted), 2 + 1 + 2)
+    def test_message_tokens_counts_tool_calls(self):
+        self.assertGreater(message_tokens(tool_turn(0, "")[0]), message_tokens({"role": "assistant", "content": None}))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import asyncio
+import time
+import unittest
+from agentic_core.dag import arun_dag, validate_dag, descendants, sinks, BackEdge
+from agentic_core.routing import linear_dag
+
+RESEARCH_DAG = {
+    "WebResearcher": [],
+    "WikiResearcher": [],
+    "Writer": ["WebResearcher", "WikiResearcher"],
+    "Reviewer": ["Writer"],
+}
+
+class TestDag(unittest.TestCase):
+    def test_validate_rejects_cycles_and_unknown_nodes(self):
+        with self.assertRaises(ValueError):
+            validate_dag({"A": ["B"], "B": ["A"]})
+        with self.assertRaises(ValueError):
+            validate_dag({"A": ["Missing"]})
+        order = validate_dag(RESEARCH_DAG)
+        self.assertLess(order.index("WebResearcher"), order.index("Writer"))
+    def test_helpers(self):
+        self.assertEqual(descendants(RESEARCH_DAG, "WikiResearcher"), {"Writer", "Reviewer"})
+        self.assertEqual(sinks(RESEARCH_DAG), ["Reviewer"])
+        self.assertEqual(linear_dag(["A", "B", "C"]), {"A": [], "B": ["A"], "C": ["B"]})
+    def test_fan_out_runs_concurrently_and_fans_in(self):
+        seen_inputs = {}
+        async def run_node(name, inputs, feedback):
+            seen_inputs[name] = inputs
+            await asyncio.sleep(0.1)
+            return name.lower()
+        start = time.perf_counter()
+        outputs = asyncio.run(arun_dag(RESEARCH_DAG, run_node))
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 0.35)  # two researchers in parallel: 3 levels, not 4 sequential steps
+        self.assertEqual(seen_inputs["Writer"], {"WebResearcher": "webresearcher", "WikiResearcher": "wikiresearcher"})
+        self.assertEqual(outputs["Reviewer"], "reviewer")
+    def test_back_edge_is_bounded(self):
+        runs = []
+        async def run_node(name, inputs, feedback):
+            runs.append((name, feedback))
+            return "Needs revision" if name == "Reviewer" else f"{name} draft {len(runs)}"
+        edges = {"Reviewer": BackEdge("Writer", lambda out: "needs revision" in out.lower(), max_rounds=2)}
+        asyncio.run(arun_dag(RESEARCH_DAG, run_node, back_edges=edges))
+        writer_runs = [fb for name, fb in runs if name == "Writer"]
+        self.assertEqual(writer_runs, [None, "Needs revision", "Needs revision"])
+        self.assertEqual(sum(1 for name, _ in runs if name == "WebResearcher"), 1)
+    def test_max_concurrency(self):
+        active, peak = [0], [0]
+        async def run_node(name, inputs, feedback):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+        deps = {f"n{i}": [] for i in range(6)}
+        asyncio.run(arun_dag(deps, run_node, max_concurrency=2))
+        self.assertEqual(peak[0], 2)
+    def test_node_failure_propagates(self):
+        async def run_node(name, inputs, feedback):
+            if name == "WikiResearcher":
+                raise RuntimeError("wiki down")
+            await asyncio.sleep(0.05)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(arun_dag(RESEARCH_DAG, run_node))
+
+if __name__ == "__main__":
+    unittest.main()
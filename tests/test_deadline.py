@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from agentic_core.deadline import (
+    Deadline, DeadlineExceeded, LatencyTracker, acall_with_timeout, call_with_timeout, cap_timeout,
+    check_deadline, current_deadline, deadline_scope
+)
+from agentic_core.ratelimit import RetryPolicy
+
+class TestDeadline(unittest.TestCase):
+    def test_nested_scopes_only_shorten(self):
+        with deadline_scope(0.5) as outer:
+            with deadline_scope(10) as inner:
+                self.assertIs(current_deadline(), inner)
+                self.assertLessEqual(inner.remaining(), 0.5)
+                connect, read = cap_timeout((0.1, 20))
+                self.assertEqual(connect, 0.1)
+                self.assertLessEqual(read, 0.5)
+            outer.cancel()
+            self.assertTrue(inner.cancelled)
+            with self.assertRaises(DeadlineExceeded):
+                check_deadline()
+        self.assertIsNone(current_deadline())
+        self.assertEqual(cap_timeout(3), 3)
+    def test_timeout_cancels_the_abandoned_call(self):
+        seen = threading.Event()
+        def slow():
+            while not current_deadline().expired:
+                time.sleep(0.01)
+            seen.set()
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            call_with_timeout(slow, 0.05)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertTrue(seen.wait(1))
+    def test_goal_deadline_bounds_tool_timeout(self):
+        with deadline_scope(0.05):
+            start = time.monotonic()
+            with self.assertRaises(DeadlineExceeded):
+                call_with_timeout(lambda: time.sleep(0.3), 10)
+            self.assertLess(time.monotonic() - start, 0.25)
+    def test_hedged_call_takes_first_result(self):
+        calls = []
+        def lookup():
+            calls.append(1)
+            time.sleep(0.5 if len(calls) == 1 else 0.01)
+            return len(calls)
+        latencies = []
+        start = time.monotonic()
+        self.assertEqual(call_with_timeout(lookup, 5, hedge_after=0.05, on_latency=latencies.append), 2)
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(latencies), 1)
+    def test_errors_propagate(self):
+        def boom():
+            raise KeyError("x")
+        with self.assertRaises(KeyError):
+            call_with_timeout(boom, 1, hedge_after=0.01)
+    def test_async_timeout_and_hedging(self):
+        calls = []
+        async def lookup():
+            calls.append(1)
+            await asyncio.sleep(0.5 if len(calls) == 1 else 0.01)
+            return len(calls)
+        async def main():
+            hedged = await acall_with_timeout(lookup, 5, hedge_after=0.05)
+            with self.assertRaises(DeadlineExceeded):
+                await acall_with_timeout(lambda: asyncio.sleep(1), 0.05)
+            return hedged
+        self.assertEqual(asyncio.run(main()), 2)
+    def test_async_cancelled_attempt_is_a_failure(self):
+        calls = []
+        async def lookup():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(0.1)
+                raise asyncio.CancelledError()  # e.g. a client shut down under the attempt
+            await asyncio.sleep(0.1)
+            return "hedge"
+        async def main():
+            with self.assertRaises(DeadlineExceeded):
+                await acall_with_timeout(lambda: _cancelled(), 1)
+            return await acall_with_timeout(lookup, 1, hedge_after=0.05)
+        self.assertEqual(asyncio.run(main()), "hedge")
+    def test_executor_bounds_threads(self):
+        release, threads = threading.Event(), set()
+        def slow():
+            threads.add(threading.current_thread().name)
+            release.wait(1)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tools") as executor:
+            for _ in range(3):
+                with self.assertRaises(DeadlineExceeded):
+                    call_with_timeout(slow, 0.05, executor=executor)
+            release.set()
+            self.assertEqual(call_with_timeout(lambda: 42, 1, executor=executor), 42)
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads.pop().startswith("tools"))
+    def test_retries_stop_at_the_deadline(self):
+        attempts = []
+        def flaky():
+            attempts.append(1)
+            raise TimeoutError("slow upstream")
+        policy = RetryPolicy(max_retries=10, base_delay=1.0, rng=lambda: 1.0)
+        with deadline_scope(0.5), self.assertRaises(TimeoutError):
+            policy.call(flaky, sleep=lambda s: None)
+        self.assertEqual(len(attempts), 1)
+        expired = Deadline(0)
+        self.assertTrue(expired.expired)
+    def test_latency_percentile(self):
+        tracker = LatencyTracker(min_samples=10)
+        self.assertIsNone(tracker.percentile("t"))
+        for ms in range(1, 101):
+            tracker.record("t", ms / 1000)
+        self.assertAlmostEqual(tracker.percentile("t"), 0.096)
+
+async def _cancelled():
+    raise asyncio.CancelledError()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+import openai
+from types import SimpleNamespace
+from unittest import mock
+import agentic_framework
+import agentic_advanced_framework
+from agentic_core.events import iter_events, emit, TOKEN, DONE, TOOL_START, TOOL_END, FINAL
+from agentic_core.ratelimit import RetryPolicy
+
+class TestIterEvents(unittest.TestCase):
+    def test_yields_events_then_done(self):
+        def run(on_event):
+            for text in ("Hel", "lo"):
+                emit(on_event, TOKEN, agent="A", text=text)
+            return "Hello"
+        events = list(iter_events(run))
+        self.assertEqual([e["type"] for e in events], [TOKEN, TOKEN, DONE])
+        self.assertEqual("".join(e["text"] for e in events[:2]), "Hello")
+        self.assertEqual(events[-1]["result"], "Hello")
+    def test_exception_is_reraised(self):
+        def run(on_event):
+            emit(on_event, TOKEN, agent="A", text="x")
+            raise RuntimeError("boom")
+        stream = iter_events(run)
+        self.assertEqual(next(stream)["type"], TOKEN)
+        with self.assertRaises(RuntimeError):
+            next(stream)
+    def test_emit_without_callback_is_noop(self):
+        emit(None, TOKEN, text="ignored")
+
+def _chunk(text, tool_calls=None):
+    delta = SimpleNamespace(content=text, tool_calls=tool_calls)
+    return SimpleNamespace(id="c", created=0, model="m", choices=[SimpleNamespace(delta=delta, finish_reason=None)])
+
+def _tool_chunk(index, call_id, expression):
+    function = SimpleNamespace(name="calculator", arguments=f'{{"expression": "{expression}"}}')
+    return _chunk(None, [SimpleNamespace(index=index, id=call_id, function=function)])
+
+def _stream(texts, fail_after=None):
+    for i, text in enumerate(texts):
+        if i == fail_after:
+            raise ConnectionError("dropped")
+        yield _chunk(text)
+
+class TestStreamRetries(unittest.TestCase):
+    def complete(self, *streams):
+        client = mock.Mock()
+        client.chat.completions.create.side_effect = list(streams)
+        client.types = openai.types  # the completion is rebuilt with the real response types
+        tokens = []
+        with mock.patch.object(agentic_framework, "get_openai", return_value=client), \
+                mock.patch.object(agentic_framework, "retry_policy", RetryPolicy(base_delay=0)):
+            try:
+                response = agentic_framework._create_completion({"model": "m", "messages": []}, tokens.append)
+            finally:
+                self.calls = client.chat.completions.create.call_count
+        return response.choices[0].message.content, tokens
+    def test_failure_before_first_token_is_retried(self):
+        content, tokens = self.complete(_stream(["Hel"], fail_after=0), _stream(["Hel", "lo"]))
+        self.assertEqual((content, tokens, self.calls), ("Hello", ["Hel", "lo"], 2))
+    def test_failure_after_tokens_is_not_repeated(self):
+        with self.assertRaises(agentic_framework.StreamInterrupted):
+            self.complete(_stream(["Hel", "lo"], fail_after=1), _stream(["Hel", "lo"]))
+        self.assertEqual(self.calls, 1)
+
+async def _astream(chunks, fail_after=None):
+    for i, chunk in enumerate(chunks):
+        if i == fail_after:
+            raise ConnectionError("dropped")
+        yield chunk
+
+class TestAgentStreamEvents(unittest.TestCase):
+    def act(self, *streams):
+        client = mock.Mock()
+        client.chat.completions.create = mock.AsyncMock(side_effect=list(streams))
+        events = self.events = []
+        agent = agentic_advanced_framework.Agent("A", "Compute.", toolset=["calculator"])
+        with mock.patch.object(agentic_framework, "get_async_client", return_value=client), \
+                mock.patch.object(agentic_framework, "retry_policy", RetryPolicy(base_delay=0)):
+            try:
+                return asyncio.run(agent.aact("6*7 and 1+1", on_event=events.append)), events
+            finally:
+                self.calls = client.chat.completions.create.await_count
+    def test_multi_tool_turn_event_order(self):
+        tool_turn = [_chunk("Checking. "), _tool_chunk(0, "call_a", "6*7"), _tool_chunk(1, "call_b", "1+1")]
+        answer = [_chunk("42 "), _chunk("and 2")]
+        (content, _), events = self.act(_astream(tool_turn), _astream(answer, fail_after=0), _astream(answer))
+        self.assertEqual(content, "42 and 2")
+        self.assertEqual([e["type"] for e in events], [TOKEN, TOOL_START, TOOL_START, TOOL_END, TOOL_END,
+                                                       TOKEN, TOKEN, FINAL])
+        self.assertEqual(sorted(e["result"] for e in events if e["type"] == TOOL_END), ["2", "42"])
+        self.assertEqual("".join(e["text"] for e in events if e["type"] == TOKEN), "Checking. 42 and 2")
+        self.assertEqual(self.calls, 3)  # the stream that failed before its first token was retried
+    def test_no_retry_after_tokens_were_emitted(self):
+        with self.assertRaises(agentic_framework.StreamInterrupted):
+            self.act(_astream([_chunk("42 "), _chunk("and 2")], fail_after=1), _astream([_chunk("42 and 2")]))
+        self.assertEqual(([e["text"] for e in self.events], self.calls), (["42 "], 1))
+
+if __name__ == "__main__":
+    unittest.main()
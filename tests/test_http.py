@@ -0,0 +1,25 @@
+import importlib.util
+import threading
+import unittest
+from agentic_core import http
+
+@unittest.skipUnless(importlib.util.find_spec("requests"), "requests not installed")
+class TestPooledSession(unittest.TestCase):
+    def test_single_session_shared_across_threads(self):
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(http.get_session())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len({id(s) for s in sessions}), 1)
+    def test_adapter_pool_size(self):
+        adapter = http.get_session().get_adapter("https://en.wikipedia.org")
+        self.assertEqual(adapter._pool_maxsize, http.POOL_SIZE)
+
+class TestTimeouts(unittest.TestCase):
+    def test_default_timeout_is_connect_read_pair(self):
+        self.assertEqual(http.default_timeout(), (http.CONNECT_TIMEOUT, http.READ_TIMEOUT))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import http.client
+import json
+import os
+import tempfile
+import time
+import unittest
+import urllib.error
+import urllib.request
+from unittest import mock
+import agentic_server
+from agentic_core.jobqueue import JobQueue
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "jobs.sqlite")
+        self.queue = JobQueue(self.path, lease_seconds=60, max_attempts=2)
+    def tearDown(self):
+        self.queue.close()
+        self.tmp.cleanup()
+    def test_claim_in_order_and_finish(self):
+        first, second = self.queue.submit({"goal": "a"}), self.queue.submit({"goal": "b"})
+        job = self.queue.claim("w1")
+        self.assertEqual((job["id"], job["status"], job["attempts"]), (first, "running", 1))
+        self.assertEqual(self.queue.claim("w2")["id"], second)
+        self.assertIsNone(self.queue.claim("w3"))
+        self.assertFalse(self.queue.complete(first, "w2", "stolen"))
+        self.assertTrue(self.queue.complete(first, "w1", {"answer": "A"}))
+        self.assertTrue(self.queue.fail(second, "w2", "boom"))
+        self.assertEqual(self.queue.get(first)["result"], {"answer": "A"})
+        self.assertEqual(self.queue.get(second)["error"], "boom")
+        self.assertEqual(self.queue.counts(), {"done": 1, "failed": 1})
+    def test_jobs_persist_and_expired_leases_are_reclaimed(self):
+        self.queue.lease_seconds = 0.01
+        job_id = self.queue.submit({"goal": "a"})
+        self.queue.claim("dead")
+        self.queue.close()
+        self.queue = JobQueue(self.path, lease_seconds=0.01, max_attempts=2)
+        time.sleep(0.02)
+        job = self.queue.claim("w2")
+        self.assertEqual((job["id"], job["attempts"]), (job_id, 2))
+        time.sleep(0.02)
+        self.assertIsNone(self.queue.claim("w3"))
+        self.assertEqual(self.queue.get(job_id)["error"], "worker lost")
+    def test_cancel_only_queued_jobs(self):
+        queued, running = self.queue.submit({"goal": "a"}), self.queue.submit({"goal": "b"})
+        self.assertTrue(self.queue.cancel(queued))
+        self.assertEqual(self.queue.claim("w1")["id"], running)
+        self.assertFalse(self.queue.cancel(running))
+        self.assertEqual([j["id"] for j in self.queue.list("cancelled")], [queued])
+
+class TestPipelineServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.server = agentic_server.PipelineServer(os.path.join(self.tmp.name, "jobs.sqlite"), port=0, workers=0)
+        self.url = self.server.start()
+    def tearDown(self):
+        self.server.drain(timeout=1)
+        self.tmp.cleanup()
+    def request(self, method, path, body=None, headers=None):
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.url + path, data=data, method=method, headers=headers or {})
+        try:
+            with urllib.request.urlopen(req) as resp:
+                return resp.status, json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+    def test_submit_status_cancel(self):
+        status, job = self.request("POST", "/jobs", {"goal": "Explain X", "pipeline": "dag"})
+        self.assertEqual((status, job["status"]), (202, "queued"))
+        self.assertEqual(self.request("GET", f"/jobs/{job['id']}")[1]["payload"]["pipeline"], "dag")
+        self.assertEqual(self.request("POST", "/jobs", {"goal": "x", "pipeline": "nope"})[0], 400)
+        self.assertEqual(self.request("GET", "/jobs/missing")[0], 404)
+        self.assertEqual(self.request("DELETE", f"/jobs/{job['id']}")[1]["status"], "cancelled")
+        self.assertEqual(self.request("DELETE", f"/jobs/{job['id']}")[0], 409)
+        self.assertEqual(self.request("GET", "/health")[1]["queue"], {"cancelled": 1})
+    def test_worker_loop_runs_jobs(self):
+        async def fake_run_job(payload, workspace=None):
+            if payload["goal"] == "bad":
+                raise RuntimeError("no luck")
+            return {"answer": payload["goal"].upper(), "steps": []}
+        ids = [self.server.queue.submit(agentic_server.validate_job({"goal": g})) for g in ("ok", "bad")]
+        queue = JobQueue(self.server.db_path)
+        stopping = lambda: all(queue.get(i)["status"] in ("done", "failed") for i in ids)
+        with mock.patch.object(agentic_server, "run_job", fake_run_job):
+            asyncio.run(agentic_server._worker_loop(queue, "w", 2, stopping))
+        queue.close()
+        self.assertEqual(self.request("GET", f"/jobs/{ids[0]}")[1]["result"]["answer"], "OK")
+        self.assertEqual(self.request("GET", f"/jobs/{ids[1]}")[1]["error"], "RuntimeError: no luck")
+    def test_dag_workspace_is_cleared_once_finished(self):
+        async def fake_run_job(payload, workspace=None):
+            workspace.set("Writer_output", "draft")
+            return {"answer": "done", "steps": []}
+        job_id = self.server.queue.submit(agentic_server.validate_job({"goal": "g", "pipeline": "dag"}))
+        queue = JobQueue(self.server.db_path)
+        with mock.patch.object(agentic_server, "run_job", fake_run_job):
+            asyncio.run(agentic_server._run_claimed(queue, queue.claim("w"), "w"))
+        self.assertEqual(queue.get(job_id)["status"], "done")
+        queue.close()
+        from agentic_core.memory import SQLiteBackend
+        store = SQLiteBackend(self.server.db_path + ".workspaces", namespace=job_id)
+        self.assertEqual(store.keys(), [])
+        store.close()
+    def test_dag_job_resumes_mid_critic_loop(self):
+        from agentic_advanced_framework import AsyncAgent
+        from agentic_core.workspace import persistent_workspace
+        from tests.test_pipelines import CRITIC_CONFIGS, fake_act, seed_critic_loop
+        job_id = self.server.queue.submit(agentic_server.validate_job(
+            {"goal": "g", "pipeline": "dag", "agent_configs": CRITIC_CONFIGS}))
+        # The previous worker died after saving the Reviewer's verdict
+        workspace = persistent_workspace(self.server.db_path + ".workspaces", namespace=job_id)
+        seed_critic_loop(workspace, "g")
+        workspace.store.close()
+        queue, ran = JobQueue(self.server.db_path), []
+        with mock.patch.object(AsyncAgent, "act", fake_act(ran)), \
+                mock.patch("agentic_advanced_framework.remember_answer"):
+            asyncio.run(agentic_server._run_claimed(queue, queue.claim("w"), "w"))
+        self.assertEqual(ran, ["Writer", "Reviewer"])
+        self.assertEqual(queue.get(job_id)["result"]["answer"], "Approved")
+        queue.close()
+    def test_job_taken_over_by_another_worker_is_stopped(self):
+        queue = JobQueue(self.server.db_path, lease_seconds=0.06)
+        async def fake_run_job(payload, workspace=None):
+            with queue._lock:  # the lease lapsed and another worker claimed the job
+                queue._db.execute("UPDATE jobs SET worker = 'other'")
+            await asyncio.sleep(10)
+        job_id = queue.submit(agentic_server.validate_job({"goal": "g"}))
+        start = time.monotonic()
+        with mock.patch.object(agentic_server, "run_job", fake_run_job):
+            asyncio.run(agentic_server._run_claimed(queue, queue.claim("w"), "w"))
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual((queue.get(job_id)["status"], queue.get(job_id)["worker"]), ("running", "other"))
+        queue.close()
+    def test_malformed_content_length_is_rejected(self):
+        conn = http.client.HTTPConnection(self.url.split("//")[1])
+        conn.putrequest("POST", "/jobs")
+        conn.putheader("Content-Length", "lots")
+        conn.endheaders()
+        resp = conn.getresponse()
+        self.assertEqual((resp.status, json.loads(resp.read())), (400, {"error": "invalid Content-Length"}))
+        conn.close()
+    def test_token_guards_jobs_and_drain(self):
+        self.server.token = "s3cret"
+        self.assertEqual(self.request("POST", "/jobs", {"goal": "x"})[0], 401)
+        self.assertEqual(self.request("GET", "/jobs")[0], 401)
+        self.assertEqual(self.request("POST", "/drain", headers={"Authorization": "Bearer wrong"})[0], 401)
+        self.assertFalse(self.server.draining)
+        self.assertEqual(self.request("GET", "/health")[0], 200)
+        auth = {"Authorization": "Bearer s3cret"}
+        self.assertEqual(self.request("POST", "/jobs", {"goal": "x"}, headers=auth)[0], 202)
+    def test_draining_refuses_new_jobs(self):
+        self.server.draining = True
+        self.assertEqual(self.request("POST", "/jobs", {"goal": "x"})[0], 503)
+        self.assertEqual(self.request("GET", "/health")[1]["status"], "draining")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from agentic_core.llm_cache import CompletionCache, CompletionCacheMiss, request_key
+
+REQUEST = {"model": "gpt-3.5-turbo-1106", "messages": [{"role": "user", "content": "hi"}], "temperature": 0}
+
+class TestCompletionCache(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "completions.jsonl")
+        self.calls = 0
+    def create(self):
+        self.calls += 1
+        return {"content": f"answer {self.calls}"}
+    def complete(self, cache, request=REQUEST):
+        return cache.complete(request, self.create, to_dict=dict, from_dict=dict)
+    def test_key_covers_sampling_params_not_transport(self):
+        self.assertNotEqual(request_key(REQUEST), request_key(dict(REQUEST, temperature=1)))
+        self.assertEqual(request_key(REQUEST), request_key(dict(REQUEST, stream=False, timeout=30)))
+    def test_record_then_replay_from_file(self):
+        self.complete(CompletionCache(self.path, mode="record"))
+        replay = CompletionCache(self.path, mode="replay")
+        self.assertEqual(self.complete(replay), {"content": "answer 1"})
+        self.assertEqual(self.calls, 1)
+        with self.assertRaises(CompletionCacheMiss):
+            self.complete(replay, dict(REQUEST, temperature=1))
+    def test_read_through_calls_once(self):
+        cache = CompletionCache(self.path, mode="read_through")
+        self.complete(cache)
+        self.complete(cache)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+    def test_record_overwrites(self):
+        cache = CompletionCache(self.path, mode="record")
+        self.complete(cache)
+        self.complete(cache)
+        self.assertEqual(CompletionCache(self.path, mode="replay").get(REQUEST), {"content": "answer 2"})
+    def test_off_mode_never_writes(self):
+        self.complete(CompletionCache(self.path, mode="off"))
+        self.assertFalse(os.path.exists(self.path))
+    def test_async_read_through(self):
+        cache = CompletionCache(self.path, mode="read_through")
+        async def create():
+            return self.create()
+        async def run():
+            for _ in range(2):
+                await cache.acomplete(REQUEST, create, to_dict=dict, from_dict=dict)
+        asyncio.run(run())
+        self.assertEqual(self.calls, 1)
+
+if __name__ == "__main__":
+    unittest.main()
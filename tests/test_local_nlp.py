@@ -0,0 +1,38 @@
+import unittest
+from tools import entity_extraction, sentiment
+
+class TestSentiment(unittest.TestCase):
+    def test_labels(self):
+        cases = {"I love this product, it is excellent!": "Positive", "The service was terrible and slow.": "Negative",
+                 "This is not good at all.": "Negative",
+                 "The meeting is at 3pm in room 4 with the finance team.": "Neutral"}
+        for text, label in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(sentiment.sentiment_analysis(text), label)
+    def test_confidence(self):
+        self.assertGreater(sentiment.analyze("Absolutely wonderful, the best day ever!")[1], 0.9)
+        self.assertLess(sentiment.analyze("Great food but awful, rude and slow service, good view.")[1], 0.7)
+        self.assertLess(sentiment.analyze("Fine")[1], 0.7)
+    def test_unknown_words_are_not_confident(self):
+        for text in ("Customers are furious about the outage.", "After the report its shares plummeted overnight.",
+                     "Our team was thrilled with the launch.", "The meeting is at 3pm in room 4 with the finance team."):
+            with self.subTest(text=text):
+                self.assertLess(sentiment.analyze(text)[1], 0.7)
+
+class TestEntityExtraction(unittest.TestCase):
+    def test_patterns_and_phrases(self):
+        text = ("Researchers at Google and OpenAI met in Paris on March 3, 2024 to discuss a $5 million grant "
+                "with the University of Cambridge. Contact info@example.org.")
+        entities, confidence = entity_extraction.analyze(text)
+        self.assertEqual(entities, ["Google", "OpenAI", "Paris", "March 3, 2024", "$5 million",
+                                    "University of Cambridge", "info@example.org"])
+        self.assertLess(confidence, 1.0)  # "Researchers" opens the sentence and could be a name
+    def test_sentence_openers(self):
+        entities, confidence = entity_extraction.analyze("The Eiffel Tower opened in 1889. Paris loved it. Tourists came.")
+        self.assertEqual(entities, ["Eiffel Tower", "1889", "Paris"])
+        self.assertEqual(confidence, 0.75)
+        self.assertEqual(entity_extraction.extract_entities("nothing to see here"), "None")
+        self.assertLess(entity_extraction.analyze("alan turing lived in manchester for years")[1], 0.5)
+
+if __name__ == "__main__":
+    unittest.main()
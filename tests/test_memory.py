@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from agentic_core.memory import Memory, DictBackend, SQLiteBackend, LazyValue
+from agentic_core.workspace import ShardedWorkspace, persistent_workspace
+
+class MemoryContract:
+    def make_backend(self):
+        raise NotImplementedError
+    def test_get_set_append_all(self):
+        memory = Memory(self.make_backend())
+        memory.set("pipeline", ["A", "B"])
+        memory.append("log", {"step": 1})
+        memory.append("log", {"step": 2})
+        memory.append("pipeline", "C")
+        self.assertEqual(memory.get("pipeline"), ["A", "B", "C"])
+        self.assertEqual(memory.get("missing", "dflt"), "dflt")
+        self.assertEqual(memory.all(), {"pipeline": ["A", "B", "C"], "log": [{"step": 1}, {"step": 2}]})
+        self.assertTrue(memory.delete("log"))
+        self.assertEqual(memory.keys(), ["pipeline"])
+        memory.set("empty", None)
+        self.assertTrue(memory.delete("empty"))
+        self.assertFalse(memory.delete("empty"))
+    def test_checkpoint_and_restore(self):
+        memory = Memory(self.make_backend())
+        memory.set("draft", "v1")
+        memory.append("notes", "a")
+        memory.checkpoint("before-review")
+        memory.set("draft", "v2")
+        memory.append("notes", "b")
+        memory.restore("before-review")
+        self.assertEqual(memory.all(), {"draft": "v1", "notes": ["a"]})
+        self.assertEqual(memory.checkpoints(), ["before-review"])
+        with self.assertRaises(KeyError):
+            memory.restore("nope")
+
+class TestDictBackend(MemoryContract, unittest.TestCase):
+    def make_backend(self):
+        return DictBackend()
+
+class TestSQLiteBackend(MemoryContract, unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "memory.sqlite")
+    def tearDown(self):
+        self.dir.cleanup()
+    def make_backend(self, **kwargs):
+        return SQLiteBackend(self.path, **kwargs)
+    def test_survives_reopen_and_isolates_namespaces(self):
+        first = self.make_backend(namespace="run-1")
+        first.set("answer", 42)
+        first.append("steps", "search")
+        first.close()
+        self.assertEqual(self.make_backend(namespace="run-1").all(), {"answer": 42, "steps": ["search"]})
+        self.assertEqual(self.make_backend(namespace="run-2").all(), {})
+    def test_large_values_are_lazy(self):
+        backend = self.make_backend(lazy_threshold=100)
+        backend.set("page", "x" * 1000)
+        backend.set("small", "ok")
+        values = backend.all(lazy=True)
+        self.assertIsInstance(values["page"], LazyValue)
+        self.assertEqual(values["page"].load(), "x" * 1000)
+        self.assertEqual(values["small"], "ok")
+    def test_persistent_workspace_resumes_and_restores(self):
+        ws = persistent_workspace(self.path, "run")
+        ws.set("Researcher_output", "notes")
+        ws.append("log", 1)
+        ws.checkpoint("after-research")
+        ws.set("Writer_output", "draft")
+        ws.append("log", 2)
+        reopened = persistent_workspace(self.path, "run")
+        self.assertEqual(reopened.all(), {"Researcher_output": "notes", "Writer_output": "draft", "log": [1, 2]})
+        version = reopened.version("Writer_output")
+        reopened.restore("after-research")
+        self.assertEqual(reopened.all(), {"Researcher_output": "notes", "log": [1]})
+        self.assertGreater(reopened.version("Writer_output"), version)
+        with self.assertRaises(RuntimeError):
+            ShardedWorkspace().checkpoint("x")
+    def test_persistent_workspace_keeps_large_values_on_disk(self):
+        ws = persistent_workspace(self.path, "run", lazy_threshold=100)
+        ws.set("page", "x" * 1000)
+        ws.set("note", "short")
+        self.assertIsInstance(ws._shard("page").data["page"], LazyValue)
+        self.assertEqual(ws.get("page"), "x" * 1000)
+        snapshot = ws.snapshot()
+        ws.set("page", "y" * 1000)
+        self.assertEqual(snapshot["page"], "x" * 1000)
+        reopened = persistent_workspace(self.path, "run", lazy_threshold=100)
+        self.assertIsInstance(reopened._shard("page").data["page"], LazyValue)
+        self.assertEqual(reopened.all(), {"page": "y" * 1000, "note": "short"})
+        self.assertEqual(reopened.update("page", lambda page: page[:3]), "yyy")
+        self.assertEqual(reopened._shard("page").data["page"], "yyy")
+    def test_workspace_refuses_to_append_to_a_scalar(self):
+        for ws in (ShardedWorkspace(), persistent_workspace(self.path, "run")):
+            ws.set("title", "draft")
+            with self.assertRaises(TypeError):
+                ws.append("title", "!")
+            self.assertEqual(ws.get("title"), "draft")
+            if ws.store is not None:
+                self.assertEqual(ws.store.get("title"), "draft")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+import unittest
+from agentic_core.messaging import Mailbox, MessageBus, Messaging
+
+class TestMailbox(unittest.TestCase):
+    def test_fifo_and_timeout(self):
+        box = Mailbox()
+        box.put(1)
+        box.put(2)
+        self.assertEqual([box.get(), box.get()], [1, 2])
+        self.assertIsNone(box.get(timeout=0.01))
+    def test_backpressure(self):
+        box = Mailbox(maxsize=1)
+        self.assertTrue(box.put("a"))
+        self.assertFalse(box.put("b", timeout=0.01))
+        threading.Timer(0.05, box.get).start()
+        self.assertTrue(box.put("b", timeout=1))  # unblocked once the receiver drains
+    def test_blocking_receive_wakes_on_send(self):
+        box = Mailbox()
+        threading.Timer(0.05, lambda: box.put("hello")).start()
+        start = time.perf_counter()
+        self.assertEqual(box.get(timeout=2), "hello")
+        self.assertLess(time.perf_counter() - start, 1)
+    def test_async_receive_wakes_on_thread_send(self):
+        box = Mailbox()
+        async def main():
+            threading.Timer(0.05, lambda: box.put("ping")).start()
+            return await box.aget(timeout=2)
+        self.assertEqual(asyncio.run(main()), "ping")
+        self.assertIsNone(asyncio.run(box.aget(timeout=0.01)))
+    def test_async_send_waits_for_room_without_blocking_the_loop(self):
+        bus = MessageBus(maxsize=1)
+        async def main():
+            self.assertTrue(await bus.asend("Writer", 1))
+            self.assertFalse(await bus.asend("Writer", 2, timeout=0.01))
+            async def receiver():
+                return [await bus.areceive("Writer", timeout=1) for _ in range(3)]
+            received = asyncio.ensure_future(receiver())  # runs on the same loop as the blocked sender
+            self.assertTrue(await bus.asend("Writer", 2, timeout=1))
+            self.assertTrue(await bus.asend("Writer", 3, timeout=1))
+            return await received
+        self.assertEqual(asyncio.run(main()), [1, 2, 3])
+
+class TestMessageBus(unittest.TestCase):
+    def test_concurrent_senders_lose_nothing(self):
+        bus = MessageBus(maxsize=10)
+        def sender(i):
+            for j in range(50):
+                bus.send("Writer", {"from": f"R{i}", "content": j})
+        threads = [threading.Thread(target=sender, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        received = [bus.receive("Writer", timeout=1) for _ in range(200)]
+        for t in threads:
+            t.join()
+        self.assertEqual(len([m for m in received if m]), 200)
+        self.assertEqual(bus.drain("Writer"), [])
+    def test_pub_sub(self):
+        bus = MessageBus()
+        bus.subscribe("Writer", "research")
+        bus.subscribe("Reviewer", "research")
+        self.assertEqual(bus.publish("research", {"content": "notes"}), 2)
+        self.assertEqual(bus.drain("Reviewer"), [{"content": "notes", "topic": "research"}])
+        bus.unsubscribe("Writer", "research")
+        self.assertEqual(bus.publish("research", {"content": "more"}), 1)
+    def test_messaging_uses_bus(self):
+        bus = MessageBus()
+        Messaging("Researcher", bus).send("Writer", "draft ready")
+        self.assertEqual(Messaging("Writer", bus).receive(), [{"from": "Researcher", "content": "draft ready"}])
+
+if __name__ == "__main__":
+    unittest.main()
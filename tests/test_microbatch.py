@@ -0,0 +1,50 @@
+import asyncio
+import threading
+import time
+import unittest
+from agentic_core.deadline import DeadlineExceeded, deadline_scope
+from agentic_core.microbatch import MicroBatcher
+from agentic_core.parallel import run_parallel
+
+class TestMicroBatcher(unittest.TestCase):
+    def setUp(self):
+        self.batches, self.singles = [], []
+        def run_batch(items):
+            self.batches.append(list(items))
+            return [item * 2 for item in items]
+        def run_one(item):
+            self.singles.append(item)
+            return item * 2
+        self.batcher = MicroBatcher(run_batch, run_one=run_one, window=0.05, max_batch=4)
+    def test_concurrent_calls_share_batches(self):
+        results = run_parallel([lambda i=i: self.batcher.call(i) for i in range(6)])
+        self.assertEqual(results, [i * 2 for i in range(6)])
+        self.assertEqual(sorted(len(b) for b in self.batches), [2, 4])
+        self.assertEqual(self.batcher.stats, {"items": 6, "batches": 2})
+    def test_lone_call_uses_run_one(self):
+        self.assertEqual(self.batcher.call(5), 10)
+        self.assertEqual((self.singles, self.batches), ([5], []))
+    def test_async_callers_on_different_loops(self):
+        async def many():
+            return await asyncio.gather(*(self.batcher.acall(i) for i in range(3)))
+        out = []
+        threads = [threading.Thread(target=lambda: out.append(asyncio.run(many()))) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(out, [[0, 2, 4]] * 2)
+        self.assertEqual(sum(len(b) for b in self.batches), 6)
+        self.assertLessEqual(len(self.batches), 2)
+    def test_errors_reach_every_caller(self):
+        batcher = MicroBatcher(lambda items: [1], window=0.05)
+        errors = run_parallel([lambda: self.assertRaises(ValueError, batcher.call, "a"),
+                               lambda: self.assertRaises(ValueError, batcher.call, "b")])
+        self.assertEqual(len(errors), 2)
+    def test_caller_deadline(self):
+        slow = MicroBatcher(lambda items: [time.sleep(0.3)] * len(items), run_one=lambda item: time.sleep(0.3))
+        with deadline_scope(0.05), self.assertRaises(DeadlineExceeded):
+            slow.call("x")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import threading
+import time
+import unittest
+from agentic_core.parallel import run_parallel
+
+class TestRunParallel(unittest.TestCase):
+    def test_results_in_task_order(self):
+        def make(i):
+            return lambda: (time.sleep(0.01 * (3 - i)), i)[1]
+        self.assertEqual(run_parallel([make(i) for i in range(3)]), [0, 1, 2])
+    def test_tasks_overlap(self):
+        barrier = threading.Barrier(3, timeout=2)
+        results = run_parallel([lambda: barrier.wait() is not None] * 3, max_workers=3)
+        self.assertEqual(results, [True, True, True])
+    def test_empty_and_single(self):
+        self.assertEqual(run_parallel([]), [])
+        self.assertEqual(run_parallel([lambda: 7]), [7])
+
+if __name__ == "__main__":
+    unittest.main()
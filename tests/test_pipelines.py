@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+import agentic_advanced_framework
+import agentic_framework
+import agentic_multiagent_framework
+from agentic_advanced_framework import AsyncAgent, async_dag_pipeline
+from agentic_core import runtime
+from agentic_core.workspace import ShardedWorkspace
+
+CRITIC_CONFIGS = [
+    {"name": "Researcher", "system_prompt": "Research.", "toolset": []},
+    {"name": "Writer", "system_prompt": "Write.", "toolset": []},
+    {"name": "Reviewer", "system_prompt": "Review.", "toolset": [],
+     "revise": {"target": "Writer", "max_rounds": 2, "keyword": "needs revision"}}
+]
+
+def seed_critic_loop(workspace, goal):
+    """A run that stopped right after the Reviewer asked for a revision."""
+    workspace.set("goal", goal)
+    workspace.set("Researcher_output", "notes")
+    workspace.set("Writer_output", "draft 1")
+    workspace.set("Reviewer_output", "Needs revision: too short")
+
+def fake_act(ran):
+    async def act(self, input_msg, **kwargs):
+        ran.append(self.name)
+        return {"Writer": "draft 2", "Reviewer": "Approved"}.get(self.name, "notes 2"), []
+    return act
+
+def tool_call(call_id, name, arguments):
+    return SimpleNamespace(id=call_id, type="function", function=SimpleNamespace(name=name, arguments=arguments))
+
+def completion(content=None, tool_calls=None):
+    message = SimpleNamespace(role="assistant", content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+class TestFunctionCalling(unittest.TestCase):
+    def test_parallel_tool_calls_are_answered_in_order(self):
+        turn = completion(tool_calls=[tool_call("call_a", "calculator", '{"expression": "6*7"}'),
+                                      tool_call("call_b", "calculator", '{"expression": '),
+                                      tool_call("call_c", "calculator", '{"expression": "1+1"}')])
+        seen = []
+        def fake_completion(**kwargs):
+            seen.append([dict(m) for m in kwargs["messages"]])
+            return turn if len(seen) == 1 else completion("42 and 2")
+        with mock.patch.object(agentic_framework, "chat_completion", fake_completion):
+            answer, steps = agentic_framework.agentic_function_calling_agent("Compute", verbose=False)
+        self.assertEqual(answer, "42 and 2")
+        history = seen[1]
+        self.assertEqual([m["role"] for m in history], ["system", "user", "assistant", "tool", "tool", "tool"])
+        self.assertEqual([c["id"] for c in history[2]["tool_calls"]], ["call_a", "call_b", "call_c"])
+        tools = history[3:]
+        self.assertEqual([m["tool_call_id"] for m in tools], ["call_a", "call_b", "call_c"])
+        self.assertEqual((tools[0]["content"], tools[2]["content"]), ("42", "2"))
+        self.assertTrue(tools[1]["content"].startswith("[Tool argument error: calculator arguments are not valid JSON"))
+
+class FakeAsyncClient:
+    """AsyncOpenAI stand-in that records the loop it was created, used and closed on."""
+    created = []
+    def __init__(self, **kwargs):
+        self.loop, self.used_on, self.closed_on = asyncio.get_running_loop(), set(), None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        FakeAsyncClient.created.append(self)
+    async def create(self, **kwargs):
+        self.used_on.add(asyncio.get_running_loop())
+        return completion("done")
+    async def close(self):
+        self.closed_on = asyncio.get_running_loop()
+
+class TestLoopClients(unittest.TestCase):
+    def setUp(self):
+        FakeAsyncClient.created = []
+        fake_openai = SimpleNamespace(api_key="test", AsyncOpenAI=FakeAsyncClient)
+        patcher = mock.patch.object(agentic_framework, "get_openai", return_value=fake_openai)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(runtime.shutdown)
+    def test_each_loop_gets_and_closes_its_own_client(self):
+        agent = agentic_advanced_framework.Agent("A", "Answer.", toolset=[])
+        self.assertEqual(agent.act("hi")[0], "done")  # run_sync: the shared background loop
+        self.assertEqual(agentic_advanced_framework.advanced_pipeline("hi", [{"name": "A", "system_prompt": "x",
+                                                                              "toolset": []}], verbose=False)[0], "done")
+        async def own_loop():
+            try:
+                return await agentic_multiagent_framework.async_multiagent_pipeline(
+                    "hi", [{"name": "B", "system_prompt": "x", "toolset": []}], verbose=False)
+            finally:
+                await runtime.aclose_loop_clients()
+        self.assertEqual(asyncio.run(own_loop())[0], "done")
+        runtime.shutdown()
+        shared, own = FakeAsyncClient.created
+        self.assertIsNot(shared.loop, own.loop)
+        for client in (shared, own):
+            self.assertEqual((client.used_on, client.closed_on), ({client.loop}, client.loop))
+
+class TestMultiagentDeadline(unittest.TestCase):
+    def test_job_past_its_deadline_returns_out_of_time(self):
+        import agentic_server
+        payload = agentic_server.validate_job({"goal": "g", "pipeline": "multiagent", "deadline": 1e-9,
+                                               "agent_configs": CRITIC_CONFIGS[:2]})
+        with mock.patch.object(agentic_framework, "get_async_client") as client:
+            result = asyncio.run(agentic_server.run_job(payload))
+        self.assertEqual(result["answer"], agentic_framework.OUT_OF_TIME)
+        client.assert_not_called()
+
+class TestDagResume(unittest.TestCase):
+    def test_back_edge_reruns_downstream_of_restored_nodes(self):
+        workspace, ran = ShardedWorkspace(), []
+        seed_critic_loop(workspace, "g")
+        with mock.patch.object(AsyncAgent, "act", fake_act(ran)), \
+                mock.patch.object(agentic_advanced_framework, "remember_answer"):
+            answer, steps, state = asyncio.run(async_dag_pipeline("g", CRITIC_CONFIGS, verbose=False,
+                                                                  workspace=workspace))
+        self.assertEqual(ran, ["Writer", "Reviewer"])
+        self.assertEqual(answer, "Approved")
+        self.assertEqual(sum("Restored" in step for step in steps), 3)
+        self.assertEqual((state["Writer_output"], state["Reviewer_output"]), ("draft 2", "Approved"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+from agentic_core.ratelimit import TokenBucket, RateLimiter, RetryPolicy, is_transient
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+class APIError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_wait(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)  # one per second
+        self.assertEqual([bucket.reserve() for _ in range(60)], [0.0] * 60)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        self.assertAlmostEqual(bucket.reserve(), 2.0)
+        clock.now += 10
+        self.assertEqual(bucket.reserve(), 0.0)
+
+class TestRateLimiter(unittest.TestCase):
+    def test_tokens_per_minute(self):
+        limiter = RateLimiter({"gpt": {"tpm": 600}}, clock=FakeClock())
+        self.assertEqual(limiter.delay("gpt", tokens=600), 0.0)
+        self.assertAlmostEqual(limiter.delay("gpt", tokens=100), 10.0)
+        self.assertEqual(limiter.delay("other-model", tokens=10 ** 6), 0.0)
+    def test_penalize_pauses_key(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.penalize("gpt", 5)
+        self.assertEqual(limiter.delay("gpt"), 5)
+        clock.now += 5
+        self.assertEqual(limiter.delay("gpt"), 0)
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+        self.policy = RetryPolicy(max_retries=3, base_delay=1, rng=lambda: 1.0)
+    def flaky(self, failures):
+        attempts = []
+        def fn():
+            attempts.append(1)
+            if len(attempts) <= len(failures):
+                raise failures[len(attempts) - 1]
+            return "ok"
+        return fn, attempts
+    def test_retries_transient_errors_with_backoff(self):
+        fn, attempts = self.flaky([APIError(503), TimeoutError()])
+        self.assertEqual(self.policy.call(fn, sleep=self.sleeps.append), "ok")
+        self.assertEqual(self.sleeps, [1, 2])
+    def test_honors_retry_after_and_penalizes(self):
+        limiter = RateLimiter(clock=FakeClock())
+        fn, _ = self.flaky([APIError(429, {"retry-after": "7"})])
+        self.policy.call(fn, limiter=limiter, key="gpt", sleep=self.sleeps.append)
+        self.assertEqual(self.sleeps, [7])
+        self.assertEqual(limiter.delay("gpt"), 7)
+    def test_gives_up_and_reraises(self):
+        fn, attempts = self.flaky([APIError(500)] * 10)
+        with self.assertRaises(APIError):
+            self.policy.call(fn, sleep=self.sleeps.append)
+        self.assertEqual(len(attempts), 4)
+    def test_non_transient_raised_immediately(self):
+        fn, attempts = self.flaky([APIError(400)])
+        with self.assertRaises(APIError):
+            self.policy.call(fn, sleep=self.sleeps.append)
+        self.assertEqual(len(attempts), 1)
+        self.assertFalse(is_transient(ValueError()))
+    def test_retries_on_response_status(self):
+        responses = [Response(429), Response(200)]
+        result = self.policy.call(lambda: responses.pop(0), sleep=self.sleeps.append)
+        self.assertEqual(result.status_code, 200)
+    def test_async(self):
+        policy = RetryPolicy(max_retries=2, base_delay=0)
+        calls = []
+        async def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                raise APIError(502)
+            return "ok"
+        self.assertEqual(asyncio.run(policy.acall(fn)), "ok")
+
+if __name__ == "__main__":
+    unittest.main()
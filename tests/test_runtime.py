@@ -0,0 +1,49 @@
+import asyncio
+import contextvars
+import unittest
+from agentic_core import runtime
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+class TestRuntime(unittest.TestCase):
+    def tearDown(self):
+        runtime.shutdown()
+    def test_calls_share_one_loop_and_keep_context(self):
+        async def current():
+            return asyncio.get_running_loop(), request_id.get()
+        token = request_id.set("goal-1")
+        try:
+            first, seen = runtime.run_sync(current())
+        finally:
+            request_id.reset(token)
+        second, _ = runtime.run_sync(current())
+        self.assertIs(first, second)
+        self.assertEqual(seen, "goal-1")
+        with self.assertRaises(ValueError):
+            runtime.run_sync(_raise())
+    def test_closers_run_on_shutdown(self):
+        closed = []
+        async def closer(loop):
+            closed.append(loop)
+        runtime.on_loop_close(closer)
+        try:
+            loop = runtime.run_sync(_running_loop())
+            runtime.shutdown()
+            self.assertEqual(closed, [loop])
+            self.assertIsNot(runtime.run_sync(_running_loop()), loop)
+        finally:
+            runtime._closers.remove(closer)
+    def test_refuses_to_block_a_running_loop(self):
+        async def nested():
+            runtime.run_sync(asyncio.sleep(0))
+        with self.assertRaises(RuntimeError):
+            asyncio.run(nested())
+
+async def _running_loop():
+    return asyncio.get_running_loop()
+
+async def _raise():
+    raise ValueError("boom")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import time
+import unittest
+from agentic_core.sandbox import SandboxPool, resource
+
+class TestSandboxPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = SandboxPool(workers=2, cpu_seconds=1, wall_seconds=3, memory_mb=256, max_output_chars=200).start()
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+    def test_exec_captures_stdout_and_variables(self):
+        ok, output = self.pool.run("exec", "print('hi')\nx = 6 * 7")
+        self.assertTrue(ok)
+        self.assertEqual(output, "hi\n{'x': 42}")
+    def test_errors_and_output_cap(self):
+        ok, output = self.pool.run("exec", "1 / 0")
+        self.assertFalse(ok)
+        self.assertIn("ZeroDivisionError", output)
+        ok, output = self.pool.run("exec", "print('x' * 5000)")
+        self.assertTrue(ok)
+        self.assertIn("[truncated", output)
+        self.assertLess(len(output), 300)
+    def test_wall_clock_limit_replaces_worker(self):
+        start = time.monotonic()
+        ok, output = self.pool.run("exec", "import time\ntime.sleep(30)")
+        self.assertFalse(ok)
+        self.assertIn("timed out", output)
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(self.pool.run("exec", "print(1 + 1)"), (True, "2"))
+    @unittest.skipIf(resource is None, "rlimits unavailable on this platform")
+    def test_cpu_and_memory_limits(self):
+        ok, output = self.pool.run("exec", "while True: pass")
+        self.assertFalse(ok)
+        self.assertIn("resource limits", output)
+        ok, output = self.pool.run("exec", "x = bytearray(1024 ** 3)")
+        self.assertFalse(ok)
+        self.assertIn("memory", output)
+        self.assertEqual(self.pool.run("exec", "print(3 * 3)"), (True, "9"))
+
+if __name__ == "__main__":
+    unittest.main()
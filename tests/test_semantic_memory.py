@@ -0,0 +1,76 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from agentic_core import semantic_memory as sm
+from agentic_core.semantic_memory import SemanticMemory, HashingEmbedder, FlatIndex
+
+class SemanticMemoryTests:
+    def test_embedder_is_normalised_and_deterministic(self):
+        embed = HashingEmbedder(dim=64)
+        a, b = embed(["Rust ownership model", "Rust ownership model"])
+        self.assertEqual(list(a), list(b))
+        self.assertAlmostEqual(sum(v * v for v in a), 1.0, places=5)
+    def test_search_ranks_related_items_first(self):
+        memory = SemanticMemory()
+        memory.add("Python 3.12 adds per-interpreter GIL", kind="web_search", key="python 3.12 release features")
+        memory.add("Rome was founded in 753 BC", kind="wikipedia_search", key="history of ancient rome")
+        memory.add("The Eiffel Tower is 330 m tall", kind="answer", key="how tall is the eiffel tower")
+        score, item = memory.search("ancient rome history", k=1)[0]
+        self.assertEqual(item["kind"], "wikipedia_search")
+        self.assertGreater(score, 0.5)
+        self.assertEqual(memory.search("ancient rome", k=3, kinds=["answer"])[0][1]["kind"], "answer")
+        self.assertIn("753 BC", memory.context_for("history of rome"))
+        self.assertEqual(memory.context_for("quantum chromodynamics lattice"), "")
+    def test_duplicates_are_skipped_and_memory_persists(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "memory.jsonl")
+            memory = SemanticMemory(path=path)
+            self.assertTrue(memory.add("result", kind="web_search", key="query"))
+            self.assertFalse(memory.add("result", kind="web_search", key="query"))
+            reloaded = SemanticMemory(path=path)
+            self.assertEqual(len(reloaded), 1)
+            self.assertAlmostEqual(reloaded.search("query", k=1)[0][0], 1.0, places=5)
+    def test_oldest_items_are_evicted_past_max_items(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "memory.jsonl")
+            memory = SemanticMemory(path=path, max_items=8)
+            for i in range(20):
+                memory.add(f"result {i}", kind="web_search", key=f"query number {i}")
+            self.assertLessEqual(len(memory), 8)
+            self.assertEqual(memory.search("query number 19", k=1)[0][1]["text"], "result 19")
+            self.assertNotIn("result 0", [item["text"] for _, item in memory.search("query number 0", k=8)])
+            self.assertEqual(len(SemanticMemory(path=path, max_items=8)), len(memory))
+    def test_max_age_skips_stale_items(self):
+        memory = SemanticMemory()
+        memory.add("old result", kind="web_search", key="query", time=time.time() - 7200)
+        self.assertEqual(len(memory.search("query", k=1)), 1)
+        self.assertEqual(memory.search("query", k=1, max_age=3600), [])
+    def test_flat_index_grows_and_returns_top_k(self):
+        embed = HashingEmbedder(dim=512)
+        index = FlatIndex(512)
+        texts = [f"document number {i}" for i in range(100)]
+        index.add(embed(texts))
+        hits = index.search(embed(["document number 42"]), 3)[0]
+        self.assertEqual(len(hits), 3)
+        self.assertEqual(hits[0][0], 42)
+        self.assertGreaterEqual(hits[0][1], hits[1][1])
+
+class TestPurePython(SemanticMemoryTests, unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(sm, "_np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+@unittest.skipIf(sm._numpy() is None, "numpy not installed")
+class TestNumpy(SemanticMemoryTests, unittest.TestCase):
+    def test_ivf_index_finds_exact_match(self):
+        embed = HashingEmbedder(dim=64)
+        index = sm.IVFIndex(64, nlist=8, nprobe=2, train_after=200)
+        index.add(embed([f"topic {i} notes" for i in range(300)]))
+        self.assertIsNotNone(index.centroids)
+        self.assertEqual(index.search(embed(["topic 123 notes"]), 1)[0][0][0], 123)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from agentic_core.speculation import Speculator, candidate_entities, joining_prefetches, prefetched
+
+class TestSpeculation(unittest.TestCase):
+    def test_candidate_entities(self):
+        text = ("The Eiffel Tower is in Paris. It was built by Gustave Eiffel for the 1889 World's Fair. "
+                "Paris attracts millions. However, the Final Answer is short.")
+        self.assertEqual(candidate_entities(text, limit=3), ["Paris", "Eiffel Tower", "Gustave Eiffel"])
+    def test_prefetches_entities_of_complete_sentences(self):
+        calls, warmed = [], []
+        async def prefetch(tool, args):
+            calls.append((tool, args["query"]))
+        async def run():
+            spec = Speculator("Writer", ["wikipedia_search", "summarize"], prefetch, warm=lambda: warmed.append(1),
+                              max_prefetch=2)
+            for token in ["Alan Turing worked at Bletchley", " Park. Later", " at Manchester", ". Alan Turing"]:
+                spec.feed(token)
+            await asyncio.sleep(0.05)
+            return spec
+        spec = asyncio.run(run())
+        self.assertEqual(calls, [("wikipedia_search", "Alan Turing"), ("wikipedia_search", "Bletchley Park")])
+        self.assertEqual(warmed, [1])
+        self.assertTrue(spec.resolve("Writer"))
+    def test_wrong_prediction_cancels_work(self):
+        async def prefetch(tool, args):
+            await asyncio.sleep(10)
+        async def run():
+            spec = Speculator("Writer", ["wikipedia_search"], prefetch)
+            spec.feed("Ada Lovelace wrote notes. ")
+            await asyncio.sleep(0)
+            self.assertEqual(spec.pending, 1)
+            self.assertFalse(spec.resolve("Reviewer"))
+            await asyncio.sleep(0)
+            return spec.pending
+        self.assertEqual(asyncio.run(run()), 0)
+    def test_results_committed_only_when_confirmed(self):
+        release = None
+        async def prefetch(tool, args):
+            if args["query"] == "Ada Lovelace":
+                return "fast"
+            await release.wait()
+            return "slow"
+        async def run(next_agent):
+            nonlocal release
+            release, committed = asyncio.Event(), []
+            spec = Speculator("Writer", ["wikipedia_search"], prefetch,
+                              commit=lambda tool, args, result: committed.append((args["query"], result)))
+            spec.feed("Ada Lovelace met Charles Babbage. ")
+            await asyncio.sleep(0.01)
+            kept = spec.resolve(next_agent)
+            self.assertEqual(committed, [("Ada Lovelace", "fast")] if kept else [])
+            with joining_prefetches(spec if kept else None):
+                pending = prefetched("wikipedia_search", {"query": "Charles Babbage"})
+            release.set()
+            joined = await pending if pending is not None else None
+            await asyncio.sleep(0)
+            return joined, committed
+        self.assertEqual(asyncio.run(run("Writer")), ("slow", [("Ada Lovelace", "fast"), ("Charles Babbage", "slow")]))
+        self.assertEqual(asyncio.run(run("Reviewer")), (None, []))
+    def test_no_prefetch_without_lookup_tools(self):
+        async def prefetch(tool, args):
+            raise AssertionError("should not be called")
+        async def run():
+            spec = Speculator("Reviewer", ["summarize"], prefetch)
+            spec.feed("Grace Hopper wrote compilers. ")
+            return spec.pending
+        self.assertEqual(asyncio.run(run()), 0)
+
+if __name__ == "__main__":
+    unittest.main()
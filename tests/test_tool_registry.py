@@ -0,0 +1,66 @@
+import sys
+import unittest
+from typing import List, Optional
+from agentic_core.tool import Tool, LazyTool, ToolRegistry, ToolArgumentError, schema_from_function
+
+def lookup(query: str, limit: int = 5, tags: Optional[List[str]] = None, _trace: str = None) -> str:
+    """Look something up.
+
+    Longer explanation that stays out of the schema.
+    """
+    return f"{query}:{limit}"
+
+class TestToolRegistry(unittest.TestCase):
+    def setUp(self):
+        self._saved = (dict(ToolRegistry._tools), set(ToolRegistry._discovered))
+        self.names = ["reg_lookup", "reg_echo"]
+        ToolRegistry.register(lookup, name="reg_lookup")
+        ToolRegistry.register_tool(Tool("reg_echo", "Echo text.", lambda text: text))
+    def tearDown(self):
+        ToolRegistry._tools, ToolRegistry._discovered = self._saved
+        ToolRegistry._payloads = {}
+    def test_schema_generated_from_signature(self):
+        schema = schema_from_function(lookup)
+        self.assertEqual(schema["description"], "Look something up.")
+        self.assertEqual(schema["parameters"], {
+            "type": "object",
+            "properties": {"query": {"type": "string"}, "limit": {"type": "integer", "default": 5},
+                           "tags": {"type": "array"}},
+            "required": ["query"]
+        })
+    def test_definitions_are_cached_per_toolset_until_registration(self):
+        first = ToolRegistry.definitions(self.names)
+        self.assertIs(first, ToolRegistry.definitions(self.names))
+        self.assertEqual([d["function"]["name"] for d in first], ["reg_lookup", "reg_echo"])
+        self.assertGreater(ToolRegistry.payload_chars(first), 0)
+        self.assertIn("- reg_echo: Echo text.", ToolRegistry.describe(self.names))
+        ToolRegistry.register_tool(Tool("reg_echo", "Echo it back.", lambda text: text))
+        self.assertIsNot(first, ToolRegistry.definitions(self.names))
+    def test_argument_validation(self):
+        self.assertEqual(ToolRegistry.parse_arguments("reg_lookup", '{"query": "x", "limit": "3"}'),
+                         {"query": "x", "limit": 3})
+        for name, raw in [("reg_lookup", '{"limit": 3}'), ("reg_lookup", '{"query": "x", "bogus": 1}'),
+                          ("reg_lookup", '{"query": "x", "limit": "many"}'), ("reg_lookup", "{not json"),
+                          ("reg_missing", "{}")]:
+            with self.subTest(raw=raw), self.assertRaises(ToolArgumentError):
+                ToolRegistry.parse_arguments(name, raw)
+    def test_lazy_tool_imports_on_first_call(self):
+        sys.modules.pop("tools.time_date", None)
+        tool = ToolRegistry.register_entry("reg_date", "tools.time_date:get_date", "Get the date.",
+                                           {"type": "object", "properties": {}, "required": []})
+        self.assertEqual(ToolRegistry.definitions(["reg_date"])[0]["function"]["name"], "reg_date")
+        self.assertNotIn("tools.time_date", sys.modules)
+        self.assertFalse(tool.loaded)
+        self.assertRegex(ToolRegistry.call_tool("reg_date"), r"^\d{4}-\d{2}-\d{2}$")
+        self.assertTrue(tool.loaded)
+    def test_discover_keeps_existing_registrations(self):
+        added = ToolRegistry.discover("tools", override=True)
+        self.assertIn("get_time", added)
+        self.assertIsInstance(ToolRegistry.get("get_time"), LazyTool)
+        ToolRegistry._discovered.discard("tools")
+        ToolRegistry.register_tool(Tool("get_time", "Fixed time.", lambda: "noon"))
+        self.assertNotIn("get_time", ToolRegistry.discover("tools"))
+        self.assertEqual(ToolRegistry.call_tool("get_time"), "noon")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from agentic_core import tracing
+from agentic_core.parallel import run_parallel
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.exporter = tracing.MemoryExporter()
+        self._saved = tracing.tracer.exporter
+        tracing.tracer.exporter = self.exporter
+    def tearDown(self):
+        tracing.tracer.exporter = self._saved
+    def test_spans_nest_across_threads_and_tasks(self):
+        @tracing.traced(tracing.AGENT, lambda name: f"agent {name}")
+        async def agent(name):
+            with tracing.span("llm", tracing.LLM) as s:
+                s.incr("attempts")
+            return name
+        with tracing.span("goal", tracing.PIPELINE, goal="g") as root:
+            run_parallel([lambda: asyncio.run(agent("a")), lambda: asyncio.run(agent("b"))])
+        spans = {s.name: s for s in self.exporter.spans}
+        self.assertEqual(set(spans), {"goal", "agent a", "agent b", "llm"})
+        self.assertEqual(spans["agent a"].parent_id, root.span_id)
+        self.assertTrue(all(s.trace_id == root.trace_id for s in self.exporter.spans))
+        self.assertEqual(spans["llm"].attributes["attempts"], 1)
+    def test_errors_and_usage_recorded(self):
+        response = SimpleNamespace(usage=SimpleNamespace(prompt_tokens=1000, completion_tokens=500))
+        with self.assertRaises(ValueError), tracing.span("llm", tracing.LLM) as s:
+            tracing.record_usage(s, response, "gpt-4o-mini-2024-07-18")
+            raise ValueError("boom")
+        span = self.exporter.spans[0]
+        self.assertEqual(span.status, "error")
+        self.assertAlmostEqual(span.attributes["cost_usd"], 0.00015 + 0.0003)
+    def test_disabled_tracer_is_a_no_op(self):
+        tracing.tracer.exporter = None
+        with tracing.span("x") as s:
+            s.set(a=1)
+            self.assertIs(tracing.current_span(), tracing.NOOP_SPAN)
+        self.assertEqual(self.exporter.spans, [])
+    def test_jsonl_and_otlp_export_and_summary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path, otlp_path = os.path.join(tmp, "t.jsonl"), os.path.join(tmp, "t.otlp")
+            for exporter in (tracing.JSONLExporter(path), tracing.OTLPJSONExporter(otlp_path)):
+                tracing.tracer.exporter = exporter
+                with tracing.span("goal", tracing.PIPELINE, goal="g"):
+                    with tracing.span("llm", tracing.LLM, cache_hit=True, prompt_tokens=10, completion_tokens=5):
+                        pass
+                    with tracing.span("tool", tracing.TOOL, source="call") as tool:
+                        tool.fail("[Tool error: x]")
+                exporter.close()
+            summary = tracing.summarize_traces(tracing.load_spans(path))[0]
+            with open(otlp_path) as f:
+                otlp = [json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][0] for line in f]
+        self.assertEqual((summary["llm_calls"], summary["tool_calls"], summary["errors"]), (1, 1, 1))
+        self.assertEqual(summary["prompt_tokens"] + summary["completion_tokens"], 15)
+        self.assertEqual(summary["llm_cache_hits"], 1)
+        self.assertEqual(otlp[-1]["name"], "goal")
+        self.assertEqual(otlp[0]["parentSpanId"], otlp[-1]["spanId"])
+        self.assertEqual(otlp[1]["status"]["code"], 2)
+    def test_busy_ms_counts_overlap_once(self):
+        spans = [{"start": 0.0, "end": 1.0}, {"start": 0.5, "end": 1.5}, {"start": 2.0, "end": 2.5}]
+        self.assertAlmostEqual(tracing.busy_ms(spans), 2000.0)
+
+if __name__ == "__main__":
+    unittest.main()
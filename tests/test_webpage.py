@@ -0,0 +1,74 @@
+import unittest
+from agentic_core.webpage import DocumentCache, PageExtractor, is_text_type, paginate, parse_content_type
+
+PAGE = ("<html><head><title>Café &amp; Co</title><style>body {color: red}</style>"
+        "<script>var x = '<p>not text</p>';</script></head><body><nav><a href='/'>Home</a> | <a>About</a></nav>"
+        "<main><h1>Opening hours</h1><p>We are open   daily.</p><p>" + "Fresh bread. " * 30 + "</p></main>"
+        "<footer>© 2024</footer></body></html>")
+
+def extract(data: bytes, content_type="text/html; charset=utf-8", chunk=7, **kwargs):
+    extractor = PageExtractor(content_type, **kwargs)
+    for i in range(0, len(data), chunk):
+        if extractor.feed(data[i:i + chunk]):
+            break
+    return extractor.text(), extractor
+
+class TestPageExtractor(unittest.TestCase):
+    def test_main_text_from_chunked_html(self):
+        text, extractor = extract(PAGE.encode(), max_chars=10_000)
+        self.assertTrue(text.startswith("Café & Co\n\nOpening hours\nWe are open daily.\nFresh bread."))
+        for dropped in ("color", "not text", "Home", "©"):
+            self.assertNotIn(dropped, text)
+        self.assertFalse(extractor.truncated)
+    def test_charset_from_meta_and_split_multibyte_chars(self):
+        html = "<meta charset='iso-8859-1'><p>Müller läuft</p>".encode("latin-1")
+        self.assertEqual(extract(html, content_type="text/html")[0], "Müller läuft")
+        self.assertEqual(extract("naïve ☕ text".encode(), content_type="text/plain", chunk=1)[0], "naïve ☕ text")
+    def test_stops_at_char_and_byte_budgets(self):
+        body = ("<p>" + "word " * 200 + "</p>") * 100
+        text, extractor = extract(body.encode(), chunk=1024, max_chars=500)
+        self.assertTrue(extractor.truncated)
+        self.assertLess(extractor.bytes_read, 3 * 1024)
+        self.assertGreaterEqual(len(text), 400)
+        _, extractor = extract(b"x" * 10_000, content_type="text/plain", chunk=1000, max_chars=10**6, max_bytes=2500)
+        self.assertEqual((extractor.bytes_read, extractor.truncated), (2500, True))
+    def test_budget_counts_extracted_text_and_drops_cut_tags(self):
+        body = "".join(f"<div class='row'>\n      <span>item {i}</span>\n      </div>\n" for i in range(3000)).encode()
+        for budget in (2001, 4001, 6001):
+            text, extractor = extract(body, chunk=16384, max_chars=budget)
+            self.assertTrue(extractor.truncated)
+            self.assertGreaterEqual(len(text), budget)
+            self.assertNotIn("<", text)
+        text, _ = extract(b"<p>" + b"word " * 10 + b"</p><p>more</p><span class='x'", chunk=1000, max_chars=20)
+        self.assertEqual(text, "word word word word word word word word word word\nmore")
+    def test_content_types(self):
+        self.assertEqual(parse_content_type('text/HTML; Charset="UTF-8"'), ("text/html", "UTF-8"))
+        self.assertTrue(is_text_type("application/json") and is_text_type("application/rss+xml"))
+        self.assertFalse(is_text_type("image/png") or is_text_type("application/pdf"))
+
+class TestPagination(unittest.TestCase):
+    def test_paginate(self):
+        text = "a" * 25
+        self.assertEqual(paginate(text, 1, 10, True), "a" * 10 + "\n\n[Page 1 of 3; call url_reader with page=2 for more.]")
+        self.assertEqual(paginate(text, 3, 10, True), "a" * 5)
+        self.assertIn("of 3+", paginate(text, 3, 10, False))
+        self.assertTrue(paginate(text, 4, 10, True).startswith("[No page 4"))
+    def test_pages_past_two_on_whitespace_heavy_html(self):
+        body = ("<html><body>" + "".join(f"<div>\n        <p>Entry {i}</p>\n        </div>\n" for i in range(3000))
+                + "</body></html>").encode()
+        for page in (2, 3, 4):
+            text, extractor = extract(body, chunk=16384, max_chars=page * 2000 + 1)
+            result = paginate(text, page, 2000, not extractor.truncated)
+            self.assertFalse(result.startswith("[No page"), result)
+            self.assertIn(f"page={page + 1} for more", result)
+    def test_document_cache(self):
+        cache = DocumentCache(max_entries=1)
+        cache.put("u", "x" * 100, False)
+        self.assertIsNotNone(cache.get("u", 50))
+        self.assertIsNone(cache.get("u", 150))
+        cache.put("v", "y", True)
+        self.assertIsNone(cache.get("u", 1))
+        self.assertEqual(cache.get("v", 1000), ("y", True))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import threading
+import unittest
+from agentic_core.workspace import ShardedWorkspace
+
+class TestShardedWorkspace(unittest.TestCase):
+    def test_get_set_and_versions(self):
+        ws = ShardedWorkspace(shards=4)
+        self.assertEqual(ws.get_versioned("a"), (None, 0))
+        self.assertEqual(ws.set("a", 1), 1)
+        self.assertEqual(ws.set("a", 2), 2)
+        self.assertEqual(ws.get_versioned("a"), (2, 2))
+        self.assertTrue(ws.delete("a"))
+        self.assertEqual(ws.get("a", "gone"), "gone")
+        self.assertEqual(ws.version("a"), 3)
+    def test_compare_and_set(self):
+        ws = ShardedWorkspace()
+        self.assertTrue(ws.compare_and_set("k", 0, "first"))
+        self.assertFalse(ws.compare_and_set("k", 0, "stale"))
+        _, version = ws.get_versioned("k")
+        self.assertTrue(ws.compare_and_set("k", version, "second"))
+        self.assertEqual(ws.get("k"), "second")
+    def test_concurrent_appends_and_updates_are_atomic(self):
+        ws = ShardedWorkspace(shards=8)
+        def work(n):
+            for i in range(500):
+                ws.append(f"list{i % 3}", (n, i))
+                ws.update("count", lambda c: c + 1, 0)
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(ws.get("count"), 4000)
+        self.assertEqual(sum(len(ws.get(f"list{j}")) for j in range(3)), 4000)
+    def test_snapshot_is_copy_on_write(self):
+        ws = ShardedWorkspace(shards=2)
+        ws.set("x", 1)
+        ws.append("log", "a")
+        snap = ws.snapshot()
+        ws.set("x", 2)
+        ws.append("log", "b")
+        ws.set("y", 3)
+        self.assertEqual(dict(snap), {"x": 1, "log": ["a"]})
+        self.assertEqual(ws.all(), {"x": 2, "log": ["a", "b"], "y": 3})
+        with self.assertRaises(TypeError):
+            snap["x"] = 5
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1 +1,51 @@
 # Tools package
+#
+# TOOLS is entry-point style metadata ("module:function" plus the schema the
+# model sees), read by ToolRegistry.discover() so tools can be listed and
+# offered to a model without importing their modules; each module is imported
+# on the tool's first call. Third-party packages can add tools the same way via
+# the "agentic_tools" entry-point group. The network and LLM-backed tools live in
+# agentic_framework (HTTP pools, Serper/Wikipedia clients), so their entries
+# point there. "cacheable" matches agentic_framework.TOOL_CACHE_TTLS.
+
+def _text(description):
+    return {"type": "object", "properties": {"text": {"type": "string", "description": description}},
+            "required": ["text"]}
+
+def _query(description):
+    return {"type": "object", "properties": {"query": {"type": "string", "description": description}},
+            "required": ["query"]}
+
+_NO_ARGS = {"type": "object", "properties": {}, "required": []}
+
+def _framework(name):
+    return {"entry": f"agentic_framework:{name}", "async_entry": f"agentic_framework:async_{name}", "cacheable": True}
+
+TOOLS = {
+    "web_search": {**_framework("web_search"), "description": "Search the web for information.",
+                   "parameters": _query("Search query")},
+    "calculator": {"entry": "tools.calculator:calculator",
+                   "description": "Evaluate a math expression (or several separated by ';').",
+                   "parameters": {"type": "object", "properties": {"expression": {"type": "string"}},
+                                  "required": ["expression"]}},
+    "summarize": {**_framework("summarize"), "description": "Summarize a block of text.",
+                  "parameters": _text("Text to summarize")},
+    "get_time": {"entry": "tools.time_date:get_time", "description": "Get the current time.", "parameters": _NO_ARGS},
+    "get_date": {"entry": "tools.time_date:get_date", "description": "Get the current date.", "parameters": _NO_ARGS},
+    "extract_entities": {"entry": "tools.entity_extraction:extract_entities", "cacheable": True,
+                         "description": "Extract named entities from text.", "parameters": _text("Input text")},
+    "translate": {**_framework("translate"), "description": "Translate text to a target language.",
+                  "parameters": {"type": "object", "properties": {"text": {"type": "string"},
+                                                                  "target_language": {"type": "string"}},
+                                 "required": ["text", "target_language"]}},
+    "wikipedia_search": {**_framework("wikipedia_search"), "description": "Search Wikipedia for a summary.",
+                         "parameters": _query("Topic to look up")},
+    "code_executor": {"entry": "tools.code_executor:code_executor", "description": "Execute a Python code snippet.",
+                      "parameters": {"type": "object", "properties": {"code": {"type": "string"}}, "required": ["code"]}},
+    "sentiment_analysis": {"entry": "tools.sentiment:sentiment_analysis", "cacheable": True,
+                           "description": "Analyze sentiment of text.", "parameters": _text("Input text")},
+    "url_reader": {**_framework("url_reader"),
+                   "description": "Read the main text of a web page; pass page=2, 3... to read on.",
+                   "parameters": {"type": "object", "properties": {"url": {"type": "string"}, "page": {"type": "integer"}},
+                                  "required": ["url"]}},
+}
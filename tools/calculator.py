@@ -1,9 +1,7 @@
 """
 Calculator tool
 """
+from agentic_core.arithmetic import calculate
+
 def calculator(expression: str) -> str:
-    try:
-        result = eval(expression, {"__builtins__": {}})
-        return str(result)
-    except Exception as e:
-        return f"[Calculator error: {e}]"
+    return calculate(expression)
@@ -1,10 +1,8 @@
 """
 Code execution tool
 """
+from agentic_core.sandbox import run_code
+
 def code_executor(code: str) -> str:
-    try:
-        exec_globals = {}
-        exec(code, exec_globals)
-        return str(exec_globals)
-    except Exception as e:
-        return f"[Code execution error: {e}]"
+    # Runs in a sandboxed worker process with CPU, memory and output limits
+    return run_code(code)
@@ -1,6 +1,111 @@
 """
-Sentiment analysis tool
+Sentiment analysis tool: local lexicon scoring with a confidence estimate
 """
+import math
+import re
+from typing import Tuple
+
+# Word -> valence; inflected forms (loved, loving, failures...) fall back to their stem
+_POSITIVE = {
+    "good": 1.9, "great": 3.1, "excellent": 3.2, "amazing": 2.8, "awesome": 3.1, "fantastic": 2.6, "wonderful": 2.7,
+    "outstanding": 3.0, "superb": 3.0, "brilliant": 2.8, "perfect": 2.7, "love": 3.2, "like": 1.5, "enjoy": 2.2,
+    "happy": 2.7, "glad": 2.0, "pleased": 1.9, "delight": 2.9, "delightful": 2.9, "nice": 1.8, "pleasant": 2.3,
+    "positive": 2.3, "success": 2.7, "successful": 2.7, "win": 2.8, "benefit": 1.7, "beneficial": 1.9,
+    "improve": 1.9, "improvement": 1.9, "impressive": 2.3, "recommend": 1.5, "best": 3.2, "better": 1.9,
+    "easy": 1.9, "fast": 1.2, "reliable": 1.9, "helpful": 1.8, "useful": 1.9, "valuable": 2.1, "effective": 2.1,
+    "efficient": 1.8, "strong": 1.5, "robust": 1.6, "innovative": 1.9, "beautiful": 2.9, "elegant": 2.1,
+    "favorite": 2.0, "favourite": 2.0, "thank": 1.5, "thanks": 1.9, "grateful": 2.0, "exciting": 2.2,
+    "excited": 2.2, "satisfied": 1.9, "satisfying": 2.0, "comfortable": 1.5, "fun": 2.3, "cool": 1.3,
+    "remarkable": 2.0, "promising": 1.6, "safe": 1.6, "secure": 1.4, "gain": 1.5, "growth": 1.3, "profit": 1.6,
+    "thrive": 2.1, "celebrate": 2.7, "praise": 2.6, "optimistic": 2.1, "confident": 2.2, "smooth": 1.2,
+    "accurate": 1.6, "clear": 1.0, "solid": 1.4, "fine": 0.8, "ok": 0.9, "okay": 0.9, "hope": 1.9, "welcome": 2.0,
+}
+_NEGATIVE = {
+    "bad": -2.5, "terrible": -3.1, "awful": -3.1, "horrible": -3.3, "poor": -2.1, "worst": -3.1, "worse": -2.1,
+    "hate": -2.7, "dislike": -1.6, "sad": -2.1, "angry": -2.3, "upset": -1.6, "annoying": -1.7, "annoyed": -1.6,
+    "disappointing": -2.2, "disappointed": -1.9, "disappoint": -2.0, "fail": -2.5, "failure": -2.6,
+    "broken": -1.8, "bug": -1.2, "buggy": -1.8, "crash": -1.9, "error": -1.4, "problem": -1.7, "issue": -1.0,
+    "slow": -1.2, "difficult": -1.5, "hard": -0.8, "confusing": -1.3, "confused": -1.3, "useless": -2.3,
+    "waste": -1.8, "expensive": -1.0, "overpriced": -1.8, "ugly": -2.3, "boring": -1.3, "dangerous": -2.1,
+    "risk": -1.1, "risky": -1.4, "unsafe": -1.9, "weak": -1.9, "loss": -1.3, "lose": -1.7, "decline": -1.1,
+    "crisis": -3.1, "damage": -2.2, "harm": -2.5, "harmful": -2.6, "negative": -2.7, "wrong": -2.1,
+    "unfortunately": -1.6, "sorry": -0.6, "worry": -1.9, "worried": -1.2, "fear": -2.2, "afraid": -2.0,
+    "scary": -2.2, "pain": -2.3, "painful": -2.4, "complain": -1.5, "complaint": -1.2, "frustrating": -1.9,
+    "frustrated": -2.4, "unreliable": -1.9, "inaccurate": -1.6, "flawed": -1.7, "mess": -1.5, "disaster": -3.1,
+    "catastrophic": -3.2, "toxic": -2.3, "lack": -1.2, "lacking": -1.4, "miss": -1.0, "missing": -1.2,
+    "delay": -1.2, "delayed": -1.2, "unhappy": -2.4, "dissatisfied": -1.6, "reject": -1.7, "rejected": -1.9,
+    "concern": -0.8, "concerns": -0.8, "threat": -2.4, "scam": -2.6, "fraud": -2.8, "cheap": -0.4, "lag": -1.0,
+}
+LEXICON = {**_POSITIVE, **_NEGATIVE}
+_NEGATIONS = {"not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "without", "hardly", "barely",
+              "isn't", "aren't", "wasn't", "weren't", "don't", "doesn't", "didn't", "can't", "cannot", "couldn't",
+              "won't", "wouldn't", "shouldn't", "isnt", "arent", "wasnt", "dont", "doesnt", "didnt", "cant", "wont"}
+_BOOSTERS = {"very": 0.3, "really": 0.3, "extremely": 0.5, "incredibly": 0.5, "absolutely": 0.4, "so": 0.2,
+             "highly": 0.3, "totally": 0.3, "truly": 0.3, "quite": 0.1, "slightly": -0.3, "somewhat": -0.3,
+             "barely": -0.4, "kinda": -0.3, "marginally": -0.3}
+_CONTRAST = {"but", "however", "although", "though", "yet"}
+_SUFFIXES = ("ing", "ed", "es", "s", "ly")
+_TOKEN = re.compile(r"[a-z]+(?:'[a-z]+)?|[!?]|:\)|:\(|:-\)|:-\(")
+_EMOTICONS = {":)": 1.5, ":-)": 1.5, ":(": -1.5, ":-(": -1.5}
+
+def _valence(token: str) -> float:
+    if token in LEXICON:
+        return LEXICON[token]
+    if token in _EMOTICONS:
+        return _EMOTICONS[token]
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) > len(suffix) + 2:
+            stem = token[:-len(suffix)]
+            value = LEXICON.get(stem, LEXICON.get(stem + "e"))
+            if value is not None:
+                return value
+    return 0.0
+
+def analyze(text: str) -> Tuple[str, float, float]:
+    """(label, confidence, compound score in [-1, 1]) for `text`.
+
+    Lexicon valences are adjusted for a preceding negation (within three
+    words), intensifiers and exclamation marks; after a contrast word
+    ("but", "however") the rest of the text counts more. Confidence is high
+    when the opinion words agree and low when they conflict or are sparse,
+    or when no lexicon word occurs at all.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    positive = negative = 0.0
+    weight, hits, negated = 1.0, 0, False
+    for i, token in enumerate(tokens):
+        if token in _CONTRAST:
+            positive, negative, weight = positive * 0.5, negative * 0.5, 1.5
+            continue
+        value = _valence(token)
+        if not value:
+            continue
+        hits += 1
+        previous = tokens[max(0, i - 3):i]
+        value *= 1 + sum(_BOOSTERS.get(t, 0.0) for t in previous[-1:])
+        if any(t in _NEGATIONS for t in previous):
+            value *= -0.74
+            negated = True
+        if value > 0:
+            positive += value * weight
+        else:
+            negative -= value * weight
+    if not hits:
+        # No lexicon word: the text may be factual or use words the lexicon lacks ("furious", "plummeted")
+        return "Neutral", 0.5, 0.0
+    score = positive - negative
+    score += math.copysign(min(tokens.count("!"), 4) * 0.3, score) if score else 0.0
+    compound = score / math.sqrt(score * score + 15)
+    agreement = abs(positive - negative) / (positive + negative)
+    if compound >= 0.05:
+        label = "Positive"
+    elif compound <= -0.05:
+        label = "Negative"
+    else:
+        return "Neutral", 0.4, compound  # opinions that cancel out: mixed, let the model decide
+    confidence = 0.5 + 0.5 * agreement ** 2 * min(1.0, abs(compound) / 0.6)
+    # "not bad" is weaker evidence than "good"
+    return label, min(confidence, 0.75) if negated else confidence, compound
+
 def sentiment_analysis(text: str) -> str:
-    # Placeholder: use sentiment API
-    return f"[Sentiment of: {text}]"
+    return analyze(text)[0]
@@ -1,6 +0,0 @@
-"""
-Summarization tool
-"""
-def summarize(text: str) -> str:
-    # Placeholder: use LLM or summarization API
-    return f"[Summary of: {text}]"
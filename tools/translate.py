@@ -1,6 +0,0 @@
-"""
-Translation tool
-"""
-def translate(text: str, target_language: str) -> str:
-    # Placeholder: use translation API
-    return f"[Translated to {target_language}: {text}]"
@@ -1,6 +0,0 @@
-"""
-URL content reader tool
-"""
-def url_reader(url: str) -> str:
-    # Placeholder: fetch and return URL content
-    return f"[Content of: {url}]"
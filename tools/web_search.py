@@ -1,6 +0,0 @@
-"""
-Web search tool
-"""
-def web_search(query: str) -> str:
-    # Placeholder: integrate with real web search API
-    return f"[Web search results for '{query}']"
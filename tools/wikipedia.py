@@ -1,6 +0,0 @@
-"""
-Wikipedia search tool
-"""
-def wikipedia_search(query: str) -> str:
-    # Placeholder: integrate with Wikipedia API
-    return f"[Wikipedia summary for '{query}']"
@@ -36,7 +36,7 @@ st.markdown("## 📝 Run a Multi-Agent Pipeline")
 user_goal = st.text_area("Enter your multi-agent goal:", value="Write a blog post about the latest AI breakthrough, then review it for sentiment and summarize the review.")
 
 if st.button("Run Multi-Agent Pipeline"):
-    with st.spinner("Agents collaborating and reasoning..."):
+    with st.status("Agents collaborating and reasoning...", expanded=True) as status:
         # Setup agents & memory
         memory = Memory()
         agents = [Agent(**cfg) for cfg in agent_configs]
@@ -49,17 +49,20 @@ if st.button("Run Multi-Agent Pipeline"):
             agent = next(a for a in agents if a.name == current_agent)
             answer, agent_steps = agent.act(input_msg)
             steps.extend(agent_steps)
+            # Show each agent's output as soon as it finishes instead of at the end
+            st.markdown(f"**{agent.name}:** {answer}")
             idx = [a.name for a in agents].index(current_agent)
             if idx + 1 >= len(agents):
                 break
             current_agent = agents[idx + 1].name
+            st.write(f"➡️ Handing off to **{current_agent}**")
             input_msg = answer
-        st.success("Pipeline completed!")
-        st.markdown("### Reasoning Steps:")
-        for step in steps:
-            st.markdown(step)
-        st.markdown("### Final Output:")
-        st.markdown(answer)
+        status.update(label="Pipeline completed!", state="complete", expanded=False)
+    st.markdown("### Reasoning Steps:")
+    for step in steps:
+        st.markdown(step)
+    st.markdown("### Final Output:")
+    st.markdown(answer)
 
 st.markdown("---")
 st.markdown("""